@@ -66,6 +66,24 @@ reChordSymbol = re.compile('"[^"]*"') # non greedy
 
 reChord = re.compile('[.*?]') # non greedy
 
+# master token expression used by ABCHandler.tokenize(); alternatives are 
+# given in order of precedence, and each named group defines a token type. 
+# characters that do not match any alternative are skipped
+reToken = re.compile(r'''
+    (?P<comment>%[^\n]*\n?)
+    # capital alpha or w, followed by a colon and anything but a pipe
+    |(?P<metadata>[A-Zw]:(?=[^|])[^\n]*\n?)
+    |(?P<bar>\|\]|\|\||\[\||\[1|\[2|:\||\|:|::|\||:)
+    |(?P<tuplet>\(\d)
+    # broken rhythm markers may not include the last character of source
+    |(?P<brokenRhythm>[<>](?:[<>](?=.))*)
+    |(?P<chordSymbol>"[^"]*"?)
+    |(?P<chord>\[[^\]]*\]?)
+    # ornaments, accidentals, and digits may precede a single pitch alpha
+    |(?P<note>[~^=_.uvHLTS][~^=_.uvHLTS\d,/']*(?:[^\W\d_][\d,/']*)?
+        |[^\W\d_][\d,/']*)
+    ''', re.VERBOSE | re.UNICODE | re.DOTALL)
+
 
 
 #-------------------------------------------------------------------------------
@@ -1221,6 +1239,49 @@ class ABCHandler(object):
 
         This may be called separately from process(), in the case 
         that pre/post parse processing is not needed. 
+
+        Tokens are found by matching a single compiled regular expression, `reToken`, at each position of the source.
+
+        >>> from music21 import *
+        >>> ah = abc.ABCHandler()
+        >>> ah.tokenize('X:1\\nM:6/8\\nL:1/8\\n"G"d2B (3cBA|[ceg]>f ^G,2 :|')
+        >>> ah._tokens
+        [<ABCMetadata 'X:1'>, <ABCMetadata 'M:6/8'>, <ABCMetadata 'L:1/8'>, <ABCNote '"G"d2'>, <ABCNote 'B'>, <ABCTuplet '(3'>, <ABCNote 'c'>, <ABCNote 'B'>, <ABCNote 'A'>, <ABCBar '|'>, <ABCChord '[ceg]'>, <ABCBrokenRhythmMarker '>'>, <ABCNote 'f'>, <ABCNote '^G,2'>, <ABCBar ':|'>]
+        '''
+        activeChordSymbol = '' # accumulate, then prepend
+        tokens = self._tokens
+        for m in reToken.finditer(strSrc):
+            group = m.lastgroup
+            if group == 'note':
+                if activeChordSymbol != '':
+                    tokens.append(ABCNote(activeChordSymbol + m.group()))
+                    activeChordSymbol = '' # reset
+                else:
+                    tokens.append(ABCNote(m.group()))
+            elif group == 'bar':
+                tokens.append(ABCBar(m.group()))
+            elif group == 'metadata':
+                tokens.append(ABCMetadata(m.group().strip()))
+            elif group == 'chordSymbol':
+                # there may be more than one chord symbol: need to accumulate
+                activeChordSymbol += m.group()
+            elif group == 'chord':
+                if activeChordSymbol != '':
+                    tokens.append(ABCChord(activeChordSymbol + m.group()))
+                    activeChordSymbol = '' # reset
+                else:
+                    tokens.append(ABCChord(m.group()))
+            elif group == 'tuplet':
+                tokens.append(ABCTuplet(m.group()))
+            elif group == 'brokenRhythm':
+                tokens.append(ABCBrokenRhythmMarker(m.group()))
+            # comments are matched only to be skipped
+
+
+    def _tokenizeLinear(self, strSrc):
+        '''Walk the abc string character by character, creating ABC objects along the way.
+
+        This is the original tokenizer, retained for comparison with :meth:`~music21.abc.base.ABCHandler.tokenize` in tests and performance measurements. 
         '''
         i = 0
         collect = []
@@ -2014,6 +2075,27 @@ class Test(unittest.TestCase):
 
             self.assertEqual(countNotes, noteTokens)
             self.assertEqual(countChords, chrodTokens)
+
+    def testTokenizeLinear(self):
+        from music21.abc import testFiles
+        # the regular expression tokenizer must match the character scanner
+        for tf in [testFiles.fyrareprisarn, testFiles.mysteryReel, 
+            testFiles.aleIsDear, testFiles.testPrimitive, 
+            testFiles.kitchGirl, testFiles.williamAndNancy, 
+            testFiles.morrisonsJig, testFiles.hectorTheHero, 
+            testFiles.kingOfTheFairies, testFiles.sicutRosa, 
+            testFiles.theBeggerBoy, testFiles.valentineJigg, 
+            testFiles.testPrimitivePolyphonic, 
+            testFiles.testPrimitiveTuplet]:
+
+            ahRe = ABCHandler()
+            ahRe.tokenize(tf)
+            ahLinear = ABCHandler()
+            ahLinear._tokenizeLinear(tf)
+            self.assertEqual(len(ahRe._tokens), len(ahLinear._tokens))
+            for tRe, tLinear in zip(ahRe._tokens, ahLinear._tokens):
+                self.assertEqual(tRe.__class__, tLinear.__class__)
+                self.assertEqual(tRe.src, tLinear.src)
         
 
     def testRe(self):
@@ -260,10 +260,29 @@ def abcToStreamScore(abcHandler, inputM21=None):
 
 
 
-def abcToStreamOpus(abcHandler, inputM21=None, number=None):
+def _abcToStreamScorePickled(abcHandler):
+    '''Translate a single work and prepare the resulting Score for pickling. This is used as the function called in each worker process by :func:`~music21.abc.translate.abcToStreamOpus`.
+    '''
+    s = abcToStreamScore(abcHandler)
+    s.setupPickleScaffold()
+    return s
+
+
+def abcToStreamOpus(abcHandler, inputM21=None, number=None, parallel=False, 
+    chunkSize=1):
     '''Convert a multi-work stream into one or more complete works packed into a an Opus Stream. 
 
     If a `number` argument is given, and a work is defined by that number, that work is returned. 
+
+    If `parallel` is True, each work is translated in a pool of worker processes; the resulting Scores are added to the Opus in reference number order. Works are given to each worker in groups of `chunkSize`. `parallel` may also be an integer number of worker processes; if True, one process per CPU is used. 
+
+    >>> from music21 import *
+    >>> abcStr = 'X:5\\nM:6/8\\nL:1/8\\nK:G\\nB3 A3 | G6 | B3 A3 | G6 ||\\nX:6\\nM:6/8\\nL:1/8\\nK:G\\nB3 A3 | G6 | B3 A3 | G6 ||'
+    >>> ah = abc.ABCHandler()
+    >>> junk = ah.process(abcStr)
+    >>> o = abc.translate.abcToStreamOpus(ah, parallel=2)
+    >>> [s.metadata.number for s in o.scores]
+    ['5', '6']
     '''
     from music21 import stream
 
@@ -282,6 +301,23 @@ def abcToStreamOpus(abcHandler, inputM21=None, number=None):
             s = stream.Score() # return a Stream
             # get number from dictionary; set to new score
             abcToStreamScore(abcDict[number], inputM21=s)
+        elif parallel not in [False, None, 0]: 
+            import multiprocessing
+            if parallel is True:
+                processes = None # will use cpu count
+            else:
+                processes = parallel
+            handlers = [abcDict[key] for key in sorted(abcDict.keys())]
+            pool = multiprocessing.Pool(processes)
+            try:
+                # imap returns results in the order of the source
+                for score in pool.imap(_abcToStreamScorePickled, handlers, 
+                    chunkSize):
+                    score.teardownPickleScaffold()
+                    s.append(score)
+            finally:
+                pool.close()
+                pool.join()
         else: # build entire opus into an opus stream
             for key in sorted(abcDict.keys()):
                 # do not need to set work number, as that will be gathered
@@ -471,6 +507,28 @@ class Test(unittest.TestCase):
         #op.scores[3].show()
         self.assertEqual(len(op), 8)
 
+    def testOpusImportParallel(self):
+        from music21 import corpus
+        from music21 import abc
+
+        fp = corpus.getWork('teste')
+        af = abc.ABCFile()
+        af.open(fp) # return handler, processes tokens
+        ah = af.read()
+        af.close() 
+
+        op = abcToStreamOpus(ah)
+        opParallel = abcToStreamOpus(ah, parallel=2, chunkSize=3)
+        self.assertEqual(len(opParallel), 8)
+        # scores must be in the same order, with the same content
+        self.assertEqual([s.metadata.number for s in opParallel.scores],
+                         [s.metadata.number for s in op.scores])
+        self.assertEqual([len(s.flat.notes) for s in opParallel.scores],
+                         [len(s.flat.notes) for s in op.scores])
+        self.assertEqual(
+            [n.nameWithOctave for n in opParallel.scores[5].flat.notes],
+            [n.nameWithOctave for n in op.scores[5].flat.notes])
+
     def testLyrics(self):
         # TODO
 
@@ -1,6 +1,6 @@
-__ALL__ = ['correlate', 'windowed', 'metrical', 'discrete']
+__ALL__ = ['correlate', 'windowed', 'metrical', 'discrete', 'pipeline']
 
 # this is necessary to get these names available with a 
 # from music21 import * import statement
-from music21.analysis import correlate, windowed, metrical, discrete
+from music21.analysis import correlate, windowed, metrical, discrete, pipeline
 
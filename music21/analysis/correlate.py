@@ -16,6 +16,7 @@ See the chapter :ref:`overviewFormats` for more information and examples of conv
 
 import unittest, doctest, random
 import sys
+import bisect
 
 import music21
 from music21 import common
@@ -42,7 +43,7 @@ class CorrelateException(Exception):
 
 #-------------------------------------------------------------------------------
 class ActivityMatch(object):
-    '''Given a Stream, find if one object is active while another is also active.
+    '''Given a Stream, or a list of Streams, find if one object is active while another is also active.
 
     Plotting routines to graph the output of dedicated methods in this class are available. 
 
@@ -54,17 +55,75 @@ class ActivityMatch(object):
     '''
 
     def __init__(self, streamObj):
-        if not isinstance(streamObj, music21.stream.Stream):
+        # a list of Streams, such as the works of a corpus, can be provided;
+        # matches are found within each Stream and pooled
+        if isinstance(streamObj, music21.stream.Stream):
+            streamList = [streamObj]
+        elif common.isListLike(streamObj):
+            streamList = list(streamObj)
+        else:
+            streamList = []
+        if len(streamList) == 0:
             raise CorrelateException, 'non-stream provided as argument'
+        for s in streamList:
+            if not isinstance(s, music21.stream.Stream):
+                raise CorrelateException, 'non-stream provided as argument'
         self.streamObj = streamObj
+        self._streamList = streamList
+        self._flatStreams = None
         self.data = None
 
 
+    def _getFlatStreams(self):
+        '''Return a sorted, flat representation of each Stream, created once.
+        '''
+        if self._flatStreams is None:
+            self._flatStreams = [s.flat.sorted for s in self._streamList]
+        return self._flatStreams
+
+
+    def _findActiveInStream(self, streamFlat, objNameSrc, objNameDst):
+        '''Find the correlations of src with dst in a single sorted, flat Stream. 
+
+        Each dst object is active from its offset until the offset of the next dst object; the last is active until the end of the Stream. Rather than testing every src object against every dst object, src offsets are sorted once and the src objects that start within each dst span are found by bisection. 
+        '''
+        srcElements = streamFlat.getElementsByClass(objNameSrc)
+        dstElements = streamFlat.getElementsByClass(objNameDst)
+
+        post = []
+        for element in srcElements:
+            post.append({'src':element, 'dst':[]})
+        if len(post) == 0 or len(dstElements) == 0:
+            return post
+
+        srcOffsets = [e.getOffsetBySite(streamFlat) for e in srcElements]
+        srcOrder = range(len(srcOffsets))
+        srcOrder.sort(key=srcOffsets.__getitem__)
+        srcOffsetsSorted = [srcOffsets[i] for i in srcOrder]
+
+        dstOffsets = [e.getOffsetBySite(streamFlat) for e in dstElements]
+        qLenTotal = streamFlat.duration.quarterLength
+        for i, element in enumerate(dstElements):
+            dstStart = dstOffsets[i]
+            if i < len(dstElements) - 1:
+                dstEnd = dstOffsets[i+1]
+            else:
+                dstEnd = qLenTotal
+            # boundaries are inclusive: a src object starting at the 
+            # offset of the next dst object matches both
+            lo = bisect.bisect_left(srcOffsetsSorted, dstStart)
+            hi = bisect.bisect_right(srcOffsetsSorted, dstEnd)
+            for j in srcOrder[lo:hi]:
+                post[j]['dst'].append(element)
+        return post
+
+
     def _findActive(self, objNameSrc=None, objNameDst=None):
         '''Do the analysis, finding correlations of src with dst
         returns an ordered list of dictionaries, in the form
         {'src': obj, 'dst': [objs]}
 
+        The durations of dst objects are not altered.
         '''        
         if objNameSrc == None:
             objNameSrc = note.Note
@@ -72,66 +131,38 @@ class ActivityMatch(object):
             objNameDst = dynamics.Dynamic
 
         post = []
-        streamFlat = self.streamObj.flat
-
-        streamFlat = streamFlat.extendDuration(objNameDst)
-
-        # get each src object; create a dictionary for each
-        for element in streamFlat.getElementsByClass(objNameSrc):
-            post.append({'src':element, 'dst':[]})
-
-        # get each dst object, and find its start and end time
-        # then, go through each source object, and see if this
-        # dst object is within the source objects boundaries
-        # if so, append it to the source object's dictionary
-        for element in streamFlat.getElementsByClass(objNameDst):
-            #print _MOD, 'dst', element
-            dstStart = element.offset
-            dstEnd = dstStart + element.duration.quarterLength
-
-            for entry in post:
-                # here, we are only looking if start times match
-                if (entry['src'].offset >= dstStart and 
-                    entry['src'].offset <= dstEnd):
-                    # this is match; add a reference to the element
-                    entry['dst'].append(element)            
-                
+        for streamFlat in self._getFlatStreams():
+            post += self._findActiveInStream(streamFlat, objNameSrc, 
+                                             objNameDst)
         self.data = post
         return self.data
 
 
-    def pitchToDynamic(self, dataPoints=True):
-        '''Create an analysis of pitch to dynamic symbol.
+    def correlate(self, objNameSrc, objNameDst, fx, fy, dataPoints=True):
+        '''Create an analysis of any source class to any destination class. The function `fx` is called on each source object, and `fy` on each destination object active when that source object starts. 
 
         If `dataPoints` is True, all data matches between source and destination are returned. If false, 3 point weighted coordinates are created for each unique match. 
 
         >>> from music21 import *
-        >>> s = corpus.parseWork('bach/bwv8.6.xml')
-        >>> am = analysis.correlate.ActivityMatch(s[0].flat.sorted)
-        >>> am.pitchToDynamic()
-        Traceback (most recent call last):
-        CorrelateException: cannot create correlation an object that is not found in the Stream: <class 'music21.dynamics.Dynamic'>
-
-        >>> s = corpus.parseWork('schumann/opus41no1', 2)
-        >>> am = analysis.correlate.ActivityMatch(s[0].flat.sorted)
-        >>> data = am.pitchToDynamic()
-        >>> len(data)
-        401
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('c4'), 4)
+        >>> s.insert(0, dynamics.Dynamic('p'))
+        >>> s.insert(2, dynamics.Dynamic('f'))
+        >>> am = analysis.correlate.ActivityMatch(s)
+        >>> am.correlate(note.Note, dynamics.Dynamic, lambda n: n.offset, lambda d: d.value)
+        [[0.0, 'p'], [1.0, 'p'], [2.0, 'p'], [2.0, 'f'], [3.0, 'f']]
         '''
-        objNameSrc = note.Note
-        objNameDst = dynamics.Dynamic
-
         for objName in [objNameSrc, objNameDst]:
-            dstCheck = self.streamObj.flat.getElementsByClass(objName)
-            if len(dstCheck) == 0:
+            found = False
+            for streamFlat in self._getFlatStreams():
+                if len(streamFlat.getElementsByClass(objName)) > 0:
+                    found = True
+                    break
+            if not found:
                 raise CorrelateException('cannot create correlation an object that is not found in the Stream: %s' % objName)
 
         self._findActive(objNameSrc, objNameDst)
 
-        fx = lambda e: e.ps
-        # get index value used for dynamics
-        fy = lambda e: dynamics.shortNames.index(e.value)
-
         pairs = []
         for entry in self.data:
             entrySrc = entry['src']
@@ -147,7 +178,7 @@ class ActivityMatch(object):
         dict = {}
         for coord in pairs: 
             coord = tuple(coord)
-            if coord not in dict.keys():
+            if coord not in dict:
                 dict[coord] = 0
             dict[coord] += 1
         pairs = []
@@ -156,6 +187,31 @@ class ActivityMatch(object):
         return pairs
 
 
+    def pitchToDynamic(self, dataPoints=True):
+        '''Create an analysis of pitch to dynamic symbol.
+
+        If `dataPoints` is True, all data matches between source and destination are returned. If false, 3 point weighted coordinates are created for each unique match. 
+
+        >>> from music21 import *
+        >>> s = corpus.parseWork('bach/bwv8.6.xml')
+        >>> am = analysis.correlate.ActivityMatch(s[0].flat.sorted)
+        >>> am.pitchToDynamic()
+        Traceback (most recent call last):
+        CorrelateException: cannot create correlation an object that is not found in the Stream: <class 'music21.dynamics.Dynamic'>
+
+        >>> s = corpus.parseWork('schumann/opus41no1', 2)
+        >>> am = analysis.correlate.ActivityMatch(s[0].flat.sorted)
+        >>> data = am.pitchToDynamic()
+        >>> len(data)
+        401
+        '''
+        fx = lambda e: e.ps
+        # get index value used for dynamics
+        fy = lambda e: dynamics.shortNames.index(e.value)
+        return self.correlate(note.Note, dynamics.Dynamic, fx, fy, 
+                              dataPoints=dataPoints)
+
+
 
 
 
@@ -202,6 +258,28 @@ class Test(unittest.TestCase):
         self.assertEqual(len(dataPairs), 401)
 
 
+    def testActivityMatchStreamList(self):
+        from music21 import corpus
+
+        a = corpus.parseWork('schumann/opus41no1', 2)
+        parts = [a[0].flat.sorted, a[1].flat.sorted]
+        dynDurations = [d.duration for d in 
+                        parts[0].getElementsByClass(dynamics.Dynamic)]
+
+        # matches found in a list of Streams are pooled
+        b = ActivityMatch(parts)
+        self.assertEqual(len(b.pitchToDynamic()), 401 + 417)
+        weighted = b.pitchToDynamic(dataPoints=False)
+        self.assertEqual(sum([x[2] for x in weighted]), 401 + 417)
+
+        # dynamics are not given new durations
+        self.assertEqual([d.duration for d in 
+            parts[0].getElementsByClass(dynamics.Dynamic)], dynDurations)
+
+        self.assertRaises(CorrelateException, ActivityMatch, [])
+        self.assertRaises(CorrelateException, ActivityMatch, [parts[0], 3])
+
+
 #-------------------------------------------------------------------------------
 if __name__ == "__main__":
 
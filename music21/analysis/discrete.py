@@ -21,6 +21,7 @@ import unittest
 import sys
 import music21
 
+from music21 import common
 from music21 import meter
 from music21 import pitch
 from music21 import stream 
@@ -32,6 +33,12 @@ from music21 import environment
 _MOD = 'discrete.py'
 environLocal = environment.Environment(_MOD)
 
+# numpy is optional; a missing import is reported by music21.base
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 
 #------------------------------------------------------------------------------
@@ -48,6 +55,11 @@ class DiscreteAnalysis(object):
     # define in subclass
     name = ''
     identifiers = []
+    # processors whose results for adjacent windows can be derived without 
+    # reprocessing a Stream define how features are combined: 'sum' for 
+    # lists of values that are added, 'minMax' for (minimum, maximum) pairs
+    featureCombination = None
+
     def __init__(self, referenceStream=None):
         # store a reference stream if needed
         self._referenceStream = referenceStream
@@ -143,6 +155,21 @@ class DiscreteAnalysis(object):
         '''
         pass
 
+    def getFeature(self, subStream):
+        '''For processors that define a `featureCombination`, return the feature of a Stream. Features of adjacent Streams, once combined, can be given to processFeature() to get the same results as process() would return for the joined Streams.
+        '''
+        pass
+
+    def processFeature(self, feature):
+        '''For processors that define a `featureCombination`, return a solution and a color value for a feature, as returned by process(). 
+        '''
+        pass
+
+    def processFeatures(self, features):
+        '''For processors that define a `featureCombination`, return a list of solution and color pairs, one for each feature in the list `features`. Subclasses may override this method to process many features at once. 
+        '''
+        return [self.processFeature(f) for f in features]
+
 
 #------------------------------------------------------------------------------
 # alternative names
@@ -152,12 +179,25 @@ class DiscreteAnalysis(object):
 
 class KrumhanslSchmuckler(DiscreteAnalysis):
     ''' Implementation of the Krumhansl-Schmuckler key determination algorithm
+
+    The weights used to correlate pitch class distributions with each key are selected with the `profile` argument, either the name of a profile defined in `weightProfiles` or a dictionary providing a list of 12 weights for each of 'major' and 'minor'.
+
+    >>> from music21 import *
+    >>> s = corpus.parseWork('bach/bwv66.6')
+    >>> p = analysis.discrete.KrumhanslSchmuckler(profile='temperley')
+    >>> p.getSolution(s)[:2]
+    (F#, 'minor')
+    >>> p = analysis.discrete.KrumhanslSchmuckler(profile='mozart')
+    Traceback (most recent call last):
+    DiscreteAnalysisException: no such weight profile: mozart
     '''
     _DOC_ALL_INHERITED = False
 
     name = 'Krumhansl Schmuckler Key Analysis'
 
     identifiers = ['krumhansl', 'schmuckler', 'key', 'keyscape']
+    # pitch class distributions (and note counts) of windows are added
+    featureCombination = 'sum'
 
     # in general go to Gb, F#: favor F# majorKeyColors
     # favor eb minor
@@ -181,9 +221,42 @@ class KrumhanslSchmuckler(DiscreteAnalysis):
                       'B-', 'B',
                     ]
 
-    def __init__(self, referenceStream=None):
+    # weights for the major and minor mode, beginning with the tonic
+    weightProfiles = {
+        # as given by Sapp; the default
+        'krumhansl': {
+            'major': [6.35, 2.33, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88],
+            'minor': [6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17],
+            },
+        'aarden': {
+            'major': [17.7661, 0.145624, 14.9265, 0.160186, 19.8049, 11.3587, 0.291248, 22.062, 0.145624, 8.15494, 0.232998, 4.95122],
+            'minor': [18.2648, 0.737619, 14.0499, 16.8599, 0.702494, 14.4362, 0.702494, 18.6161, 4.56621, 1.93186, 7.37619, 1.75623],
+            },
+        'bellman': {
+            'major': [16.80, 0.86, 12.95, 1.41, 13.49, 11.93, 1.25, 20.28, 1.80, 8.04, 0.62, 10.57],
+            'minor': [18.16, 0.69, 12.99, 13.34, 1.07, 11.15, 1.38, 21.07, 7.49, 1.53, 0.92, 10.21],
+            },
+        'temperley': {
+            'major': [0.748, 0.060, 0.488, 0.082, 0.670, 0.460, 0.096, 0.715, 0.104, 0.366, 0.057, 0.400],
+            'minor': [0.712, 0.084, 0.474, 0.618, 0.049, 0.460, 0.105, 0.747, 0.404, 0.067, 0.133, 0.330],
+            },
+        'simple': {
+            'major': [2, 0, 1, 0, 1, 1, 0, 2, 0, 1, 0, 1],
+            'minor': [2, 0, 1, 1, 0, 1, 0, 2, 1, 0, 0.5, 0.5],
+            },
+        }
+
+    def __init__(self, referenceStream=None, profile='krumhansl'):
         DiscreteAnalysis.__init__(self, referenceStream=referenceStream)
 
+        if common.isStr(profile):
+            if profile.lower() not in self.weightProfiles.keys():
+                raise DiscreteAnalysisException('no such weight profile: %s' % profile)
+            profile = self.weightProfiles[profile.lower()]
+        self._profile = profile
+        # rotated weights, created when first needed
+        self._rotatedWeights = None
+
         # store sharp/flat count on init if available
         if referenceStream != None:
             self.sharpFlatCount = self._getSharpFlatCount(referenceStream)
@@ -274,13 +347,109 @@ class KrumhanslSchmuckler(DiscreteAnalysis):
         12            
         '''
         weightType = weightType.lower()
-        if weightType == 'major':
-            return [6.35, 2.33, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88]
-        elif weightType == 'minor':
-            return [6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17]    
+        if weightType in ['major', 'minor']:
+            return self._profile[weightType]
         else:
             raise DiscreteAnalysisException('no weights defined for weight type: %s' % weightType)
 
+    def _getRotatedWeights(self):
+        '''Return a list of 24 weight lists, each rotated to a tonic: first the 12 major keys, then the 12 minor keys, each ordered by pitch class.
+
+        >>> a = KrumhanslSchmuckler()
+        >>> w = a._getRotatedWeights()
+        >>> len(w)
+        24
+        >>> w[2][2] == w[0][0] # tonic weight of D major
+        True
+        '''
+        if self._rotatedWeights == None:
+            self._rotatedWeights = []
+            for weightType in ['major', 'minor']:
+                toneWeights = self._getWeights(weightType)
+                for i in range(12):
+                    self._rotatedWeights.append(
+                        [toneWeights[(j - i) % 12] for j in range(12)])
+        return self._rotatedWeights
+
+    def _getKeyScores(self, pcDistributions):
+        '''Given a list of pitch class distributions, return a list of pairs, one for each distribution. The pair provides two lists of 24 values, for the 12 major and then 12 minor keys: the convolution of the distribution with the weights of each key, and the correlation of the distribution with these weights. 
+
+        If numpy is available, all distributions are correlated with all keys in one matrix operation; otherwise, values are computed exactly as by _convoluteDistribution() and _getDifference().
+
+        >>> a = KrumhanslSchmuckler()
+        >>> post = a._getKeyScores([[1, 0, 0, 0, 1, 0, 0, 1, 0, 0, 0, 0]])
+        >>> convolution, correlation = post[0]
+        >>> convolution.index(max(convolution)) # C major
+        0
+        >>> correlation[0] > correlation[12+9] # C major before A minor
+        True
+        '''
+        if numpy != None:
+            return self._getKeyScoresNumpy(pcDistributions)
+        return self._getKeyScoresPython(pcDistributions)
+
+    def _getKeyScoresPython(self, pcDistributions):
+        '''Implementation of _getKeyScores() without numpy.
+        '''
+        rotatedWeights = self._getRotatedWeights()
+        # averages are taken from unrotated weights, and squares are summed 
+        # in the order of each rotation, as in _getDifference()
+        profileAverages = []
+        profileSquares = []
+        for k, weights in enumerate(rotatedWeights):
+            toneWeights = rotatedWeights[(k / 12) * 12]
+            profileAverage = float(sum(toneWeights)) / len(toneWeights)
+            squares = 0
+            for w in weights:
+                squares = squares + (w - profileAverage) ** 2
+            profileAverages.append(profileAverage)
+            profileSquares.append(squares)
+
+        post = []
+        for pcDistribution in pcDistributions:
+            histogramAverage = float(sum(pcDistribution)) / len(pcDistribution)
+            centered = [x - histogramAverage for x in pcDistribution]
+            histogramSquares = 0
+            for x in centered:
+                histogramSquares = histogramSquares + x ** 2
+
+            convolution = []
+            correlation = []
+            for k, weights in enumerate(rotatedWeights):
+                profileAverage = profileAverages[k]
+                soln = 0
+                top = 0
+                for j in range(12):
+                    soln = soln + (weights[j] * pcDistribution[j])
+                    top = top + ((weights[j] - profileAverage) * centered[j])
+                convolution.append(soln)
+                if profileSquares[k] == 0 or histogramSquares == 0:
+                    correlation.append(0)
+                else:
+                    correlation.append(float(top) / 
+                        ((profileSquares[k] * histogramSquares) ** .5))
+            post.append((convolution, correlation))
+        return post
+
+    def _getKeyScoresNumpy(self, pcDistributions):
+        '''Implementation of _getKeyScores() using numpy.
+        '''
+        weights = numpy.array(self._getRotatedWeights(), dtype=float)
+        distributions = numpy.array(pcDistributions, dtype=float)
+        # windows x 24 convolutions
+        convolution = numpy.dot(distributions, weights.T)
+
+        weights = weights - weights.mean(axis=1)[:, numpy.newaxis]
+        distributions = (distributions - 
+                         distributions.mean(axis=1)[:, numpy.newaxis])
+        top = numpy.dot(distributions, weights.T)
+        bottom = numpy.sqrt(numpy.outer((distributions ** 2).sum(axis=1), 
+                                        (weights ** 2).sum(axis=1)))
+        correlation = numpy.zeros(top.shape)
+        nonZero = bottom != 0
+        correlation[nonZero] = top[nonZero] / bottom[nonZero]
+        return zip(convolution.tolist(), correlation.tolist())
+
     def _getPitchClassDistribution(self, streamObj):
         '''Given a flat Stream, obtain a pitch class distribution. The value of each pitch class is scaled by its duration in quarter lengths.
 
@@ -301,19 +470,19 @@ class KrumhanslSchmuckler(DiscreteAnalysis):
         >>> a._getPitchClassDistribution(s)
         [3, 0, 1.5, 0, 1.5, 0, 2, 0, 0, 0, 1.5, 0]
         '''
-        # storage for 12 pitch classes
-        pcDist = [0]*12
-        if len(streamObj.notes) == 0:
+        arrays = streamObj.getPitchArrays()
+        if len(arrays['offset']) == 0:
             return None
+        return self._sumPitchClasses(arrays)
 
-        for n in streamObj.notes:        
-            if not n.isRest:
-                length = n.quarterLength
-                if n.isChord:
-                    for m in n.pitchClasses:
-                        pcDist[m] = pcDist[m] + (1 * length)
-                else:
-                    pcDist[n.pitchClass] = pcDist[n.pitchClass] + (1 * length)
+    def _sumPitchClasses(self, arrays):
+        '''Given pitch arrays from :meth:`~music21.stream.Stream.getPitchArrays`, return the quarter length of each of 12 pitch classes.
+        '''
+        # storage for 12 pitch classes
+        pcDist = [0]*12
+        for pc, length in zip(arrays['pitchClass'], arrays['quarterLength']):
+            if pc is not None: # skip rests
+                pcDist[pc] = pcDist[pc] + (1 * length)
         return pcDist
 
 
@@ -548,6 +717,70 @@ class KrumhanslSchmuckler(DiscreteAnalysis):
         return pitchObj
 
 
+    def getFeature(self, subStream):
+        '''Return the pitch class distribution of a Stream, followed by the number of pitches and rests found, as a list of 13 values. Features of adjacent Streams can be summed. 
+
+        >>> from music21 import *
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> s = converter.parse('c4 e8 r8 g4', '3/4')
+        >>> p.getFeature(s)
+        [1.0, 0, 0, 0, 0.5, 0, 0, 1.0, 0, 0, 0, 0, 4]
+        '''
+        arrays = subStream.getPitchArrays()
+        return self._sumPitchClasses(arrays) + [len(arrays['offset'])]
+
+    def processFeature(self, feature):
+        '''Given a feature as returned by getFeature() (or the sum of such features), return a solution and a color, as returned by process().
+
+        >>> from music21 import *
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> s = corpus.parseWork('bach/bwv66.6')
+        >>> p.processFeature(p.getFeature(s)) == p.process(s)
+        True
+        '''
+        return self.processFeatures([feature])[0]
+
+    def processFeatures(self, features):
+        '''Given a list of features as returned by getFeature() (or sums of such features), return a list of solution and color pairs, as returned by process(). All distributions are correlated with all keys at once. 
+
+        >>> from music21 import *
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> s = corpus.parseWork('bach/bwv66.6')
+        >>> features = [p.getFeature(m) for m in s.parts[0].getElementsByClass('Measure')]
+        >>> [solution[0].name for solution, color in p.processFeatures(features[:4])]
+        ['B', 'A', 'C#', 'F#']
+        '''
+        # features without notes or rests have no solution
+        distributions = [f[:12] for f in features if f[12] != 0]
+        scores = self._getKeyScores(distributions)
+        scores.reverse()
+
+        post = []
+        for f in features:
+            if f[12] == 0:
+                solution = (None, None, 0)
+            else:
+                convolution, correlation = scores.pop()
+                # the most likely key of each mode has the largest 
+                # convolution; the first pitch class is used for ties
+                major = convolution.index(max(convolution[:12]))
+                minor = convolution.index(max(convolution[12:]), 12)
+                # select major or minor by the larger correlation value
+                if correlation[major] > correlation[minor]:
+                    solution = (pitch.Pitch(major), 'major', 
+                                correlation[major])
+                else:
+                    solution = (pitch.Pitch(minor - 12), 'minor', 
+                                correlation[minor])
+                p = self._bestKeyEnharmonic(solution[0], solution[1])
+                solution = (p, solution[1], solution[2])
+            color = self.solutionToColor(solution)
+
+            # store solutions for compressed legend generation
+            self._solutionsFound.append((solution, color))
+            post.append((solution, color))
+        return post
+
     def process(self, sStream):    
         ''' Takes in a Stream or sub-Stream and performs analysis on all contents of the Stream. The :class:`~music21.analysis.windowed.WindowedAnalysis` windowing system can be used to get numerous results by calling this method. 
 
@@ -555,36 +788,12 @@ class KrumhanslSchmuckler(DiscreteAnalysis):
 
         The data list contains a key (as a string), a mode (as a string), and a correlation value (degree of certainty)
         '''
-        sStream = sStream.flat.notes
         # this is the sample distribution used in the paper, for some testing purposes
         #pcDistribution = [7,0,5,0,7,16,0,16,0,15,6,0]
         
         # this is the distribution for the melody of "happy birthday"
         #pcDistribution = [9,0,3,0,2,5,0,2,0,2,2,0]
-    
-        likelyKeysMajor, likelyKeysMinor = self._likelyKeys(sStream)
-
-        #find the largest correlation value to use to select major or minor as the resulting key
-        if likelyKeysMajor == None or likelyKeysMinor == None:
-            mode = None
-            solution = (None, mode, 0)
-        elif likelyKeysMajor[0][1] > likelyKeysMinor[0][1]:
-            mode = 'major'
-            solution = (likelyKeysMajor[0][0], mode, likelyKeysMajor[0][1])
-        else:
-            mode = 'minor'
-            solution = (likelyKeysMinor[0][0], mode, likelyKeysMinor[0][1])
-
-        # first solution is pitch object
-        p = self._bestKeyEnharmonic(solution[0], mode, sStream)
-        solution = (p, mode, solution[2])
-
-        color = self.solutionToColor(solution)
-
-
-        # store solutions for compressed legend generation
-        self._solutionsFound.append((solution, color))
-        return solution, color        
+        return self.processFeature(self.getFeature(sStream))
     
 
     def getSolution(self, sStream):
@@ -616,6 +825,8 @@ class Ambitus(DiscreteAnalysis):
     name = 'Sadoian Ambitus Analysis'
     # provide possible string matches for this processor
     identifiers = ['ambitus', 'range', 'span']
+    # pitch spans of windows are combined by taking the minimum and maximum
+    featureCombination = 'minMax'
 
     def __init__(self, referenceStream=None):
         '''
@@ -671,21 +882,10 @@ class Ambitus(DiscreteAnalysis):
         >>> p.getPitchSpan(s)
         (45, 108)
         '''
-        
-        if len(subStream.flat.notes) == 0:
-            # need to handle case of no pitches
-            return None
-
-        # find the min and max pitch space value for all pitches
-        psFound = []
-        for n in subStream.flat.notes:
-            #environLocal.printDebug([n])
-            pitches = []
-            if 'Chord' in n.classes:
-                pitches = n.pitches
-            elif 'Note' in n.classes:
-                pitches = [n.pitch]
-            psFound += [p.ps for p in pitches]
+        # find the min and max pitch space value for all pitches, skipping 
+        # rests
+        psFound = [ps for ps in subStream.getPitchArrays()['ps'] 
+                   if ps is not None]
 
         # in some cases no pitch space values are found due to all rests
         if psFound == []:
@@ -711,25 +911,15 @@ class Ambitus(DiscreteAnalysis):
         >>> p.getPitchRanges(s)
         (0, 34)
         '''
-        psFound = []
-        for n in subStream.flat.notes:
-            pitches = []
-            if 'Chord' in n.classes:
-                pitches = n.pitches
-            elif 'Note' in n.classes:
-                pitches = [n.pitch]
-            for p in pitches:
-                psFound.append(p.ps)
+        psFound = [ps for ps in subStream.getPitchArrays()['ps'] 
+                   if ps is not None]
         psFound.sort()
+        # the smallest difference is found between adjacent sorted pitches
         psRange = []
         for i in range(len(psFound)-1):
-            p1 = psFound[i]
-            for j in range(i+1, len(psFound)):
-                p2 = psFound[j]
-                # p2 should always be equal or greater than p1
-                psRange.append(p2-p1)
+            psRange.append(psFound[i+1] - psFound[i])
 
-        return int(min(psRange)), int(max(psRange))
+        return int(min(psRange)), int(psFound[-1] - psFound[0])
 
 
     def solutionLegend(self, compress=False):
@@ -816,22 +1006,29 @@ class Ambitus(DiscreteAnalysis):
         return self._pitchSpanColors[result]
     
     
-    def process(self, sStream):
-        '''Given a Stream, return a solution (in half steps) and a color string. 
+    def getFeature(self, subStream):
+        '''Return the pitch span of a Stream, as returned by getPitchSpan(). Features of adjacent Streams are combined by taking the minimum and maximum values.
 
         >>> from music21 import *
         >>> p = analysis.discrete.Ambitus()
-        >>> s = stream.Stream()
-        >>> c = chord.Chord(['a2', 'b4', 'c8'])
-        >>> s.append(c)
-        >>> p.process(s)
-        (63, '#665288')
+        >>> s = converter.parse('c4 e8 r8 g4', '3/4')
+        >>> p.getFeature(s)
+        (60, 67)
         '''
-        sStream = sStream.flat.notes
+        return self.getPitchSpan(subStream)
+
+    def processFeature(self, feature):
+        '''Given a feature as returned by getFeature() (or a combination of such features), return a solution and a color, as returned by process().
 
-        post = self.getPitchSpan(sStream)
-        if post != None:
-            solution = post[1] - post[0] # max-min
+        >>> from music21 import *
+        >>> p = analysis.discrete.Ambitus()
+        >>> p.processFeature((45, 108))
+        (63, '#665288')
+        >>> p.processFeature(None)
+        (None, '#ffffff')
+        '''
+        if feature != None:
+            solution = feature[1] - feature[0] # max-min
         else:
             solution = None
         color = self.solutionToColor(solution)
@@ -840,6 +1037,19 @@ class Ambitus(DiscreteAnalysis):
         self._solutionsFound.append((solution, color))
         return solution, color
 
+    def process(self, sStream):
+        '''Given a Stream, return a solution (in half steps) and a color string. 
+
+        >>> from music21 import *
+        >>> p = analysis.discrete.Ambitus()
+        >>> s = stream.Stream()
+        >>> c = chord.Chord(['a2', 'b4', 'c8'])
+        >>> s.append(c)
+        >>> p.process(s)
+        (63, '#665288')
+        '''
+        return self.processFeature(self.getFeature(sStream))
+
 
     def getSolution(self, sStream):
         '''Procedure to only return an Inteval object.
@@ -877,6 +1087,61 @@ class MelodicIntervalDiversity(DiscreteAnalysis):
         # TODO: map diversity to color span
         return '#ffffff'
 
+    def _getTiedRows(self, arrays, rows):
+        '''Given pitch arrays from :meth:`~music21.stream.Stream.getPitchArrays` and a list of row indices, return a set of the rows that :meth:`~music21.stream.Stream.stripTies` would remove, joining them to a preceding tied note, chord, or rest. 
+
+        >>> from music21 import *
+        >>> s = converter.parse('c2 c4 d4 d2 d4 e4', '4/4')
+        >>> s.notes[0].tie = tie.Tie('start')
+        >>> s.notes[1].tie = tie.Tie('stop')
+        >>> s.notes[2].tie = tie.Tie('start')
+        >>> s.notes[3].tie = tie.Tie('continue')
+        >>> s.notes[4].tie = tie.Tie('stop')
+        >>> a = s.getPitchArrays()
+        >>> p = analysis.discrete.MelodicIntervalDiversity()
+        >>> sorted(p._getTiedRows(a, range(len(a['offset']))))
+        [1, 3, 4]
+        '''
+        # positions of elements in an open chain of tied elements
+        connected = []
+        deleted = []
+        positions = [] # element position of each row
+        position = -1
+        iLast = None
+        for i in rows:
+            # the pitches of a chord are adjacent rows
+            if (iLast is not None and arrays['isChord'][i] and 
+                arrays['isChord'][iLast] and 
+                arrays['offset'][i] == arrays['offset'][iLast]):
+                positions.append(position)
+                continue
+            iLast = i
+            position += 1
+            positions.append(position)
+
+            tieType = arrays['tie'][i]
+            endMatch = None
+            if tieType == 'start':
+                # find a true start, or a continuation of a chain
+                if position - 1 not in connected:
+                    connected = [position]
+                else:
+                    connected.append(position)
+                endMatch = False
+            elif tieType == 'continue':
+                connected.append(position)
+                endMatch = False
+            elif tieType == 'stop':
+                endMatch = True
+            if endMatch:
+                connected.append(position)
+                # an open tie, not connected to anything, is skipped
+                deleted += connected[1:]
+                connected = []
+
+        deleted = set(deleted)
+        return set([i for i, pos in zip(rows, positions) if pos in deleted])
+
     def countMelodicIntervals(self, sStream, found=None, ignoreDirection=True, 
         ignoreUnison=True):
         '''
@@ -890,37 +1155,42 @@ class MelodicIntervalDiversity(DiscreteAnalysis):
         if found == None:
             found = {}
 
-        # if this has parts, need to move through each at a time
-        if sStream.hasPartLikeStreams():
-            procList = [s for s in sStream.getElementsByClass('Stream')]
-        else: # assume a single list of notes
-            procList = [sStream]
-
-        for p in procList:
-            # get only Notes for now, skipping rests and chords
-            noteStream = p.stripTies(inPlace=False).getElementsByClass('Note')
-            #noteStream.show()
-            for i, n in enumerate(noteStream):
-                if i <= len(noteStream) - 2:
-                    nNext = noteStream[i+1]
+        # intervals between the same pairs of pitch names are created once
+        intervals = {}
+        # if this has parts, pitches are found in each part separately
+        arrays = sStream.getPitchArrays()
+        for part in sorted(set(arrays['part'])):
+            rows = [i for i in range(len(arrays['part'])) 
+                    if arrays['part'][i] == part]
+            joined = self._getTiedRows(arrays, rows)
+            pLast = None
+            for i in rows:
+                # get only Notes for now, skipping rests and chords
+                p = arrays['pitch'][i]
+                if i in joined or p is None or arrays['isChord'][i]:
+                    continue
+                pPrevious = pLast
+                pLast = p
+                if pPrevious is None:
+                    continue
+
+                key = (pPrevious.nameWithOctave, p.nameWithOctave)
+                if key not in intervals:
+                    #environLocal.printDebug(['creating interval from pitches:', pPrevious, p])
+                    intervals[key] = interval.notesToInterval(pPrevious, p)
+                intervalObj = intervals[key]
+                if ignoreUnison: # will apply to enharmonic eq unisons
+                    if intervalObj.chromatic.semitones == 0:
+                        continue
+                if ignoreDirection:
+                    if intervalObj.chromatic.semitones < 0:
+                        intervalObj = intervalObj.reverse()
+                # must use directed name for cases where ignoreDirection
+                # is false
+                if intervalObj.directedName not in found:
+                    found[intervalObj.directedName] = [intervalObj, 1]
                 else:
-                    nNext = None
-
-                if nNext is not None:
-                    #environLocal.printDebug(['creating interval from notes:', n, nNext, i])
-                    i = interval.notesToInterval(n, nNext)
-                    if ignoreUnison: # will apply to enharmonic eq unisons
-                        if i.chromatic.semitones == 0:
-                            continue
-                    if ignoreDirection:
-                        if i.chromatic.semitones < 0:
-                            i = i.reverse()
-                    # must use directed name for cases where ignoreDirection
-                    # is false
-                    if i.directedName not in found.keys():
-                        found[i.directedName] = [i, 1]
-                    else:
-                        found[i.directedName][1] += 1 # increment counter
+                    found[intervalObj.directedName][1] += 1 # increment counter
                         
 #         def compare(x, y):
 #             return abs(x.chromatic.semitones) - abs(y.chromatic.semitones)
@@ -932,7 +1202,8 @@ class MelodicIntervalDiversity(DiscreteAnalysis):
         '''
         Find how many unique intervals are used in this Stream
         '''
-        uniqueIntervals = countMelodicIntervals(sStream, ignoreDirection)
+        uniqueIntervals = self.countMelodicIntervals(sStream, 
+                          ignoreDirection=ignoreDirection)
         return len(uniqueIntervals), self.solutionToColor(len(uniqueIntervals))
 
 
@@ -1065,6 +1336,50 @@ class Test(unittest.TestCase):
         #print post
 
 
+    def testKeyScores(self):
+        from music21 import corpus
+        # compare the batch implementations to the per-window methods
+        for profile in ['krumhansl', 'aarden', 'simple']:
+            p = KrumhanslSchmuckler(profile=profile)
+            for work in ['bach/bwv66.6', 'bach/bwv57.8']:
+                s = corpus.parseWork(work)
+                distributions = []
+                windows = []
+                for m in s.parts[0].getElementsByClass('Measure'):
+                    pcDist = p._getPitchClassDistribution(m.flat.notes)
+                    if pcDist != None:
+                        distributions.append(pcDist)
+                        windows.append(m.flat.notes)
+                post = p._getKeyScoresPython(distributions)
+                if numpy != None:
+                    postNumpy = p._getKeyScoresNumpy(distributions)
+                for i, pcDist in enumerate(distributions):
+                    convolution = []
+                    correlation = []
+                    for weightType in ['major', 'minor']:
+                        keyResults = p._convoluteDistribution(pcDist, 
+                                     weightType)
+                        convolution += keyResults
+                        correlation += p._getDifference(keyResults, pcDist, 
+                                       weightType)
+                    self.assertEqual(post[i], (convolution, correlation))
+                    if numpy != None:
+                        for j in range(24):
+                            self.assertAlmostEqual(postNumpy[i][0][j], 
+                                                   convolution[j])
+                            self.assertAlmostEqual(postNumpy[i][1][j], 
+                                                   correlation[j])
+                # the best solutions match those of the per-window methods
+                for i, pcDist in enumerate(distributions):
+                    major, minor = p._likelyKeys(windows[i])
+                    solution, color = p.processFeature(pcDist + [1])
+                    if major[0][1] > minor[0][1]:
+                        self.assertEqual(solution[1], 'major')
+                        self.assertEqual(solution[2], major[0][1])
+                    else:
+                        self.assertEqual(solution[1], 'minor')
+                        self.assertEqual(solution[2], minor[0][1])
+
     def testIntervalDiversity(self):
         from music21 import note, stream, corpus
         
@@ -1097,6 +1412,32 @@ class Test(unittest.TestCase):
         self.assertEqual(str(id.countMelodicIntervals(s)), "{'M3': [<music21.interval.Interval M3>, 1], 'P4': [<music21.interval.Interval P4>, 5], 'P5': [<music21.interval.Interval P5>, 2], 'M2': [<music21.interval.Interval M2>, 8], 'm3': [<music21.interval.Interval m3>, 3], 'm2': [<music21.interval.Interval m2>, 1]}")
         
 
+    def testEditsInPlace(self):
+        from music21 import note, stream, pitch, tie
+
+        s = stream.Stream()
+        for name in ['c4', 'e4', 'f4']:
+            s.append(note.Note(name))
+        ambitus = Ambitus()
+        self.assertEqual(ambitus.getPitchSpan(s), (60, 65))
+        # notes changed in place are found by later analyses
+        s.notes[0].pitch = pitch.Pitch('c2')
+        self.assertEqual(ambitus.getPitchSpan(s), (36, 65))
+
+        ks = KrumhanslSchmuckler()
+        before = ks._getPitchClassDistribution(s)
+        s.notes[1].quarterLength = 3
+        after = ks._getPitchClassDistribution(s)
+        self.assertEqual(after[4], before[4] * 3)
+
+        id = MelodicIntervalDiversity()
+        self.assertEqual(id.countMelodicIntervals(s)['m2'][1], 1)
+        s.notes[1].pitch = pitch.Pitch('f4')
+        s.notes[1].tie = tie.Tie('start')
+        # tied notes of the same pitch are joined
+        self.assertEqual('m2' in id.countMelodicIntervals(s), False)
+
+
 
 #------------------------------------------------------------------------------
 
@@ -47,12 +47,17 @@ def labelBeatDepth(streamIn):
 #          music21.meter.TimeSignature)[0]
     
 
+    # measures often share a TimeSignature found by context; subdivide 
+    # each TimeSignature only once
+    tsSubdivided = set()
     for m in streamIn.getElementsByClass(music21.stream.Measure):
 
         # this will search contexts
         ts = m.getTimeSignatures(sortByCreationTime=False)[0]
 
-        ts.beatSequence.subdivideNestedHierarchy(depth=3)
+        if id(ts) not in tsSubdivided:
+            ts.beatSequence.subdivideNestedHierarchy(depth=3)
+            tsSubdivided.add(id(ts))
 
         for n in m.notes:
             if n.tie != None:
@@ -0,0 +1,409 @@
+#!/usr/bin/python
+#-------------------------------------------------------------------------------
+# Name:         pipeline.py
+# Purpose:      Extraction of features from many files, with checkpointing
+#
+# Authors:      The music21 Project
+#
+# Copyright:    (c) 2026 The music21 Project
+# License:      LGPL
+#-------------------------------------------------------------------------------
+'''Tools for extracting features, such as pitch-class histograms and key estimates, from many files, such as all files in the corpus.
+
+A :class:`~music21.analysis.pipeline.FeaturePipeline` parses each file, applies a list of :class:`~music21.analysis.pipeline.FeatureExtractor` objects, and collects the results in a table. Results for each file are stored in a checkpoint file as soon as they are available; when a pipeline is run again, only files whose contents have changed, or that require an extractor whose version has changed, are parsed.
+'''
+
+import unittest, doctest
+import os
+import json
+import hashlib
+
+import music21
+from music21 import common
+
+from music21 import environment
+_MOD = 'pipeline.py'
+environLocal = environment.Environment(_MOD)
+
+
+
+#-------------------------------------------------------------------------------
+class PipelineException(Exception):
+    pass
+
+
+#-------------------------------------------------------------------------------
+class FeatureExtractor(object):
+    '''Parent class for feature extractors.
+
+    Subclasses define a unique `name`, a `version`, and an :meth:`~music21.analysis.pipeline.FeatureExtractor.extract` method that returns a value that can be stored as JSON. The `version` must be incremented whenever the values returned by an extractor change; stored values of older versions are then extracted again.
+    '''
+    # define in subclass
+    name = ''
+    version = 1
+
+    def extract(self, streamObj):
+        '''Given a Stream, return the value of this feature.
+        '''
+        pass
+
+
+class PitchClassHistogram(FeatureExtractor):
+    '''The number of occurrences of each of the twelve pitch classes, including the pitches of chords.
+
+    >>> from music21 import *
+    >>> s = corpus.parseWork('bach/bwv66.6')
+    >>> analysis.pipeline.PitchClassHistogram().extract(s)
+    [0, 33, 12, 1, 16, 6, 30, 0, 14, 22, 3, 28]
+    '''
+    name = 'pitchClassHistogram'
+    version = 1
+
+    def extract(self, streamObj):
+        post = [0] * 12
+        for n in streamObj.flat.notes:
+            if 'Chord' in n.classes:
+                pitches = n.pitches
+            elif 'Note' in n.classes:
+                pitches = [n.pitch]
+            else:
+                continue
+            for p in pitches:
+                post[p.pitchClass] += 1
+        return post
+
+
+class MelodicIntervalHistogram(FeatureExtractor):
+    '''The number of occurrences of each melodic interval, ignoring direction and unisons, as counted by :meth:`~music21.analysis.discrete.MelodicIntervalDiversity.countMelodicIntervals`. Intervals are given by name.
+
+    >>> from music21 import *
+    >>> s = corpus.parseWork('bach/bwv66.6')
+    >>> post = analysis.pipeline.MelodicIntervalHistogram().extract(s)
+    >>> post['M2'], post['m2']
+    (58, 35)
+    '''
+    name = 'melodicIntervalHistogram'
+    version = 1
+
+    def extract(self, streamObj):
+        from music21.analysis import discrete
+        found = discrete.MelodicIntervalDiversity().countMelodicIntervals(
+                streamObj)
+        post = {}
+        for name, pair in found.items():
+            post[name] = pair[1]
+        return post
+
+
+class MelodicIntervalDiversity(FeatureExtractor):
+    '''The number of distinct melodic intervals, as found by :class:`~music21.analysis.discrete.MelodicIntervalDiversity`.
+
+    >>> from music21 import *
+    >>> s = corpus.parseWork('bach/bwv66.6')
+    >>> analysis.pipeline.MelodicIntervalDiversity().extract(s)
+    10
+    '''
+    name = 'melodicIntervalDiversity'
+    version = 1
+
+    def extract(self, streamObj):
+        from music21.analysis import discrete
+        return len(discrete.MelodicIntervalDiversity().countMelodicIntervals(
+                   streamObj))
+
+
+class KeyEstimate(FeatureExtractor):
+    '''The key found by :class:`~music21.analysis.discrete.KrumhanslSchmuckler`, as a list of the name of the tonic, the mode, and the correlation coefficient.
+
+    >>> from music21 import *
+    >>> s = corpus.parseWork('bach/bwv66.6')
+    >>> post = analysis.pipeline.KeyEstimate().extract(s)
+    >>> post[:2]
+    ['F#', 'minor']
+    '''
+    name = 'keyEstimate'
+    version = 1
+
+    def extract(self, streamObj):
+        from music21.analysis import discrete
+        p, mode, correlation = discrete.KrumhanslSchmuckler().getSolution(
+                               streamObj)
+        if p is not None:
+            p = p.name
+        return [p, mode, correlation]
+
+
+
+#-------------------------------------------------------------------------------
+def _extractFeaturesPickled(args):
+    '''Parse a file and apply feature extractors; used as the worker function of :meth:`~music21.analysis.pipeline.FeaturePipeline.run`. Errors are returned as strings, so that one file that cannot be processed does not end a run.
+    '''
+    from music21 import converter
+    fp, extractors = args
+    try:
+        s = converter.parse(fp)
+        post = {}
+        for extractor in extractors:
+            post[extractor.name] = extractor.extract(s)
+    except Exception, e:
+        return fp, None, '%s: %s' % (e.__class__.__name__, e)
+    return fp, post, None
+
+
+class FeaturePipeline(object):
+    '''Extract features from many files, storing results in a checkpoint file.
+
+    The `extractors` are a list of :class:`~music21.analysis.pipeline.FeatureExtractor` instances. The `paths` are the files to process; if None, all files in the corpus are processed. If `checkpointFp` is given, results are stored in this file as each file is completed, and are re-used for files whose contents (compared by MD5 digest) have not changed and for extractors whose version has not changed.
+
+    >>> from music21 import *
+    >>> fp = corpus.getWork('bach/bwv66.6')
+    >>> fpList = [fp]
+    >>> fe = analysis.pipeline.FeaturePipeline([analysis.pipeline.KeyEstimate()], fpList)
+    >>> results = fe.run()
+    >>> results[fp]['keyEstimate'][:2]
+    ['F#', 'minor']
+    >>> table = fe.getTable()
+    >>> table[0]
+    ['path', 'keyEstimate']
+    >>> table[1][1][:2]
+    ['F#', 'minor']
+    '''
+    def __init__(self, extractors, paths=None, checkpointFp=None):
+        self.extractors = extractors
+        names = [e.name for e in extractors]
+        for name in names:
+            if name == '' or names.count(name) > 1:
+                raise PipelineException('each extractor must have a unique name: %s' % name)
+        if paths is None:
+            from music21 import corpus
+            paths = corpus.getPaths()
+        self.paths = paths
+        self.checkpointFp = checkpointFp
+
+        # path: {extractor name: value}
+        self.results = {}
+        # path: error message, for files that could not be processed
+        self.errors = {}
+        # paths parsed in the last run
+        self.computed = []
+
+    def _getDigest(self, fp):
+        f = open(fp, 'rb')
+        digest = hashlib.md5(f.read()).hexdigest()
+        f.close()
+        return digest
+
+    def _readCheckpoint(self):
+        '''Return a dictionary of stored records, where keys are paths and values are pairs of file digest and a dictionary of extractor name: [version, value].
+        '''
+        stored = {}
+        if self.checkpointFp is None or not os.path.exists(self.checkpointFp):
+            return stored
+        f = open(self.checkpointFp)
+        for line in f:
+            # a record interrupted while being written is ignored
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            fp = record['path']
+            if fp in stored and stored[fp][0] == record['digest']:
+                stored[fp][1].update(record['features'])
+            else:
+                stored[fp] = [record['digest'], record['features']]
+        f.close()
+        return stored
+
+    def _writeCheckpoint(self, stored):
+        '''Rewrite the checkpoint file with one record for each path.
+        '''
+        fpTemp = self.checkpointFp + '.tmp'
+        f = open(fpTemp, 'w')
+        for fp in sorted(stored.keys()):
+            digest, features = stored[fp]
+            f.write(json.dumps({'path': fp, 'digest': digest,
+                                'features': features}) + '\n')
+        f.close()
+        if os.path.exists(self.checkpointFp) and common.getPlatform() == 'win':
+            os.remove(self.checkpointFp)
+        os.rename(fpTemp, self.checkpointFp)
+
+    def run(self, workers=1):
+        '''Process all paths, parsing only those that have no stored results for the current extractors. Return a dictionary of results, where keys are paths and values are dictionaries of extractor name and value.
+
+        If `workers` is greater than one, files are processed in a pool of that many processes; if None, one process per CPU is used. Files that cannot be processed are omitted from the results and stored in the `errors` dictionary; they are processed again on the next run.
+        '''
+        stored = self._readCheckpoint()
+        self.results = {}
+        self.errors = {}
+        self.computed = []
+
+        # find which extractors must be applied to each file
+        pending = []
+        digests = {}
+        for fp in self.paths:
+            digest = self._getDigest(fp)
+            digests[fp] = digest
+            features = {}
+            if fp in stored and stored[fp][0] == digest:
+                features = stored[fp][1]
+            else:
+                stored[fp] = [digest, features]
+            required = []
+            self.results[fp] = {}
+            for extractor in self.extractors:
+                if (extractor.name in features and
+                    features[extractor.name][0] == extractor.version):
+                    self.results[fp][extractor.name] = features[
+                                                       extractor.name][1]
+                else:
+                    required.append(extractor)
+            if len(required) > 0:
+                pending.append((fp, required))
+
+        if self.checkpointFp is not None:
+            # store records of unchanged files only, then append new results
+            self._writeCheckpoint(dict([(fp, stored[fp]) for fp in
+                                  stored.keys() if len(stored[fp][1]) > 0]))
+            f = open(self.checkpointFp, 'a')
+        else:
+            f = None
+
+        if workers is None:
+            import multiprocessing
+            workers = multiprocessing.cpu_count()
+        if workers > 1 and len(pending) > 1:
+            import multiprocessing
+            pool = multiprocessing.Pool(workers)
+            resultIter = pool.imap_unordered(_extractFeaturesPickled, pending)
+        else:
+            pool = None
+            resultIter = (_extractFeaturesPickled(args) for args in pending)
+
+        versions = dict([(e.name, e.version) for e in self.extractors])
+        try:
+            for fp, post, error in resultIter:
+                self.computed.append(fp)
+                if error is not None:
+                    environLocal.printDebug(['FeaturePipeline: failed:', fp,
+                                             error])
+                    self.errors[fp] = error
+                    del self.results[fp]
+                    continue
+                self.results[fp].update(post)
+                if f is not None:
+                    features = {}
+                    for name, value in post.items():
+                        features[name] = [versions[name], value]
+                    f.write(json.dumps({'path': fp, 'digest': digests[fp],
+                                        'features': features}) + '\n')
+                    f.flush()
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            if f is not None:
+                f.close()
+        return self.results
+
+    def getTable(self):
+        '''Return the results of the last run as a list of rows, one for each processed path, in the order of the paths. The first row names the columns: the path, followed by the name of each extractor.
+        '''
+        post = [['path'] + [e.name for e in self.extractors]]
+        for fp in self.paths:
+            if fp not in self.results:
+                continue
+            row = [fp]
+            for extractor in self.extractors:
+                row.append(self.results[fp][extractor.name])
+            post.append(row)
+        return post
+
+
+
+#-------------------------------------------------------------------------------
+class Test(unittest.TestCase):
+
+    def runTest(self):
+        pass
+
+    def testFeaturePipeline(self):
+        import shutil
+        from music21 import corpus
+
+        dir = os.path.join(environLocal.getRootTempDir(),
+                           'm21-pipeline-test')
+        if os.path.exists(dir):
+            shutil.rmtree(dir)
+        os.mkdir(dir)
+        paths = []
+        for name in ['bwv66.6', 'bwv7.7', 'bwv57.8']:
+            fp = os.path.join(dir, name + '.xml')
+            shutil.copy(corpus.getWork('bach/%s' % name, extList=['.xml']),
+                        fp)
+            paths.append(fp)
+        fpCheckpoint = os.path.join(dir, 'checkpoint.json')
+        extractors = [PitchClassHistogram(), KeyEstimate()]
+
+        fe = FeaturePipeline(extractors, paths, fpCheckpoint)
+        results = fe.run()
+        self.assertEqual(sorted(fe.computed), sorted(paths))
+        self.assertEqual(results[paths[0]]['keyEstimate'][:2],
+                         ['F#', 'minor'])
+
+        # nothing is computed again
+        fe = FeaturePipeline(extractors, paths, fpCheckpoint)
+        self.assertEqual(fe.run(), results)
+        self.assertEqual(fe.computed, [])
+
+        # a changed file and a new extractor are computed;
+        # a run interrupted after writing part of a record is resumed
+        f = open(paths[1], 'a')
+        f.write('\n')
+        f.close()
+        f = open(fpCheckpoint, 'a')
+        f.write('{"path": "')
+        f.close()
+        fe = FeaturePipeline(extractors + [MelodicIntervalDiversity()],
+                             paths, fpCheckpoint)
+        resultsNew = fe.run(workers=2)
+        self.assertEqual(sorted(fe.computed), sorted(paths))
+        self.assertEqual(resultsNew[paths[1]]['pitchClassHistogram'],
+                         results[paths[1]]['pitchClassHistogram'])
+        self.assertEqual(resultsNew[paths[0]]['melodicIntervalDiversity'], 10)
+
+        # a new extractor version is computed again
+        keyEstimate = KeyEstimate()
+        keyEstimate.version = 2
+        fe = FeaturePipeline([PitchClassHistogram(), keyEstimate], paths,
+                             fpCheckpoint)
+        fe.run()
+        self.assertEqual(sorted(fe.computed), sorted(paths))
+        fe = FeaturePipeline([PitchClassHistogram(), keyEstimate], paths,
+                             fpCheckpoint)
+        fe.run()
+        self.assertEqual(fe.computed, [])
+        self.assertEqual(len(fe.getTable()), 4)
+
+        # files that cannot be parsed are not stored
+        fp = os.path.join(dir, 'empty.xml')
+        f = open(fp, 'w')
+        f.close()
+        fe = FeaturePipeline([PitchClassHistogram(), keyEstimate], 
+                             paths + [fp], fpCheckpoint)
+        fe.run()
+        self.assertEqual(fe.errors.keys(), [fp])
+        self.assertEqual(fe.computed, [fp])
+        self.assertEqual(len(fe.getTable()), 4)
+        shutil.rmtree(dir)
+
+
+#-------------------------------------------------------------------------------
+# define presented order in documentation
+_DOC_ORDER = [FeaturePipeline, FeatureExtractor, PitchClassHistogram,
+              MelodicIntervalHistogram, MelodicIntervalDiversity, KeyEstimate]
+
+
+if __name__ == "__main__":
+    music21.mainTest(Test)
+
@@ -39,12 +39,128 @@ class WindowedAnalysisException(Exception):
 
 
 #------------------------------------------------------------------------------
+class _SumCombiner(object):
+    '''Combine lists of values, one for each minimum window, by summing. Prefix sums are computed once, so that the feature of any range of minimum windows is found with one subtraction per value.
+
+    >>> c = _SumCombiner([[1, 0], [2, 1], [3, 0], [4, 1]])
+    >>> c.combine(1, 3)
+    [5, 1]
+    >>> c.combine(2, 2) # an empty range
+    [0, 0]
+
+    The features of all overlapping windows of size 2 that include minimum window 1, ranging from windows starting at 0 to windows starting at 1, with minimum windows counted once for each window they are in:
+
+    >>> c.combineOverlapped(0, 1, 2)
+    [8, 2]
+    '''
+    def __init__(self, features):
+        self._prefix = self._prefixSums(features)
+        # sums of prefix sums, used for combining ranges of overlapped windows
+        self._prefixPrefix = self._prefixSums(self._prefix)
+
+    def _prefixSums(self, features):
+        total = [0] * len(features[0])
+        post = [total]
+        for f in features:
+            total = [a + b for a, b in zip(total, f)]
+            post.append(total)
+        return post
+
+    def _difference(self, prefix, start, end):
+        return [b - a for a, b in zip(prefix[start], prefix[end])]
+
+    def combine(self, start, end):
+        '''Return the sum of features of minimum windows from index `start` up to but not including index `end`.
+        '''
+        return self._difference(self._prefix, start, end)
+
+    def combineOverlapped(self, first, last, windowSize):
+        '''Return the sum of features of all windows of `windowSize` starting at indices `first` through `last`.
+        '''
+        if last < first:
+            return [0] * len(self._prefix[0])
+        # the sum over windows k of (prefix[k+windowSize] - prefix[k])
+        upper = self._difference(self._prefixPrefix, first + windowSize, 
+                                 last + windowSize + 1)
+        lower = self._difference(self._prefixPrefix, first, last + 1)
+        return [a - b for a, b in zip(upper, lower)]
+
+
+class _MinMaxCombiner(object):
+    '''Combine (minimum, maximum) pairs, one for each minimum window, by taking the minimum and maximum values. A feature may be None if a window has no values. Tables of minima and maxima for ranges of power-of-two sizes are computed once, so that any range of minimum windows is combined by comparing two entries.
+
+    >>> c = _MinMaxCombiner([(60, 64), None, (55, 62), (67, 67)])
+    >>> c.combine(0, 2)
+    (60, 64)
+    >>> c.combine(0, 4)
+    (55, 67)
+    >>> c.combine(1, 2) == None
+    True
+    >>> c.combineOverlapped(2, 3, 1)
+    (55, 67)
+    '''
+    def __init__(self, features):
+        mins = []
+        maxs = []
+        for f in features:
+            if f == None:
+                mins.append(_INFINITY)
+                maxs.append(-_INFINITY)
+            else:
+                mins.append(f[0])
+                maxs.append(f[1])
+        # each table is a list of levels; the value at level j, index i, 
+        # covers features i up to i + 2**j
+        self._minTable = [mins]
+        self._maxTable = [maxs]
+        span = 1
+        while span * 2 <= len(features):
+            lastMin = self._minTable[-1]
+            lastMax = self._maxTable[-1]
+            indices = range(len(features) - span * 2 + 1)
+            self._minTable.append([min(lastMin[i], lastMin[i+span]) 
+                                   for i in indices])
+            self._maxTable.append([max(lastMax[i], lastMax[i+span]) 
+                                   for i in indices])
+            span *= 2
+
+    def combine(self, start, end):
+        '''Return the minimum and maximum of features of minimum windows from index `start` up to but not including index `end`, or None if there are no values.
+        '''
+        if end <= start:
+            return None
+        level = 0
+        while 2 ** (level + 1) <= end - start:
+            level += 1
+        span = 2 ** level
+        low = min(self._minTable[level][start], 
+                  self._minTable[level][end - span])
+        high = max(self._maxTable[level][start], 
+                   self._maxTable[level][end - span])
+        if low == _INFINITY:
+            return None
+        return low, high
+
+    def combineOverlapped(self, first, last, windowSize):
+        '''Return the combined feature of all windows of `windowSize` starting at indices `first` through `last`.
+        '''
+        # repeated minimum windows do not change a minimum or maximum
+        return self.combine(first, last + windowSize)
+
 
+_INFINITY = float('inf')
+
+_COMBINERS = {'sum': _SumCombiner, 'minMax': _MinMaxCombiner}
+
+
+#------------------------------------------------------------------------------
 class WindowedAnalysis(object):
     def __init__(self, streamObj, analysisProcessor):
         '''Create a WindowedAnalysis object.
 
         The provided `analysisProcessor` must provide a `process()` method that, when given a windowed Stream (a Measure) returns two element tuple containing (a) a data value (implementation dependent) and (b) a color code. 
+
+        If the processor defines a `featureCombination` (see :class:`~music21.analysis.discrete.DiscreteAnalysis`), a feature is obtained once for each minimum window, and features of all larger windows are combined from these, rather than building and processing a Stream for every window. 
         '''
         self.processor = analysisProcessor
         #environLocal.printDebug(self.processor)
@@ -53,6 +169,8 @@ class WindowedAnalysis(object):
         self._srcStream = streamObj
         # store a windowed Stream, partitioned into bars of 1/4
         self._windowedStream = self._getMinimumWindowStream() 
+        # a combiner of minimum window features, created when first needed
+        self._combiner = None
 
     def _getMinimumWindowStream(self):
         ''' Take the loaded stream and restructure it into measures of 1 quarter note duration.
@@ -125,6 +243,9 @@ class WindowedAnalysis(object):
         color = [0] * windowCount
         # how many windows in this row
         windowCountIndices = range(windowCount)
+
+        if getattr(self.processor, 'featureCombination', None) != None:
+            return self._analyzeFeatures(windowSize, windowType, windowCount)
         
         if windowType == 'overlap':
             for i in windowCountIndices:
@@ -153,29 +274,80 @@ class WindowedAnalysis(object):
                     break
        
         elif windowType == 'adjacentAverage':
-            # first get overlapping windows
-            overlapped = []
-            for i in range(maxWindowCount - windowSize + 1):
-                current = stream.Stream()
-                # store indices of min windows that participate
-                participants = [] 
-                for j in range(i, i+windowSize):
-                    current.append(self._windowedStream[j])
-                    participants.append(j)
-                overlapped.append([current, participants])
-
-            # then distribute to each of maxWindowCount
+            # for each of maxWindowCount, combine all overlapping windows
+            # in which this minimum window participates
             for i in range(maxWindowCount):
-                # get all participants, combine into a single 
                 current = stream.Stream()
-                for dataStream, participants in overlapped:
-                    if i in participants:
-                        for m in dataStream:
-                            current.append(m)
+                first, last = self._getOverlappedRange(i, windowSize)
+                for k in range(first, last+1):
+                    for j in range(k, k+windowSize):
+                        current.append(self._windowedStream[j])
                 data[i], color[i] = self.processor.process(current)
 
         return data, color
 
+    def _getOverlappedRange(self, i, windowSize):
+        '''Return the first and last starting index of the overlapping windows of `windowSize` that include the minimum window at index `i`. If there are no such windows, last is less than first.
+
+        >>> from music21 import *
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> wa = analysis.windowed.WindowedAnalysis(s, analysis.discrete.Ambitus())
+        >>> wa._getOverlappedRange(0, 2)
+        (0, 0)
+        >>> wa._getOverlappedRange(2, 2)
+        (1, 2)
+        >>> wa._getOverlappedRange(3, 2)
+        (2, 2)
+        '''
+        first = max(0, i - windowSize + 1)
+        last = min(i, len(self._windowedStream) - windowSize)
+        return first, last
+
+    def _getCombiner(self):
+        '''Get the features of all minimum windows from the processor, and return an object for combining them.
+        '''
+        if self._combiner == None:
+            features = []
+            for m in self._windowedStream:
+                features.append(self.processor.getFeature(m))
+            combinerClass = _COMBINERS[self.processor.featureCombination]
+            self._combiner = combinerClass(features)
+        return self._combiner
+
+    def _analyzeFeatures(self, windowSize, windowType, windowCount):
+        '''Perform the analysis of :meth:`~music21.analysis.windowed.WindowedAnalysis._analyze` by combining features of minimum windows. 
+
+        >>> from music21 import *
+        >>> s = corpus.parseWork('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> wa = WindowedAnalysis(s, p)
+        >>> a, b = wa._analyzeFeatures(4, 'overlap', 33)
+        >>> a[:6]
+        [19, 22, 27, 27, 31, 28]
+        '''
+        combiner = self._getCombiner()
+        maxWindowCount = len(self._windowedStream)
+        data = [0] * windowCount
+        color = [0] * windowCount
+        features = []
+        for i in range(windowCount):
+            if windowType == 'overlap':
+                feature = combiner.combine(i, i+windowSize)
+            elif windowType == 'noOverlap':
+                start = min(i * windowSize, maxWindowCount)
+                end = min(start + windowSize, maxWindowCount)
+                feature = combiner.combine(start, end)
+            elif windowType == 'adjacentAverage':
+                first, last = self._getOverlappedRange(i, windowSize)
+                feature = combiner.combineOverlapped(first, last, windowSize)
+            features.append(feature)
+
+        # processors may process all windows of a row at once
+        for i, pair in enumerate(self.processor.processFeatures(features)):
+            data[i], color[i] = pair
+        return data, color
+
         
     def process(self, minWindow=1, maxWindow=1, windowStepSize=1, 
                 windowType='overlap', includeTotalWindow=True):
@@ -373,6 +545,25 @@ class Test(unittest.TestCase):
 
 
 
+    def testFeatureWindowing(self):
+        '''Test that combining features gets the same results as processing a Stream for each window
+        '''
+        from music21 import corpus
+        from music21.analysis import discrete
+        s = corpus.parseWork('bach/bwv66.6')
+
+        for pClass in [discrete.KrumhanslSchmuckler, discrete.Ambitus]:
+            p = pClass()
+            wa = WindowedAnalysis(s.parts[0], p)
+            for windowType in ['overlap', 'noOverlap', 'adjacentAverage']:
+                for windowSize in [1, 3, 5]:
+                    p.featureCombination = pClass.featureCombination
+                    post = wa._analyze(windowSize, windowType)
+                    # an instance attribute forces processing of Streams
+                    p.featureCombination = None
+                    self.assertEqual(post, wa._analyze(windowSize, windowType))
+
+
     def testVariableWindowing(self):
         from music21.analysis import discrete
         from music21 import corpus, graph
@@ -1099,6 +1099,13 @@ class JSONSerializer(object):
     # this class need to give object last
     # e.g. class Text(music21.JSONSerializer, object):
 
+    # subclasses that call _jsonDecodePending() from __getattr__ can set this
+    # to True to permit lazy decoding of component objects
+    _jsonLazy = False
+
+    # results of jsonAttributes(), stored by class
+    _jsonAttributesByClass = {}
+
     def __init__(self):
         pass
 
@@ -1107,6 +1114,8 @@ class JSONSerializer(object):
 
     def jsonAttributes(self):
         '''Define all attributes of this object that should be JSON serialized for storage and re-instantiation. Attributes that name basic Python objects or :class:`~music21.base.JSONSerializer` subclasses, or dictionaries or lists that contain Python objects or :class:`~music21.base.JSONSerializer` subclasses, can be provided.
+
+        The list returned must be the same for all instances of a class, as it is stored by class when encoding. 
         '''
         return []
 
@@ -1120,9 +1129,27 @@ class JSONSerializer(object):
     #---------------------------------------------------------------------------
     # core methods for getting and setting
 
+    def _getJSONAttributes(self):
+        '''Return the jsonAttributes() of this class, calling that method only once per class.
+
+        >>> from music21 import *
+        >>> t = metadata.Text('my text')
+        >>> t._getJSONAttributes() == t.jsonAttributes()
+        True
+        '''
+        cls = self.__class__
+        try:
+            return JSONSerializer._jsonAttributesByClass[cls]
+        except KeyError:
+            post = self.jsonAttributes()
+            JSONSerializer._jsonAttributesByClass[cls] = post
+            return post
+
     def _getJSONDict(self, includeVersion=False):
         '''Return a dictionary representation for JSON processing. All component objects are similarly encoded as dictionaries. This method is recursively called as needed to store dictionaries of component objects that are :class:`~music21.base.JSONSerializer` subclasses.
 
+        Attributes not yet decoded after lazy decoding are stored from their undecoded dictionaries. 
+
         >>> from music21 import *
         >>> t = metadata.Text('my text')
         >>> t.language = 'en'
@@ -1133,41 +1160,48 @@ class JSONSerializer(object):
         if includeVersion:
             src['__version__'] = VERSION
 
+        selfDict = self.__dict__
+        pending = selfDict.get('_jsonPending')
+
         # flat data attributes
         flatData = {}
-        for attr in self.jsonAttributes():
+        for attr in self._getJSONAttributes():
             #environLocal.printDebug(['_getJSON', attr])
+            if pending and attr not in selfDict and attr in pending:
+                flatData[attr] = pending[attr][0]
+                continue
             attrValue = getattr(self, attr)
             # do not store None values; assume initial/unset state
             if attrValue is None:
                 continue
 
             # if, stored on this object, is an object w/ a json method
-            if hasattr(attrValue, 'json'):
+            if isinstance(attrValue, JSONSerializer):
                 flatData[attr] = attrValue._getJSONDict()
 
             # handle lists; look for objects that have json attributes
             elif isinstance(attrValue, (list, tuple)):
-                flatData[attr] = []
+                subList = []
                 for attrValueSub in attrValue:
-                    if hasattr(attrValueSub, 'json'):
-                        flatData[attr].append(attrValueSub._getJSONDict())
+                    if isinstance(attrValueSub, JSONSerializer):
+                        subList.append(attrValueSub._getJSONDict())
                     else: # just store normal data
-                        flatData[attr].append(attrValueSub)
+                        subList.append(attrValueSub)
+                flatData[attr] = subList
 
             # handle dictionaries; look for objects that have json attributes
             elif isinstance(attrValue, dict):
-                flatData[attr] = {}
-                for key in attrValue.keys():
-                    attrValueSub = attrValue[key]
+                subDict = {}
+                for key, attrValueSub in attrValue.iteritems():
                     # skip None values for efficiency
                     if attrValueSub is None:
                         continue
                     # see if this object stores a json object or otherwise
-                    if hasattr(attrValueSub, 'json'):
-                        flatData[attr][key] = attrValueSub._getJSONDict()
+                    if isinstance(attrValueSub, JSONSerializer):
+                        subDict[key] = attrValueSub._getJSONDict()
                     else: # just store normal data
-                        flatData[attr][key] = attrValueSub
+                        subDict[key] = attrValueSub
+                flatData[attr] = subDict
             else:
                 flatData[attr] = attrValue
         src['__attr__'] = flatData
@@ -1185,18 +1219,93 @@ class JSONSerializer(object):
         '''Return a boolean if the provided object is a dictionary that defines a __class__ key, the necessary conditions to try to instantiate a component object with the jsonComponentFactory method.
         '''
         # on export, check for attribute
-        if isinstance(target, dict) and '__class__' in target.keys():
+        if isinstance(target, dict) and '__class__' in target:
             return True
         return False
 
-    def _buildComponent(self, src):
+    def _hasComponent(self, attrValue):
+        '''Return True if this undecoded attribute value is, or directly contains, a component object definition.
+        '''
+        if isinstance(attrValue, dict):
+            if '__class__' in attrValue:
+                return True
+            values = attrValue.itervalues()
+        elif isinstance(attrValue, (list, tuple)):
+            values = attrValue
+        else:
+            return False
+        for attrValueSub in values:
+            if self._isComponent(attrValueSub):
+                return True
+        return False
+
+    def _buildComponent(self, src, lazy=False):
         # get instance from subclass overridden method
         obj = self.jsonComponentFactory(src['__class__'])
-        # assign dictionary (property takes dictionary or string)
-        obj.json = src
+        # assign dictionary 
+        obj._setJSON(src, lazy=lazy)
         return obj
 
-    def _setJSON(self, jsonStr):
+    def _setJSONAttr(self, key, attrValue, lazy=False):
+        '''Set a single attribute from its undecoded JSON value, building component objects as necessary.
+        '''
+        if attrValue == None or isinstance(attrValue, 
+            (int, float)):
+            setattr(self, key, attrValue)
+
+        # handle a list or tuple, looking for dicts that define objs
+        elif isinstance(attrValue, (list, tuple)):
+            subList = []
+            for attrValueSub in attrValue:
+                if self._isComponent(attrValueSub):
+                    subList.append(
+                        self._buildComponent(attrValueSub, lazy))
+                else:
+                    subList.append(attrValueSub)
+            setattr(self, key, subList)
+
+        # handle a dictionary, looking for dicts that define objs
+        elif isinstance(attrValue, dict):
+            # could be a data dict or a dict of objects; 
+            # if an object, will have a __class__ key
+            if self._isComponent(attrValue):
+                setattr(self, key, self._buildComponent(attrValue, lazy))
+            # its a data dictionary; could contain objects as
+            # dictionaries, or flat data                           
+            else:
+                subDict = {}
+                for subKey in attrValue.keys():
+                    # this could be flat data or a obj definition
+                    # in a dictionary
+                    attrValueSub = attrValue[subKey]
+                    # if a dictionary, and defines a __class__, 
+                    # create an object
+                    if self._isComponent(attrValueSub):
+                        subDict[subKey] = self._buildComponent(
+                            attrValueSub, lazy)
+                    else:
+                        subDict[subKey] = attrValueSub
+                #setattr(self, key, subDict)
+                dst = getattr(self, key)
+                # updating the dictionary preserves default 
+                # values created at init
+                dst.update(subDict) 
+        else: # assume a string
+            setattr(self, key, attrValue)
+
+    def _jsonDecodePending(self, name):
+        '''Decode and return an attribute left undecoded by lazy decoding. Raise AttributeError if there is no such attribute. Subclasses that set _jsonLazy to True must call this from __getattr__. 
+        '''
+        pending = self.__dict__.get('_jsonPending')
+        if not pending or name not in pending:
+            raise AttributeError(name)
+        attrValue, default = pending.pop(name)
+        if default is not None:
+            self.__dict__[name] = default
+        self._setJSONAttr(name, attrValue, lazy=True)
+        return self.__dict__[name]
+
+    def _setJSON(self, jsonStr, lazy=False):
         '''Set this object based on a JSON string or instantiated dictionary representation.
 
         >>> from music21 import *
@@ -1208,6 +1317,18 @@ class JSONSerializer(object):
         'my text'
         >>> t.language
         'en'
+
+        If `lazy` is True, and the class permits it, attributes that contain component objects are not decoded until first accessed. Component objects are similarly decoded lazily.
+
+        >>> md = metadata.Metadata(title='Third Symphony', composer='Beethoven')
+        >>> mdNew = metadata.Metadata()
+        >>> mdNew._setJSON(md.json, lazy=True)
+        >>> sorted(mdNew._jsonPending.keys())
+        ['_contributors', '_workIds']
+        >>> mdNew.composer
+        'Beethoven'
+        >>> sorted(mdNew._jsonPending.keys())
+        ['_workIds']
         '''
         #environLocal.printDebug(['_setJSON: srcStr', jsonStr])
         if isinstance(jsonStr, dict):
@@ -1215,6 +1336,9 @@ class JSONSerializer(object):
         else:
             d = json.loads(jsonStr)
 
+        # components of this object may be lazy even if this object is not
+        defer = lazy and self._jsonLazy
+        cls = self.__class__
         for attr in d.keys():
             #environLocal.printDebug(['_setJSON: attr', attr, d[attr]])
             if attr == '__class__':
@@ -1222,53 +1346,18 @@ class JSONSerializer(object):
             elif attr == '__version__':
                 pass
             elif attr == '__attr__':
-                for key in d[attr].keys():
-                    attrValue = d[attr][key]
-
-                    if attrValue == None or isinstance(attrValue, 
-                        (int, float)):
-                        setattr(self, key, attrValue)
-
-                    # handle a list or tuple, looking for dicts that define objs
-                    elif isinstance(attrValue, (list, tuple)):
-                        subList = []
-                        for attrValueSub in attrValue:
-                            if self._isComponent(attrValueSub):
-                                subList.append(
-                                    self._buildComponent(attrValueSub))
-                            else:
-                                subList.append(attrValueSub)
-                        setattr(self, key, subList)
-
-                    # handle a dictionary, looking for dicts that define objs
-                    elif isinstance(attrValue, dict):
-                        # could be a data dict or a dict of objects; 
-                        # if an object, will have a __class__ key
-                        if self._isComponent(attrValue):
-                            setattr(self, key, self._buildComponent(attrValue))
-                        # its a data dictionary; could contain objects as
-                        # dictionaries, or flat data                           
-                        else:
-                            subDict = {}
-                            for subKey in attrValue.keys():
-                                # this could be flat data or a obj definition
-                                # in a dictionary
-                                attrValueSub = attrValue[subKey]
-                                # if a dictionary, and defines a __class__, 
-                                # create an object
-                                if self._isComponent(attrValueSub):
-                                    subDict[subKey] = self._buildComponent(
-                                        attrValueSub)
-                                else:
-                                    subDict[subKey] = attrValueSub
-                            #setattr(self, key, subDict)
-                            dst = getattr(self, key)
-                            # updating the dictionary preserves default 
-                            # values created at init
-                            dst.update(subDict) 
-                    else: # assume a string
-                        setattr(self, key, attrValue)
-
+                for key, attrValue in d[attr].iteritems():
+                    # attributes defined on the class, such as properties,
+                    # cannot be deferred
+                    if (defer and not hasattr(cls, key) and 
+                        self._hasComponent(attrValue)):
+                        if '_jsonPending' not in self.__dict__:
+                            self._jsonPending = {}
+                        # store any default value to be updated when decoded
+                        default = self.__dict__.pop(key, None)
+                        self._jsonPending[str(key)] = (attrValue, default)
+                    else:
+                        self._setJSONAttr(key, attrValue, lazy)
             else:
                 raise JSONSerializerException('cannot handle json attr: %s'% attr)
 
@@ -1294,11 +1383,13 @@ class JSONSerializer(object):
             sort_keys=True, indent=2))
         f.close()
 
-    def jsonRead(self, fp):
+    def jsonRead(self, fp, lazy=False):
         '''Given a file path, read JSON from a file to this object. Default file extension should be .json. File is opened and closed within this method call. 
+
+        If `lazy` is True, component objects that permit it are not decoded until their attributes are first accessed.
         '''
         f = open(fp)
-        self.json = f.read()
+        self._setJSON(f.read(), lazy=lazy)
         f.close()
 
 
@@ -378,8 +378,6 @@ class Chord(note.NotRest):
 
         Inversion is either 0 (for symmetrical) or -1/1
 
-        NOTE: time consuming, and only should be run when necessary.
-
         >>> from music21 import *
         >>> c1 = chord.Chord(['c3'])
         >>> c1.orderedPitchClasses
@@ -407,61 +405,10 @@ class Chord(note.NotRest):
         >>> c1.seekChordTablesAddress()
         (3, 1, 0)
         '''
-        pcSet = self._getOrderedPitchClasses()   
-        if len(pcSet) == 0:
-            raise ChordException('cannot access chord tables address for Chord with %s pitches' % len(pcSet))
-
-        #environLocal.printDebug(['calling seekChordTablesAddress:', pcSet])
-
-        card = len(pcSet)
-        if card == 1: # its a singleton: return
-            return (1,1,0)
-        elif card == 11: # its the only 11 note pcset
-            return (11,1,0)
-        elif card == 12: # its the aggregate
-            return (12,1,0)
-        # go through each rotation of pcSet
-        candidates = []
-        for rot in range(0, card):
-            testSet = pcSet[rot:] + pcSet[0:rot]
-            # transpose to lead with zero
-            testSet = [(x-testSet[0]) % 12 for x in testSet]
-            # create inversion; first take difference from 12 mod 12
-            testSetInvert = [(12-x) % 12 for x in testSet]
-            testSetInvert.reverse() # reverse order (first steps now last)
-            # transpose all steps (were last) to zero, mod 12
-            testSetInvert = [(x + (12 - testSetInvert[0])) % 12 
-                            for x in testSetInvert]
-            candidates.append([testSet, testSetInvert]) 
-
-        # compare sets to those in table
-        match = False
-        for indexCandidate in range(len(chordTables.FORTE[card])):
-            dataLine = chordTables.FORTE[card][indexCandidate]
-            if dataLine == None: continue # spacer lines
-            inversionsAvailable = chordTables.forteIndexToInversionsAvailable(
-                                  card, indexCandidate)
-
-            for candidate, candidateInversion in candidates:
-                #environLocal.printDebug([candidate])
-                # need to only match form
-                if dataLine[0] == tuple(candidate): # must compare to tuple
-                    if 0 in inversionsAvailable:
-                        index, inversion = indexCandidate, 0
-                    else:
-                        index, inversion = indexCandidate, 1
-                    match = True
-                    break
-                elif dataLine[0] == tuple(candidateInversion):
-                    if 0 in inversionsAvailable:
-                        index, inversion = indexCandidate, 0
-                    else:
-                        index, inversion = indexCandidate, -1
-                    match = True
-                    break
-        if not match:
-            raise ChordException('cannot find a chord table address for %s' % pcSet)
-        return (card, index, inversion)                
+        mask = self._getPitchClassMask()
+        if mask == 0:
+            raise ChordException('cannot access chord tables address for Chord with 0 pitches')
+        return chordTables.pitchClassMaskToAddress(mask)
 
 
     def _updateChordTablesAddress(self):
@@ -1602,10 +1549,21 @@ class Chord(note.NotRest):
     def _getPitchClasses(self):
         '''Return a pitch class representation ordered as the original chord.
         '''
-        pcGroup = []
-        for p in self.pitches:
-            pcGroup.append(p.pitchClass)
-        return pcGroup            
+        return [p.pitchClass for p in self._pitches]
+
+    def _getPitchClassMask(self):
+        '''Return the pitch class set as a 12-bit integer mask, where bit n is set if pitch class n is present. 
+
+        As Pitch objects may be altered in place, this is not cached.
+
+        >>> from music21 import *
+        >>> chord.Chord(['c4', 'e4', 'g4', 'c5'])._getPitchClassMask()
+        145
+        '''
+        mask = 0
+        for p in self._pitches:
+            mask |= 1 << p.pitchClass
+        return mask
         
     pitchClasses = property(_getPitchClasses, 
         doc = '''Return a list of all pitch classes in the chord as integers.
@@ -1620,7 +1578,7 @@ class Chord(note.NotRest):
     def _getMultisetCardinality(self):
         '''Return the number of pitches, regardless of redundancy.
         '''            
-        return len(self._getPitchClasses())
+        return len(self._pitches)
 
     multisetCardinality = property(_getMultisetCardinality, 
         doc = '''Return an integer representing the cardinality of the mutliset, or the number of pitch values. 
@@ -1637,12 +1595,8 @@ class Chord(note.NotRest):
 
         This is a traditional pitch class set.
         '''
-        pcGroup = []
-        for p in self.pitches:
-            if p.pitchClass in pcGroup: continue
-            pcGroup.append(p.pitchClass)
-        pcGroup.sort()
-        return pcGroup            
+        return list(chordTables.pitchClassMaskToPitchClasses(
+                    self._getPitchClassMask()))
         
     orderedPitchClasses = property(_getOrderedPitchClasses, 
         doc = '''Return an list of pitch class integers, ordered form lowest to highest. 
@@ -1671,7 +1625,8 @@ class Chord(note.NotRest):
     def _getPitchClassCardinality(self):
         '''Return the number of unique pitch classes
         '''            
-        return len(self._getOrderedPitchClasses())
+        return len(chordTables.pitchClassMaskToPitchClasses(
+                   self._getPitchClassMask()))
 
     pitchClassCardinality = property(_getPitchClassCardinality, 
         doc = '''Return a the cardinality of pitch classes, or the number of unique pitch classes, in the Chord.
@@ -1965,18 +1920,20 @@ class Chord(note.NotRest):
         True
         >>> c1.areZRelations(c3)
         False
+
+        Z-relations are found between TnI set classes, so inversions of a Z-related set are also Z-related.
+
+        >>> c4 = chord.Chord(["C", "f", "a", "b"])
+        >>> c1.areZRelations(c4)
+        True
         '''
         self._updateChordTablesAddress()
-        post = chordTables.addressToZAddress(self._chordTablesAddress)
-        if post == None:
+        zRelationAddress = chordTables.addressToZAddress(
+            self._chordTablesAddress)
+        if zRelationAddress == None:
             return False
-        else: # check of other is a z relation
-            zRelationAddress = chordTables.addressToZAddress(
-                self._chordTablesAddress)
-            if other.chordTablesAddress == zRelationAddress:
-                return True
-            else:
-                return False
+        # check if other is a z relation
+        return other.chordTablesAddress[:2] == zRelationAddress[:2]
 
     def _getCommonName(self):
         '''Get the common name of the TN set class.
@@ -127,7 +127,7 @@ t33 = ((0,2,4,6,8), (0,4,0,4,0,2), (1,1,1,1,6,6,6,6), 0 ) #5-33
 t34 = ((0,2,4,6,9), (0,3,2,2,2,1), (1,1,0,0,2,2,0,0), 0 ) #5-34 
 t35 = ((0,2,4,7,9), (0,3,2,1,4,0), (1,1,0,0,3,3,0,0), 0 ) #5-35    
 t36 = ((0,1,2,4,7), (2,2,2,1,2,1), (1,0,0,1,0,1,1,0), 12) #5-36
-t37 = ((0,3,4,5,8), (2,1,2,2,2,0), (1,1,0,0,1,1,2,2), 17) #5-37
+t37 = ((0,3,4,5,8), (2,1,2,3,2,0), (1,1,0,0,1,1,2,2), 17) #5-37
 t38 = ((0,1,2,5,8), (2,1,2,2,2,1), (1,0,0,0,0,1,1,0), 18) #5-38
 pentachord = (None, t1, t2, t3, t4, t5, t6, t7, t8, t9,    
 t10, t11, t12, t13, t14, t15, t16, t17, t18, t19,   
@@ -2682,6 +2682,151 @@ def addressToForteName(address, classification='tn'):
     return '%s-%s%s' % (card, index, iStr)
 
 
+#-------------------------------------------------------------------------------
+# pitch class sets as 12-bit integer masks, where bit n is set if pitch 
+# class n is present; transposition is a rotation of the bits, and all 
+# other set class data is found through the TN address of the mask
+
+def pitchClassesToMask(pcSet):
+    '''Given a list of pitch class integers, return the pitch class set as a 12-bit integer mask. Redundant pitch classes are ignored.
+
+    >>> pitchClassesToMask([0, 4, 7])
+    145
+    >>> pitchClassesToMask([7, 4, 0, 12])
+    145
+    '''
+    mask = 0
+    for pc in pcSet:
+        mask |= 1 << (pc % 12)
+    return mask
+
+
+# a list, indexed by mask, of the ordered pitch classes and the inversion of 
+# every pitch class set; these are filled when first needed
+_pitchClassMaskToPitchClasses = []
+_pitchClassMaskToInversion = []
+
+def _buildPitchClassMaskTables():
+    for mask in range(4096):
+        pcSet = tuple([pc for pc in range(12) if mask & (1 << pc)])
+        _pitchClassMaskToPitchClasses.append(pcSet)
+        inversion = 0
+        for pc in pcSet:
+            inversion |= 1 << ((12 - pc) % 12)
+        _pitchClassMaskToInversion.append(inversion)
+
+def pitchClassMaskToPitchClasses(mask):
+    '''Given a pitch class set as a 12-bit integer mask, return a tuple of the pitch classes present, ordered from lowest to highest.
+
+    >>> pitchClassMaskToPitchClasses(145)
+    (0, 4, 7)
+    >>> pitchClassMaskToPitchClasses(0)
+    ()
+    '''
+    if len(_pitchClassMaskToPitchClasses) == 0:
+        _buildPitchClassMaskTables()
+    return _pitchClassMaskToPitchClasses[mask]
+
+def transposePitchClassMask(mask, n):
+    '''Transpose a pitch class set mask by `n` semitones (Tn). 
+
+    >>> pitchClassMaskToPitchClasses(transposePitchClassMask(145, 2))
+    (2, 6, 9)
+    >>> pitchClassMaskToPitchClasses(transposePitchClassMask(145, -1))
+    (3, 6, 11)
+    '''
+    n = n % 12
+    return ((mask << n) | (mask >> (12 - n))) & 0xFFF
+
+def invertPitchClassMask(mask, n=0):
+    '''Invert a pitch class set mask and transpose it by `n` semitones (TnI).
+
+    >>> pitchClassMaskToPitchClasses(invertPitchClassMask(145))
+    (0, 5, 8)
+    >>> pitchClassMaskToPitchClasses(invertPitchClassMask(145, 7))
+    (0, 3, 7)
+    '''
+    if len(_pitchClassMaskToInversion) == 0:
+        _buildPitchClassMaskTables()
+    return transposePitchClassMask(_pitchClassMaskToInversion[mask], n)
+
+
+# a dictionary of all non-empty pitch class sets, as 12-bit integer masks, 
+# to TN addresses; this is filled when first needed
+_pitchClassMaskToAddress = {}
+
+def _buildPitchClassMaskToAddress():
+    '''Fill the dictionary of pitch class set masks to TN addresses with all transpositions of each prime form and its inversion.
+    '''
+    for card in range(1, 13):
+        for index in range(1, len(FORTE[card])):
+            primeForm = FORTE[card][index][0]
+            if 0 in forteIndexToInversionsAvailable(card, index):
+                forms = [(primeForm, 0)]
+            else:
+                forms = [(primeForm, 1), 
+                         ([(12 - pc) % 12 for pc in primeForm], -1)]
+            for pcSet, inversion in forms:
+                for t in range(12):
+                    mask = 0
+                    for pc in pcSet:
+                        mask |= 1 << ((pc + t) % 12)
+                    _pitchClassMaskToAddress[mask] = (card, index, inversion)
+
+def pitchClassMaskToAddress(mask):
+    '''Given a pitch class set as a 12-bit integer mask, where bit n is set if pitch class n is present, return the TN address.
+
+    >>> pitchClassMaskToAddress(1) # C
+    (1, 1, 0)
+    >>> pitchClassMaskToAddress(1 | 1 << 4 | 1 << 7) # C E G
+    (3, 11, -1)
+    >>> pitchClassMaskToAddress(1 << 2 | 1 << 5 | 1 << 9) # D F A
+    (3, 11, 1)
+    >>> pitchClassMaskToAddress(0)
+    Traceback (most recent call last):
+    ChordTablesException: cannot find a chord table address for pitch class mask 0
+    '''
+    if len(_pitchClassMaskToAddress) == 0:
+        _buildPitchClassMaskToAddress()
+    try:
+        return _pitchClassMaskToAddress[mask]
+    except KeyError:
+        raise ChordTablesException('cannot find a chord table address for pitch class mask %s' % mask)
+
+def pitchClassMaskToIntervalVector(mask):
+    '''Given a pitch class set as a 12-bit integer mask, return the interval vector.
+
+    >>> pitchClassMaskToIntervalVector(145)
+    (0, 0, 1, 1, 1, 0)
+    '''
+    return addressToIntervalVector(pitchClassMaskToAddress(mask))
+
+def pitchClassMaskToPrimeForm(mask):
+    '''Given a pitch class set as a 12-bit integer mask, return the prime form.
+
+    >>> pitchClassMaskToPrimeForm(145)
+    (0, 3, 7)
+    '''
+    return addressToPrimeForm(pitchClassMaskToAddress(mask))
+
+def pitchClassMasksAreZRelations(maskA, maskB):
+    '''Return True if the two pitch class set masks are Z-related: they share an interval vector but are not members of the same TnI set class.
+
+    >>> pitchClassMasksAreZRelations(pitchClassesToMask([0,1,4,6]), 
+    ...     pitchClassesToMask([0,1,3,7]))
+    True
+    >>> pitchClassMasksAreZRelations(pitchClassesToMask([0,1,4,6]), 
+    ...     pitchClassesToMask([0,2,5,6]))
+    False
+    '''
+    zAddress = addressToZAddress(pitchClassMaskToAddress(maskA))
+    if zAddress == None:
+        return False
+    addressB = pitchClassMaskToAddress(maskB)
+    # Z-relations are found between TnI set classes
+    return zAddress[:2] == addressB[:2]
+
+
 
 #-------------------------------------------------------------------------------
 class Test(unittest.TestCase):
@@ -2729,6 +2874,48 @@ class Test(unittest.TestCase):
             # must subtract one b/c all groups contain a zero set to pad
             # index values
             self.assertEqual(len(FORTE[setSize])-1, setCount)
+
+    def testPitchClassMaskToAddress(self):
+        pitchClassMaskToAddress(1)
+        self.assertEqual(len(_pitchClassMaskToAddress), 4095)
+        for mask, address in _pitchClassMaskToAddress.items():
+            pcSet = [pc for pc in range(12) if mask & (1 << pc)]
+            self.assertEqual(address[0], len(pcSet))
+            # the normal form is a transposition of the set
+            normalForm = addressToNormalForm(address)
+            match = False
+            for t in range(12):
+                if sorted([(pc + t) % 12 for pc in normalForm]) == pcSet:
+                    match = True
+                    break
+            self.assertEqual(match, True)
+
+    def testPitchClassMaskTransforms(self):
+        for mask in range(1, 4096):
+            pcSet = pitchClassMaskToPitchClasses(mask)
+            self.assertEqual(pitchClassesToMask(pcSet), mask)
+            address = pitchClassMaskToAddress(mask)
+            for n in range(12):
+                # Tn does not change the TN address
+                maskTn = transposePitchClassMask(mask, n)
+                self.assertEqual(maskTn, pitchClassesToMask(
+                    [pc + n for pc in pcSet]))
+                self.assertEqual(pitchClassMaskToAddress(maskTn), address)
+                # TnI preserves the TnI class but swaps TN inversions
+                maskTnI = invertPitchClassMask(mask, n)
+                self.assertEqual(maskTnI, pitchClassesToMask(
+                    [n - pc for pc in pcSet]))
+                self.assertEqual(pitchClassMaskToAddress(maskTnI), 
+                    (address[0], address[1], -address[2]))
+            # z-related sets share an interval vector
+            zAddress = addressToZAddress(address)
+            if zAddress != None:
+                zMask = pitchClassesToMask(addressToPrimeForm(zAddress))
+                self.assertEqual(pitchClassMasksAreZRelations(mask, zMask), 
+                                 True)
+                self.assertEqual(pitchClassMaskToIntervalVector(mask), 
+                                 pitchClassMaskToIntervalVector(zMask))
+            self.assertEqual(pitchClassMasksAreZRelations(mask, mask), False)
         
 
 
@@ -1176,6 +1176,80 @@ class defList(list):
 
 
 
+class LRUCache(object):
+    '''A mapping that stores at most `maxSize` items; when full, adding an item discards the least recently used item.
+
+    >>> from music21 import *
+    >>> c = common.LRUCache(2)
+    >>> c['a'] = 1
+    >>> c['b'] = 2
+    >>> c.get('a')
+    1
+    >>> c['c'] = 3 # discards 'b', the least recently used
+    >>> 'b' in c, 'a' in c, len(c)
+    (False, True, 2)
+    >>> c.get('b') == None
+    True
+    '''
+    def __init__(self, maxSize=256):
+        self.maxSize = maxSize
+        # keys map to links of a circular, doubly linked list ordered from
+        # least to most recently used; each link is [prev, next, key, value]
+        self._data = {}
+        self._root = []
+        self._root[:] = [self._root, self._root, None, None]
+
+    def get(self, key, default=None):
+        # NOTE: this is performance critical method
+        try:
+            link = self._data[key]
+        except KeyError:
+            return default
+        # move to most recently used
+        prevLink, nextLink = link[0], link[1]
+        prevLink[1] = nextLink
+        nextLink[0] = prevLink
+        root = self._root
+        last = root[0]
+        last[1] = root[0] = link
+        link[0] = last
+        link[1] = root
+        return link[3]
+
+    def __getitem__(self, key):
+        value = self.get(key, self)
+        if value is self:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._data:
+            self.get(key)
+            self._data[key][3] = value
+            return
+        root = self._root
+        if len(self._data) >= self.maxSize:
+            # discard the least recently used
+            first = root[1]
+            root[1] = first[1]
+            first[1][0] = root
+            del self._data[first[2]]
+        last = root[0]
+        link = [last, root, key, value]
+        last[1] = root[0] = link
+        self._data[key] = link
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        self._data.clear()
+        self._root[:] = [self._root, self._root, None, None]
+
+
 
 # this presently is not used anywhere in music21
 
@@ -1518,6 +1592,22 @@ class Test(unittest.TestCase):
             self.assertEqual(dst, toRoman(src))
 
 
+    def testLRUCache(self):
+        c = LRUCache(3)
+        for key in ['a', 'b', 'c']:
+            c[key] = key.upper()
+        self.assertEqual(c['a'], 'A') # 'b' is now least recently used
+        c['b'] = 'B2' # replacing a value marks it as used
+        c['d'] = 'D' # discards 'c'
+        self.assertEqual(['c' in c, len(c)], [False, 3])
+        self.assertEqual([c.get('a'), c.get('b'), c.get('d')], ['A', 'B2', 'D'])
+        self.assertRaises(KeyError, c.__getitem__, 'c')
+        c.clear()
+        self.assertEqual(len(c), 0)
+        c['e'] = 'E'
+        self.assertEqual(c['e'], 'E')
+
+
     def testGettingAttributes(self):
         a = TestMock()
         # dir() returns all names, including properties, attributes, methods
@@ -525,11 +525,15 @@ class ConverterMidi(object):
 #-------------------------------------------------------------------------------
 class ConverterABC(object):
     '''Simple class wrapper for parsing ABC.
+
+    If `parallel` is True or an integer number of processes, files that define multiple works will be translated in parallel, with works given to each worker process in groups of `chunkSize`. See :func:`~music21.abc.translate.abcToStreamOpus`. 
     '''
 
-    def __init__(self):
+    def __init__(self, parallel=False, chunkSize=1):
         # always create a score instance
         self._stream = stream.Score()
+        self.parallel = parallel
+        self.chunkSize = chunkSize
 
     def parseData(self, strData, number=None):
         '''Get ABC data, as token list, from a string representation. If more than one work is defined in the ABC data, a  :class:`~music21.stream.Opus` object will be returned; otherwise, a :class:`~music21.stream.Score` is returned.
@@ -541,7 +545,8 @@ class ConverterABC(object):
         if abcHandler.definesReferenceNumbers():
             # this creates an Opus object, not a Score object
             self._stream = abcTranslate.abcToStreamOpus(abcHandler,
-                number=number)
+                number=number, parallel=self.parallel, 
+                chunkSize=self.chunkSize)
         else: # just one work
             abcTranslate.abcToStreamScore(abcHandler, self._stream)
 
@@ -564,7 +569,8 @@ class ConverterABC(object):
             # this creates a Score or Opus object, depending on if a number
             # is given
             self._stream = abcTranslate.abcToStreamOpus(abcHandler,
-                           number=number)
+                           number=number, parallel=self.parallel, 
+                           chunkSize=self.chunkSize)
         # just get a single work
         else: 
             abcTranslate.abcToStreamScore(abcHandler, self._stream)
@@ -658,7 +664,8 @@ class Converter(object):
     def __init__(self):
         self._converter = None
 
-    def _setConverter(self, format, forceSource=False):
+    def _setConverter(self, format, forceSource=False, parallel=False, 
+        chunkSize=1):
         # assume for now tt pickled files are alwasy musicxml
         # this may change in the future
         if format in ['musicxml', 'pickle']: 
@@ -670,7 +677,8 @@ class Converter(object):
         elif format == 'tinyNotation':
             self._converter = ConverterTinyNotation()
         elif format == 'abc':
-            self._converter = ConverterABC()
+            self._converter = ConverterABC(parallel=parallel, 
+                                           chunkSize=chunkSize)
         elif format == 'musedata':
             self._converter = ConverterMuseData()
         else:
@@ -681,8 +689,11 @@ class Converter(object):
             raise ValueError
         return os.path.join(dir, 'm21-' + common.getMd5(url) + ext)
 
-    def parseFile(self, fp, number=None, forceSource=False):
+    def parseFile(self, fp, number=None, forceSource=False, parallel=False, 
+        chunkSize=1):
         '''Given a file path, parse and store a music21 Stream.
+
+        The `parallel` and `chunkSize` arguments are passed to converters that support translating multiple works in parallel.
         '''
 
         #environLocal.printDebug(['attempting to parseFile', fp])
@@ -695,7 +706,8 @@ class Converter(object):
             format = 'musedata'
         else:
             format = common.findFormatFile(fp) 
-        self._setConverter(format, forceSource=forceSource)
+        self._setConverter(format, forceSource=forceSource, 
+            parallel=parallel, chunkSize=chunkSize)
         self._converter.parseFile(fp, number=number)
 
     def parseData(self, dataStr, number=None, forceSource=False):
@@ -727,11 +739,21 @@ class Converter(object):
         self._converter.parseData(dataStr, number=number)
 
 
-    def parseURL(self, url, number=None):
+    def parseURL(self, url, number=None, parallel=False, chunkSize=1):
         '''Given a url, download and parse the file into a music21 Stream.
 
-        Note that this checks the user Environment `autoDownlaad` setting before downloading. 
+        Note that this checks the user Environment `autoDownlaad` setting before downloading. Files of the virtual corpus stored in the local mirror (see :func:`~music21.corpus.virtual.getMirror`) are used without downloading.
         '''
+        from music21.corpus import virtual
+        fp = virtual.getMirror().getPath(url)
+        if fp is not None:
+            environLocal.printDebug(['using mirrored file:', fp])
+            format = common.findFormatFile(fp) 
+            self._setConverter(format, forceSource=False, parallel=parallel, 
+                chunkSize=chunkSize)
+            self._converter.parseFile(fp, number=number)
+            return
+
         autoDownload = environLocal['autoDownload']
         if autoDownload == 'allow':
             pass
@@ -759,7 +781,8 @@ class Converter(object):
 
         # update format based on downloaded fp
         format = common.findFormatFile(fp) 
-        self._setConverter(format, forceSource=False)
+        self._setConverter(format, forceSource=False, parallel=parallel, 
+            chunkSize=chunkSize)
         self._converter.parseFile(fp, number=number)
 
 
@@ -782,11 +805,13 @@ class Converter(object):
 # module level convenience methods
 
 
-def parseFile(fp, number=None, forceSource=False):
+def parseFile(fp, number=None, forceSource=False, parallel=False, 
+    chunkSize=1):
     '''Given a file path, attempt to parse the file into a Stream.
     '''
     v = Converter()
-    v.parseFile(fp, number=number, forceSource=forceSource)
+    v.parseFile(fp, number=number, forceSource=forceSource, 
+        parallel=parallel, chunkSize=chunkSize)
     return v.stream
 
 def parseData(dataStr, number=None):
@@ -798,16 +823,19 @@ def parseData(dataStr, number=None):
     v.parseData(dataStr, number=number)
     return v.stream
 
-def parseURL(url, number=None, forceSource=False):
+def parseURL(url, number=None, forceSource=False, parallel=False, 
+    chunkSize=1):
     '''Given a URL, attempt to download and parse the file into a Stream. Note: URL downloading will not happen automatically unless the user has set their Environment "autoDownload" preference to "allow". 
     '''
     v = Converter()
-    v.parseURL(url)
+    v.parseURL(url, parallel=parallel, chunkSize=chunkSize)
     return v.stream
 
 def parse(value, *args, **keywords):
     '''Given a file path, encoded data in a Python string, or a URL, attempt to parse the item into a Stream. Note: URL downloading will not happen automatically unless the user has set their Environment "autoDownload" preference to "allow". 
 
+    For ABC files that define many works, a `parallel` keyword argument (True or a number of processes) translates works in a process pool, giving each process `chunkSize` works at a time.
+
     >>> from music21 import *
     >>> s = converter.parse(["E4 r f# g=lastG trip{b-8 a g} c", "3/4"])
     >>> s.getElementsByClass(meter.TimeSignature)[0]
@@ -839,6 +867,17 @@ def parse(value, *args, **keywords):
     else:   
         number = None
 
+    # for multi-work collections, translate works in a process pool
+    if 'parallel' in keywords.keys():
+        parallel = keywords['parallel']
+    else:   
+        parallel = False
+
+    if 'chunkSize' in keywords.keys():
+        chunkSize = keywords['chunkSize']
+    else:   
+        chunkSize = 1
+
     if common.isListLike(value) or len(args) > 0: # tiny notation list
         if len(args) > 0: # add additional args to a lost
             value = [value] + list(args)
@@ -847,10 +886,12 @@ def parse(value, *args, **keywords):
     elif value.startswith('MThd'):
         return parseData(value, number=number)
     elif os.path.exists(value):
-        return parseFile(value, number=number, forceSource=forceSource)
+        return parseFile(value, number=number, forceSource=forceSource, 
+            parallel=parallel, chunkSize=chunkSize)
     elif value.startswith('http://'): 
         # its a url; may need to broaden these criteria
-        return parseURL(value, number=number, forceSource=forceSource)
+        return parseURL(value, number=number, forceSource=forceSource, 
+            parallel=parallel, chunkSize=chunkSize)
     else:
         return parseData(value, number=number)
 
@@ -1393,6 +1434,12 @@ class Test(unittest.TestCase):
         self.assertEqual([len(s.flat.notes) for s in op], [33, 51, 59, 33, 29, 174, 67, 88])
         #op.show()
 
+        # translate works in parallel
+        op = parse(corpus.getWork('essenFolksong/teste'), parallel=True, 
+            chunkSize=2)
+        self.assertEqual(isinstance(op, stream.Opus), True)
+        self.assertEqual([len(s.flat.notes) for s in op], [33, 51, 59, 33, 29, 174, 67, 88])
+
         # get one work from the opus
         s = corpus.parseWork('essenFolksong/teste', number=6)
         self.assertEqual(isinstance(s, stream.Score), True)
@@ -19,6 +19,7 @@ To see complete listing of works in the music21 corpus, visit  :ref:`referenceCo
 
 import re
 import os
+import json
 import doctest, unittest
 
 import music21
@@ -110,6 +111,18 @@ MODULES = [
 # data is loaded on demand. 
 _METADATA_BUNDLES = {'core':None, 'virtual':None, 'local':None}
 
+# the corpus manifest stores, for each corpus module directory, a list of 
+# the directory's modification time and its listing; it is loaded on demand, 
+# checked against directory modification times when used, and stored as JSON
+# in the scratch directory
+_CORPUS_MANIFEST = None
+_CORPUS_MANIFEST_NAME = 'music21-corpus-manifest.json'
+# all corpus file paths found with the manifest, in listing order
+_CORPUS_PATHS = []
+# results of getPaths(), getComposer(), and getWorkList(), stored by 
+# arguments; cleared whenever the manifest changes
+_CORPUS_LOOKUPS = {}
+
 _ALL_EXTENSIONS = (common.findInputExtension('abc') +
                    common.findInputExtension('lily') +
                    common.findInputExtension('musicxml') +
@@ -136,9 +149,10 @@ COMPOSERS = [
 VIRTUAL = []
 for name in dir(virtual): # look over virtual module
     className = getattr(virtual, name)
-    if callable(className):
+    if isinstance(className, type) and issubclass(className, 
+        virtual.VirtualWork):
         obj = className()
-        if isinstance(obj, virtual.VirtualWork) and obj.corpusPath != None:
+        if obj.corpusPath != None:
             VIRTUAL.append(obj)
 
 
@@ -147,6 +161,83 @@ class CorpusException(Exception):
     pass
 
 
+#-------------------------------------------------------------------------------
+def _getCorpusManifestFilePath():
+    return os.path.join(environLocal.getRootTempDir(), _CORPUS_MANIFEST_NAME)
+
+
+def _updateCorpusManifest():
+    '''Load the corpus manifest if necessary, and update the listing of any corpus directory that has been modified since it was stored. If anything has changed, rebuild the list of all corpus paths and clear stored lookups.
+
+    >>> _updateCorpusManifest()
+    >>> len(_CORPUS_PATHS) > 30
+    True
+    '''
+    global _CORPUS_MANIFEST, _CORPUS_PATHS
+
+    changed = False
+    if _CORPUS_MANIFEST is None:
+        _CORPUS_MANIFEST = {}
+        fpManifest = _getCorpusManifestFilePath()
+        if os.path.exists(fpManifest):
+            try:
+                f = open(fpManifest)
+                stored = json.load(f)
+                f.close()
+                # json returns unicode strings; store paths as str, as 
+                # returned by os.listdir()
+                for dir, (mtime, names) in stored.items():
+                    _CORPUS_MANIFEST[dir.encode('utf-8')] = [mtime, 
+                        [x.encode('utf-8') for x in names]]
+            except (IOError, ValueError):
+                environLocal.printDebug(['cannot read corpus manifest', 
+                                         fpManifest])
+        changed = True
+
+    modified = False
+    for moduleName in MODULES:
+        if not hasattr(moduleName, '__path__'):
+            continue # a list of paths, not a directory
+        dir = moduleName.__path__[0] 
+        mtime = os.path.getmtime(dir)
+        entry = _CORPUS_MANIFEST.get(dir)
+        if entry is None or entry[0] != mtime:
+            _CORPUS_MANIFEST[dir] = [mtime, os.listdir(dir)]
+            modified = True
+    if modified:
+        changed = True
+        try:
+            f = open(_getCorpusManifestFilePath(), 'w')
+            json.dump(_CORPUS_MANIFEST, f)
+            f.close()
+        except IOError:
+            environLocal.printDebug(['cannot write corpus manifest'])
+
+    if not changed:
+        return
+    paths = []
+    found = set()
+    for moduleName in MODULES:
+        if not hasattr(moduleName, '__path__'):
+            # when importing a package name (a directory) the moduleName        
+            # may be a list of all paths contained within the package
+            # this seems to be dependent on the context of the call:
+            # from the command line is different than from the interpreter
+            dirListing = moduleName
+        else:
+            # returns a list with one or more paths
+            # the first is the path to the directory that contains xml files
+            dir = moduleName.__path__[0] 
+            dirListing = [os.path.join(dir, x) for x in 
+                          _CORPUS_MANIFEST[dir][1]]
+        for fp in dirListing:
+            if fp not in found:
+                found.add(fp)
+                paths.append(fp)
+    _CORPUS_PATHS = paths
+    _CORPUS_LOOKUPS.clear()
+
+
 #-------------------------------------------------------------------------------
 def getPaths(extList=None, expandExtensions=True):    
     '''Get all paths in the corpus that match a known extension, or an extenion
@@ -154,6 +245,8 @@ def getPaths(extList=None, expandExtensions=True):
 
     If `expandExtensions` is True, a format for an extension, and related extensions, will replaced by all known input extensions. This is convenient when an input format might match for multiple extensions.
 
+    Paths are found from a manifest of corpus directories that is only updated when a directory is modified; results are stored for each combination of extensions.
+
     >>> a = getPaths()
     >>> len(a) > 30
     True
@@ -179,35 +272,22 @@ def getPaths(extList=None, expandExtensions=True):
         extList = extMod
         
     #environLocal.printDebug(['getting paths with extensions:', extList])
-    paths = []    
-    for moduleName in MODULES:
-        if not hasattr(moduleName, '__path__'):
-            # when importing a package name (a directory) the moduleName        
-            # may be a list of all paths contained within the package
-            # this seems to be dependent on the context of the call:
-            # from the command line is different than from the interpreter
-            dirListing = moduleName
-        else:
-            # returns a list with one or more paths
-            # the first is the path to the directory that contains xml files
-            dir = moduleName.__path__[0] 
-            dirListing = [os.path.join(dir, x) for x in os.listdir(dir)]
-
-        for fp in dirListing:
-            if fp in paths:
-                continue
-            match = False
+    _updateCorpusManifest()
+    lookup = ('getPaths', tuple(extList))
+    if lookup not in _CORPUS_LOOKUPS:
+        paths = []    
+        for fp in _CORPUS_PATHS:
             for ext in extList:
                 if fp.endswith(ext):
-                    match = True
-                    break 
-            if match:
-                if fp not in paths:
                     paths.append(fp)    
-    return paths
+                    break 
+        _CORPUS_LOOKUPS[lookup] = paths
+    return list(_CORPUS_LOOKUPS[lookup])
 
-def getVirtualPaths(extList=None):
+def getVirtualPaths(extList=None, mirrored=False):
     '''Get all paths in the virtual corpus that match a known extension. An extension of None will return all known extensions.
+
+    If `mirrored` is True, only paths stored in the local mirror of the virtual corpus, and thus available without network access, are returned. See :func:`~music21.corpus.base.prefetchVirtual`. 
    
     >>> len(getVirtualPaths()) > 6
     True
@@ -217,6 +297,8 @@ def getVirtualPaths(extList=None):
 
     if extList == [None]:
         extList = _ALL_EXTENSIONS
+    if mirrored:
+        mirror = virtual.getMirror()
     paths = []
     for obj in VIRTUAL:
         if obj.corpusPath != None:
@@ -224,11 +306,34 @@ def getVirtualPaths(extList=None):
                 #environLocal.printDebug([obj.corpusPath, ext])
                 post = obj.getUrlByExt(ext)
                 for part in post:
+                    if mirrored and not mirror.hasUrl(part):
+                        continue
                     if part not in paths:
                         paths.append(part)
     return paths
 
 
+def prefetchVirtual(workNames=None, extList=None, source=None):
+    '''Store the files of virtual works in the local mirror of the virtual corpus, so that they may later be parsed without network access. 
+
+    If `workNames` is None, all virtual works are stored; otherwise, works whose corpus paths contain one of the `workNames` are stored. If `source` is given, files are copied from this local directory, where each is stored under the work's corpus path and the file extension (for example, `bach/bwv1007/prelude.xml`), instead of being downloaded. 
+
+    Stored files are checked against their digests, and damaged files are fetched again. Return a list of the URLs that were added. 
+    '''
+    if workNames is None:
+        works = VIRTUAL
+    else:
+        if not common.isListLike(workNames):
+            workNames = [workNames]
+        works = []
+        for obj in VIRTUAL:
+            for workName in workNames:
+                if workName.lower() in obj.corpusPath.lower():
+                    works.append(obj)
+                    break
+    return virtual.getMirror().prefetch(works, extList, source)
+
+
 def getLocalPaths(extList=None):
     '''
     Access files in additional directories supplied by the user and defined in environement settings. 
@@ -243,7 +348,14 @@ def _updateMetadataBundle():
     for d, f in (('core', getPaths), ('virtual', getVirtualPaths)):
         if _METADATA_BUNDLES[d] == None:
             _METADATA_BUNDLES[d] = metadata.MetadataBundle(d)
-            _METADATA_BUNDLES[d].read()
+            # prefer an sqlite database, which does not need to create 
+            # all Metadata objects before searching
+            fp = os.path.join(common.getMetadataCacheFilePath(), d + '.db')
+            if os.path.exists(fp):
+                _METADATA_BUNDLES[d].readSqlite(fp)
+            else:
+                # components are decoded as needed by each search
+                _METADATA_BUNDLES[d].read(lazy=True)
             # must update access paths for the files found on this system
             _METADATA_BUNDLES[d].updateAccessPaths(f())
 
@@ -279,6 +391,120 @@ def search(query, field=None, domain=['core', 'virtual'], extList=None):
     return post
 
 
+def searchRange(field, minimum=None, maximum=None, domain=['core', 'virtual'], 
+    extList=None):
+    '''Search all stored metadata for numeric or exact values of `field` between `minimum` and `maximum`, inclusive, and return a list of file paths and work numbers. Available fields are 'ambitus' (in half steps), 'noteCount', 'quarterLength', 'keySignatureFirstSharps', 'timeSignatureFirst', and 'date' (the year of the first date). See :meth:`~music21.metadata.MetadataBundle.searchRange`.
+
+    Results of multiple searches can be combined as sets; for example, all 3/4 works with an ambitus under an octave and fewer than 200 notes::
+
+        set(searchRange('timeSignatureFirst', '3/4', '3/4')) & set(searchRange('ambitus', maximum=11)) & set(searchRange('noteCount', maximum=199))
+    '''
+    post = []
+    _updateMetadataBundle()
+    for d in ['core', 'virtual']:
+        if d in domain:
+            post += _METADATA_BUNDLES[d].searchRange(field, minimum, 
+                    maximum, extList)
+    return post
+
+
+def _parseResultPickled(args):
+    '''Parse a single search result and apply an optional transform; used as the worker function of :func:`~music21.corpus.base.searchParse`. Streams are prepared for pickling. Errors are returned as strings, as a failed worker would otherwise never report a result.
+    '''
+    from music21 import stream
+    fp, number, transform = args
+    try:
+        post = converter.parse(fp, number=number)
+        if transform is not None:
+            post = transform(post)
+    except Exception, e:
+        return False, '%s: %s' % (e.__class__.__name__, e)
+    if isinstance(post, stream.Stream):
+        post.setupPickleScaffold()
+    return True, post
+
+
+def _parseResults(results, workers=1, limit=None, transform=None, 
+    maxInFlight=None):
+    '''Given a list of pairs of file paths and work numbers, as returned by :func:`~music21.corpus.base.search`, parse each and yield the resulting Streams, or the results of calling `transform` on each Stream. See :func:`~music21.corpus.base.searchParse`. 
+    '''
+    if limit is not None:
+        results = results[:limit]
+    if workers is None:
+        import multiprocessing
+        workers = multiprocessing.cpu_count()
+
+    if workers <= 1: # parse in this process, in the order of results
+        for fp, number in results:
+            post = converter.parse(fp, number=number)
+            if transform is not None:
+                post = transform(post)
+            yield post
+        return
+
+    import multiprocessing
+    if maxInFlight is None:
+        maxInFlight = workers * 2
+    pool = multiprocessing.Pool(workers)
+    # AsyncResult objects of submitted works, in the order submitted
+    inFlight = []
+    try:
+        for fp, number in results:
+            # do not submit more work until a slot is free
+            while len(inFlight) >= maxInFlight:
+                yield _getParsedResult(inFlight)
+            inFlight.append(pool.apply_async(_parseResultPickled, 
+                            [(fp, number, transform)]))
+        while len(inFlight) > 0:
+            yield _getParsedResult(inFlight)
+    finally:
+        # if the generator was closed early, or a work failed, no more than
+        # maxInFlight submitted works are completed and discarded; 
+        # Pool.terminate() is avoided, as it may deadlock with idle workers
+        pool.close()
+        pool.join()
+
+
+def _getParsedResult(inFlight):
+    '''Wait for the first completed of the AsyncResult objects in the list `inFlight`, remove it, and return the result provided by :func:`~music21.corpus.base._parseResultPickled`. Errors raised in the pool, such as when arguments or results cannot be pickled, are raised here as a CorpusException.
+    '''
+    while True:
+        for i, asyncResult in enumerate(inFlight):
+            if asyncResult.ready():
+                break
+        else:
+            # a timeout permits interrupting the wait
+            inFlight[0].wait(0.1)
+            continue
+        del inFlight[i]
+        break
+    try:
+        success, post = asyncResult.get()
+    except Exception, e:
+        success, post = False, '%s: %s' % (e.__class__.__name__, e)
+    if not success:
+        raise CorpusException('failed to parse search result: %s' % post)
+    if 'Stream' in getattr(post, 'classes', []):
+        post.teardownPickleScaffold()
+    return post
+
+
+def searchParse(query, field=None, domain=['core', 'virtual'], extList=None,
+    workers=1, limit=None, transform=None, maxInFlight=None):
+    '''Search all stored metadata, as :func:`~music21.corpus.base.search` does, and parse the matching works. This is a generator: each parsed Stream is yielded as soon as it is available. 
+
+    Parsing uses the converter's pickled file cache. If `workers` is greater than one, works are parsed in a pool of that many processes and are yielded in the order they are completed; if `workers` is None, one process per CPU is used. No more than `maxInFlight` works (by default, twice the number of workers) are parsed or waiting to be consumed at any time, so memory use does not grow with the number of matches. 
+
+    If `limit` is given, only the first `limit` matches are parsed. If `transform` is given, it is called with each parsed Stream and its return value is yielded instead; with more than one worker, the transform is called in the worker process, and must be a function defined at the top level of a module. For example, the number of notes in each work in 3/4, counted in four processes::
+
+        for noteCount in searchParse('3/4', 'timeSignatureFirst', workers=4, transform=countNotes):
+            print(noteCount)
+    '''
+    return _parseResults(search(query, field, domain, extList), 
+        workers=workers, limit=limit, transform=transform, 
+        maxInFlight=maxInFlight)
+
+
 
 #-------------------------------------------------------------------------------
 def getComposer(composerName, extList=None):
@@ -297,13 +523,18 @@ def getComposer(composerName, extList=None):
     >>> len(a) > 10
     True
     '''
-    paths = getPaths(extList)
-    post = []
-    for path in paths:
-        if composerName.lower() in path.lower():
-            post.append(path)
-    post.sort()
-    return post
+    paths = getPaths(extList) # updates the corpus manifest
+    if common.isListLike(extList):
+        extList = tuple(extList)
+    lookup = ('getComposer', composerName, extList)
+    if lookup not in _CORPUS_LOOKUPS:
+        post = []
+        for path in paths:
+            if composerName.lower() in path.lower():
+                post.append(path)
+        post.sort()
+        _CORPUS_LOOKUPS[lookup] = post
+    return list(_CORPUS_LOOKUPS[lookup])
 
 def getComposerDir(composerName):
     '''Given the name of a composer, get the path to the top-level directory
@@ -379,13 +610,29 @@ def getWorkList(workName, movementNumber=None, extList=None):
     if not common.isListLike(extList):
         extList = [extList]
 
-    paths = getPaths(extList)
-    post = []
+    paths = getPaths(extList) # updates the corpus manifest
 
     # permit workName to be a list of paths/branches
     if common.isListLike(workName):
         workName = os.path.sep.join(workName)
 
+    # results are stored until the corpus manifest changes
+    if common.isListLike(movementNumber):
+        lookup = ('getWorkList', workName, tuple(movementNumber), 
+                  tuple(extList))
+    else:
+        lookup = ('getWorkList', workName, movementNumber, tuple(extList))
+    if lookup not in _CORPUS_LOOKUPS:
+        _CORPUS_LOOKUPS[lookup] = _getWorkList(paths, workName, 
+                                               movementNumber)
+    return list(_CORPUS_LOOKUPS[lookup])
+
+
+def _getWorkList(paths, workName, movementNumber):
+    '''Return a sorted list of all paths that match a work name and, optionally, a movement number.
+    '''
+    post = []
+
     # replace with os-dependent separators 
     workSlashes = workName.replace('/', os.path.sep)
 
@@ -760,6 +1007,12 @@ beethovenStringQuartets = getBeethovenStringQuartets('xml')
 
 
 #-------------------------------------------------------------------------------
+def _unpicklableResult(streamObj):
+    '''Return an object that cannot be pickled; used for testing a transform in worker processes.
+    '''
+    return lambda: streamObj
+
+
 class Test(unittest.TestCase):
 
     def runTest(self):
@@ -897,6 +1150,78 @@ class Test(unittest.TestCase):
         # there are two versions of this file        
         self.assertEqual(len(getWorkList('beethoven/opus18no1', 1)), 2)
 
+    def testCorpusManifest(self):
+        _updateCorpusManifest()
+        post = getWorkList('beethoven/opus18no1', 1)
+        self.assertEqual(len(post), 2)
+        # returned lists are copies of stored lookups
+        post.pop()
+        self.assertEqual(len(getWorkList('beethoven/opus18no1', 1)), 2)
+        self.assertEqual(len(_CORPUS_LOOKUPS) > 0, True)
+        self.assertEqual(os.path.exists(_getCorpusManifestFilePath()), True)
+
+        # a modified directory is listed again and stored lookups cleared
+        dir = [m for m in MODULES if hasattr(m, '__path__')][0].__path__[0]
+        _CORPUS_MANIFEST[dir] = [-1, []]
+        _updateCorpusManifest()
+        self.assertEqual(len(_CORPUS_LOOKUPS), 0)
+        self.assertEqual(_CORPUS_MANIFEST[dir][1], os.listdir(dir))
+        self.assertEqual(len(getWorkList('beethoven/opus18no1', 1)), 2)
+
+        # the updated manifest is stored 
+        f = open(_getCorpusManifestFilePath())
+        stored = json.load(f)
+        f.close()
+        self.assertEqual(stored[dir][1], os.listdir(dir))
+        self.assertEqual(len(getComposer('beethoven')) > 10, True)
+
+    def testCorpusManifestStr(self):
+        global _CORPUS_MANIFEST
+        _updateCorpusManifest()
+        # paths read from the stored manifest are str, not unicode
+        _CORPUS_MANIFEST = None
+        _updateCorpusManifest()
+        self.assertEqual(os.path.exists(_getCorpusManifestFilePath()), True)
+        for dir, (mtime, names) in _CORPUS_MANIFEST.items():
+            self.assertEqual(isinstance(dir, str), True)
+            for x in names:
+                self.assertEqual(isinstance(x, str), True)
+        for fp in getPaths():
+            self.assertEqual(isinstance(fp, str), True)
+        self.assertEqual(isinstance(getWork('bach/bwv66.6'), str), True)
+        for fp in getWork('beethoven/opus18no1', 1):
+            self.assertEqual(isinstance(fp, str), True)
+
+    def testParseResults(self):
+        results = [(fp, None) for fp in 
+                   getComposer('bach', extList=['.xml'])[:5]]
+        # len, as a built-in, can be pickled and called in a worker
+        serial = list(_parseResults(results, transform=len))
+        self.assertEqual(len(serial), 5)
+        post = _parseResults(results, workers=2, transform=len, 
+                             maxInFlight=2)
+        self.assertEqual(sorted(post), sorted(serial))
+        self.assertEqual(len(list(_parseResults(results, limit=2))), 2)
+
+        # streams returned from workers are usable
+        post = list(_parseResults(results[:2], workers=2))
+        self.assertEqual(sorted([len(s.flat.notes) for s in post]),
+            sorted([len(converter.parse(fp).flat.notes) for fp, number in 
+                    results[:2]]))
+        # closing the generator early stops the workers
+        post = _parseResults(results, workers=2)
+        post.next()
+        post.close()
+
+        self.assertRaises(CorpusException, list, _parseResults(
+            [('nonexistent.xml', None)], workers=2))
+        # works that cannot be pickled raise rather than wait forever
+        self.assertRaises(CorpusException, list, _parseResults(results[:2],
+            workers=2, transform=lambda s: len(s)))
+        # as do results that cannot be pickled
+        self.assertRaises(CorpusException, list, _parseResults(results[:2],
+            workers=2, transform=_unpicklableResult))
+
 
 
 #-------------------------------------------------------------------------------
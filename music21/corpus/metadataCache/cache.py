@@ -39,9 +39,11 @@ def cacheCore():
                                 len(paths)])
     
         #mdb.addFromPaths(paths[-3:])
-        mdb.addFromPaths(paths) # all paths
+        # musicxml files are scanned without creating Streams
+        mdb.addFromPaths(paths, fast=True) # all paths
         #print mdb._storage
         mdb.write() # will use a default file path and  name
+        mdb.writeSqlite() # same name, with a .db extension
 
 
     environLocal.printDebug(['cache: writing time:', t, 'md items:', len(mdb._storage)])
@@ -14,6 +14,10 @@
 
 import doctest
 import unittest
+import os
+import json
+import hashlib
+import urllib
 
 import music21
 from music21 import common
@@ -22,6 +26,16 @@ _MOD = 'converter.py'
 environLocal = environment.Environment(_MOD)
 
 
+# the default mirror, created when first requested
+_MIRROR = None
+_MIRROR_DIR_NAME = 'music21-virtual-mirror'
+
+
+#-------------------------------------------------------------------------------
+class VirtualMirrorException(Exception):
+    pass
+
+
 
 
 class VirtualWork(object):
@@ -172,6 +186,180 @@ class PachelbelCanonD(VirtualWork):
 
 
 
+#-------------------------------------------------------------------------------
+class VirtualMirror(object):
+    '''A local store of the files of the virtual corpus, permitting access to virtual works without network access. 
+
+    Files are stored by the SHA-1 digest of their contents in the `dir` directory (by default, a directory in the user's scratch directory); an index relates each URL to a stored file. The contents of each file are checked against the digest when stored files are verified or prefetched; looking up a file only reads the index. 
+
+    >>> from music21 import *
+    >>> vm = corpus.virtual.VirtualMirror(environLocal.getRootTempDir())
+    >>> vm.getPath('http://kern.ccarh.org/cgi-bin/ksdata?l=cc/bach/cello&file=bwv1007-01.krn&f=xml') == None
+    True
+    '''
+    def __init__(self, dir=None):
+        self._dir = dir
+        # url: [digest, extension]; read when first needed
+        self._index = None
+
+    def _getDir(self, create=False):
+        if self._dir is None:
+            self._dir = os.path.join(environLocal.getRootTempDir(), 
+                        _MIRROR_DIR_NAME)
+        if create and not os.path.exists(self._dir):
+            os.makedirs(self._dir)
+        return self._dir
+
+    def _getIndexFilePath(self):
+        return os.path.join(self._getDir(), 'index.json')
+
+    def _getObjectFilePath(self, digest, ext):
+        return os.path.join(self._getDir(), digest[:2], digest + ext)
+
+    def _getIndex(self):
+        if self._index is None:
+            fp = self._getIndexFilePath()
+            self._index = {}
+            if os.path.exists(fp):
+                f = open(fp)
+                try:
+                    self._index = json.load(f)
+                except ValueError: # a damaged index is rebuilt as needed
+                    environLocal.printDebug(['VirtualMirror: cannot read index', fp])
+                f.close()
+        return self._index
+
+    def _writeIndex(self):
+        self._getDir(create=True)
+        fp = self._getIndexFilePath()
+        fpTemp = fp + '.tmp'
+        f = open(fpTemp, 'w')
+        json.dump(self._getIndex(), f)
+        f.close()
+        # replace the old index only when the new one is complete
+        if os.path.exists(fp) and common.getPlatform() == 'win':
+            os.remove(fp)
+        os.rename(fpTemp, fp)
+
+    def _getDigest(self, data):
+        return hashlib.sha1(data).hexdigest()
+
+    def add(self, url, data):
+        '''Store the file data `data` as the contents of `url`, and return the path to the stored file.
+        '''
+        format, ext = common.findFormatExtURL(url)
+        if ext is None:
+            raise VirtualMirrorException('cannot determine file format of url: %s' % url)
+        digest = self._getDigest(data)
+        fp = self._getObjectFilePath(digest, ext)
+        if not os.path.exists(fp):
+            if not os.path.exists(os.path.dirname(fp)):
+                os.makedirs(os.path.dirname(fp))
+            f = open(fp + '.tmp', 'wb')
+            f.write(data)
+            f.close()
+            os.rename(fp + '.tmp', fp)
+        self._getIndex()[url] = [digest, ext]
+        self._writeIndex()
+        return fp
+
+    def hasUrl(self, url):
+        '''Return True if a file has been stored for `url`. The stored file is not checked.
+        '''
+        return url in self._getIndex()
+
+    def getPath(self, url):
+        '''Return the path to the stored file for `url`, or None if no file is stored. Only the index is read; no directories are created and the stored file is not checked against its digest (see :meth:`~music21.corpus.virtual.VirtualMirror.verify`).
+        '''
+        index = self._getIndex()
+        if url not in index:
+            return None
+        digest, ext = index[url]
+        fp = self._getObjectFilePath(digest, ext)
+        if not os.path.exists(fp):
+            return None
+        return fp
+
+    def _getVerifiedPath(self, url):
+        '''Return the path to the stored file for `url`, or None if no file is stored or if the stored file does not match its digest. Files that do not match are removed, as are their index entries. 
+        '''
+        index = self._getIndex()
+        if url not in index:
+            return None
+        digest, ext = index[url]
+        fp = self._getObjectFilePath(digest, ext)
+        if os.path.exists(fp):
+            f = open(fp, 'rb')
+            data = f.read()
+            f.close()
+            if self._getDigest(data) == digest:
+                return fp
+            environLocal.warn('removing damaged file for %s from the virtual mirror' % url)
+            os.remove(fp)
+        del index[url]
+        self._writeIndex()
+        return None
+
+    def verify(self):
+        '''Check all stored files, removing those that are missing or damaged. Return a list of the URLs that must be fetched again.
+        '''
+        post = []
+        for url in sorted(self._getIndex().keys()):
+            if self._getVerifiedPath(url) is None:
+                post.append(url)
+        return post
+
+    def _fetch(self, work, url, source=None):
+        '''Return the data for `url`, either from the directory `source`, where it is stored under the corpus path of `work`, or by downloading. 
+        '''
+        if source is not None:
+            format, ext = common.findFormatExtURL(url)
+            fp = os.path.join(source, work.corpusPath + ext)
+            if not os.path.exists(fp):
+                raise VirtualMirrorException('no file for %s found in %s' % (
+                                             url, source))
+            f = open(fp, 'rb')
+        else:
+            try:
+                environLocal.printDebug(['VirtualMirror: downloading:', url])
+                f = urllib.urlopen(url)
+            except IOError:
+                raise VirtualMirrorException('cannot access file: %s' % url)
+            # urllib returns the page sent with an HTTP error status as data
+            code = f.getcode()
+            if code is not None and code != 200:
+                f.close()
+                raise VirtualMirrorException('cannot access file: %s (HTTP status %s)' % (url, code))
+        data = f.read()
+        f.close()
+        return data
+
+    def prefetch(self, works, extList=None, source=None):
+        '''Store the files of each :class:`~music21.corpus.virtual.VirtualWork` in `works`, for the URLs matching `extList`, if they are not already stored. 
+
+        If `source` is given, files are read from this local directory in place of the remote site; each file is found at the work's `corpusPath` with the URL's file extension (for example, `bach/bwv1007/prelude.xml`). Return a list of the URLs that were added.
+        '''
+        post = []
+        for work in works:
+            for url in work.getUrlByExt(extList):
+                if self._getVerifiedPath(url) is not None:
+                    continue
+                self.add(url, self._fetch(work, url, source))
+                post.append(url)
+        return post
+
+
+def getMirror():
+    '''Return the default :class:`~music21.corpus.virtual.VirtualMirror`, stored in the user's scratch directory. Virtual works stored in this mirror are parsed without network access.
+    '''
+    global _MIRROR
+    if _MIRROR is None:
+        _MIRROR = VirtualMirror()
+    return _MIRROR
+
+
+
+
 
 
 
@@ -201,6 +389,91 @@ class Test(unittest.TestCase):
         self.assertNotEquals(a.getUrlByExt(['.xml']), [])
         self.assertNotEquals(a.getUrlByExt(['.krn']), [])
 
+    def testVirtualMirror(self):
+        import shutil
+        from music21 import corpus, converter
+        # this module may be run directly; set the mirror used by others
+        from music21.corpus import virtual
+        dir = os.path.join(environLocal.getRootTempDir(), 'm21-mirror-test')
+        if os.path.exists(dir):
+            shutil.rmtree(dir)
+        # a local stand-in for the remote site
+        source = os.path.join(dir, 'source')
+        os.makedirs(os.path.join(source, 'bach', 'bwv1007'))
+        shutil.copy(corpus.getWork('bach/bwv66.6', extList=['.xml']), 
+                    os.path.join(source, 'bach', 'bwv1007', 'prelude.xml'))
+
+        work = BachBWV1007Prelude()
+        url = work.getUrlByExt('.xml')[0]
+        vm = VirtualMirror(os.path.join(dir, 'store'))
+        self.assertEqual(vm.prefetch([work], ['.xml'], source), [url])
+        self.assertEqual(vm.prefetch([work], ['.xml'], source), [])
+        self.assertRaises(VirtualMirrorException, vm.prefetch, [work], 
+                          ['.krn'], source)
+        fp = vm.getPath(url)
+        self.assertEqual(os.path.basename(fp), 
+                         '%s.xml' % hashlib.sha1(open(fp).read()).hexdigest())
+        # the index is stored
+        self.assertEqual(VirtualMirror(os.path.join(dir, 'store')).getPath(
+                         url), fp)
+
+        # mirrored urls are parsed without downloading
+        mirrorOld = virtual._MIRROR
+        virtual._MIRROR = vm
+        try:
+            self.assertEqual(corpus.getVirtualPaths('.xml', mirrored=True), 
+                             [url])
+            s = converter.parse(url)
+            self.assertEqual(len(s.flat.notes), 165)
+        finally:
+            virtual._MIRROR = mirrorOld
+
+        # damaged files are removed
+        f = open(fp, 'a')
+        f.write(' ')
+        f.close()
+        self.assertEqual(vm.verify(), [url])
+        self.assertEqual(vm.getPath(url), None)
+        self.assertEqual(os.path.exists(fp), False)
+        self.assertEqual(vm.prefetch([work], ['.xml'], source), [url])
+        self.assertEqual(vm.getPath(url), fp)
+
+        # looking up a file in an empty mirror creates nothing
+        dirEmpty = os.path.join(dir, 'empty')
+        self.assertEqual(VirtualMirror(dirEmpty).getPath(url), None)
+        self.assertEqual(os.path.exists(dirEmpty), False)
+        shutil.rmtree(dir)
+
+    def testVirtualMirrorHTTPError(self):
+        import threading, BaseHTTPServer
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(404)
+                self.end_headers()
+                self.wfile.write('<html>Not Found</html>')
+            def log_message(self, *args):
+                pass
+
+        server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), Handler)
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        work = VirtualWork()
+        work.corpusPath = 'test/missing'
+        work.urlList = ['http://127.0.0.1:%s/missing.xml' % 
+                        server.server_address[1]]
+        dir = os.path.join(environLocal.getRootTempDir(), 
+                           'm21-mirror-test-http')
+        vm = VirtualMirror(dir)
+        try:
+            # an error page is not stored as the contents of the work
+            self.assertRaises(VirtualMirrorException, vm.prefetch, [work])
+        finally:
+            thread.join()
+            server.server_close()
+        self.assertEqual(vm.hasUrl(work.urlList[0]), False)
+        self.assertEqual(os.path.exists(dir), False)
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = []
@@ -40,6 +40,34 @@ class ModalCounterpoint(object):
         self.legalMelodicIntervals = ['P4', 'P5', 'P8', 'm2', 'M2', 'm3', 'M3', 'm6']
         self.legalMiddleHarmonicIntervals = ['P1', 'P4', 'P5', 'P8', 'm3', 'M3', 'm6', 'M6']
 
+    def _findNotePairs(self, stream1):
+        '''Return a list of pairs of each Note in stream1 and the Note that follows it, as found by :meth:`~music21.stream.Stream.getElementAfterElement`.
+        '''
+        notes = list(stream1.getElementsByClass(Note))
+        return [(notes[i], notes[i+1]) for i in range(len(notes) - 1)]
+
+    def _findPlayingWhenAttacked(self, stream1, stream2):
+        '''Return a dictionary of the id of each element in stream1 to the element in stream2 sounding when it is attacked, as found by :meth:`~music21.stream.Stream.playingWhenAttacked`. Both Streams are walked once, rather than searching stream2 for each note.
+        '''
+        post = {}
+        for o, oNext, sounding in stream._verticalitySweep(
+            [stream1, stream2]):
+            # elements in stream2, earliest attacked first
+            others = [(oStart, e) for i, e, oStart in sounding if i == 1]
+            if len(others) == 0:
+                continue
+            others.sort(key=lambda x: x[0])
+            for i, e, oStart in sounding:
+                if i != 0 or oStart != o:
+                    continue
+                # prefer an element of the same class
+                post[id(e)] = others[0][1]
+                for oOther, eOther in others:
+                    if isinstance(eOther, e.__class__):
+                        post[id(e)] = eOther
+                        break
+        return post
+
     def findParallelFifths(self, srcStream, cmpStream):
         '''Given two streams, returns the number of parallel fifths and also
         assigns a flag under note.editorial.misc["Parallel Fifth"] for
@@ -73,15 +101,12 @@ class ModalCounterpoint(object):
         
         srcStream.attachIntervalsBetweenStreams(cmpStream)
         numParallelFifths = 0
-        srcNotes = srcStream.notes
         
-        for note1 in srcStream:
-            note2 = srcStream.getElementAfterElement(note1, [Note])
-            if note2 is not None:
-                if note1.editorial.harmonicInterval.semiSimpleName == "P5" and \
-                   note2.editorial.harmonicInterval.semiSimpleName == "P5":
-                        numParallelFifths += 1
-                        note2.editorial.misc["Parallel Fifth"] = True
+        for note1, note2 in self._findNotePairs(srcStream):
+            if note1.editorial.harmonicInterval.semiSimpleName == "P5" and \
+               note2.editorial.harmonicInterval.semiSimpleName == "P5":
+                    numParallelFifths += 1
+                    note2.editorial.misc["Parallel Fifth"] = True
         return numParallelFifths
 
     def findHiddenFifths(self, stream1, stream2):
@@ -116,12 +141,11 @@ class ModalCounterpoint(object):
 
         '''
         numHiddenFifths = 0
-        for i in range(len(stream1.notes)-1):
-            note1 = stream1.notes[i]
-            note2 = stream1.getElementAfterElement(note1, [Note])
-            note3 = stream2.playingWhenAttacked(note1)
-            note4 = stream2.playingWhenAttacked(note2)
-            if note2 is not None and note3 is not None and note4 is not None:
+        playing = self._findPlayingWhenAttacked(stream1, stream2)
+        for note1, note2 in self._findNotePairs(stream1):
+            note3 = playing.get(id(note1))
+            note4 = playing.get(id(note2))
+            if note3 is not None and note4 is not None:
                 hidden = self.isHiddenFifth(note1, note2, note3, note4)
                 if hidden:
                     numHiddenFifths += 1
@@ -237,19 +261,15 @@ class ModalCounterpoint(object):
         stream2.attachIntervalsBetweenStreams(stream1)
 
         numParallelOctaves = 0
-        for note1 in stream1:
-            note2 = stream1.getElementAfterElement(note1, [Note])
-            if note2 is not None:
-                if note1.editorial.harmonicInterval.semiSimpleName == "P8":
-                    if note2.editorial.harmonicInterval.semiSimpleName == "P8":
-                        numParallelOctaves += 1
-                        note2.editorial.misc["Parallel Octave"] = True
-        for note1 in stream2:
-            note2 = stream2.getElementAfterElement(note1, [Note])
-            if note2 is not None:
-                if note1.editorial.harmonicInterval.semiSimpleName == "P8":
-                    if note2.editorial.harmonicInterval.semiSimpleName == "P8":
-                        note2.editorial.misc["Parallel Octave"] = True
+        for note1, note2 in self._findNotePairs(stream1):
+            if note1.editorial.harmonicInterval.semiSimpleName == "P8":
+                if note2.editorial.harmonicInterval.semiSimpleName == "P8":
+                    numParallelOctaves += 1
+                    note2.editorial.misc["Parallel Octave"] = True
+        for note1, note2 in self._findNotePairs(stream2):
+            if note1.editorial.harmonicInterval.semiSimpleName == "P8":
+                if note2.editorial.harmonicInterval.semiSimpleName == "P8":
+                    note2.editorial.misc["Parallel Octave"] = True
         return numParallelOctaves
 
     def findHiddenOctaves(self, stream1, stream2):
@@ -287,12 +307,11 @@ class ModalCounterpoint(object):
 
         '''
         numHiddenOctaves = 0
-        for i in range(len(stream1.notes)-1):
-            note1 = stream1.notes[i]
-            note2 = stream1.getElementAfterElement(note1, [Note])
-            note3 = stream2.playingWhenAttacked(note1)
-            note4 = stream2.playingWhenAttacked(note2)
-            if note2 is not None and note3 is not None and note4 is not None:
+        playing = self._findPlayingWhenAttacked(stream1, stream2)
+        for note1, note2 in self._findNotePairs(stream1):
+            note3 = playing.get(id(note1))
+            note4 = playing.get(id(note2))
+            if note3 is not None and note4 is not None:
                 hidden = self.isHiddenOctave(note1, note2, note3, note4)
                 if hidden:
                     numHiddenOctaves += 1
@@ -405,19 +424,15 @@ class ModalCounterpoint(object):
         stream2.attachIntervalsBetweenStreams(stream1)
         
         numParallelUnisons = 0
-        for note1 in stream1:
-            note2 = stream1.getElementAfterElement(note1, [Note])
-            if note2 is not None:
-                if note1.editorial.harmonicInterval.name == "P1":
-                    if note2.editorial.harmonicInterval.name == "P1":
-                        numParallelUnisons += 1
-                        note2.editorial.misc["Parallel Unison"] = True
-        for note1 in stream2:
-            note2 = stream2.getElementAfterElement(note1, [Note])
-            if note2 is not None:
-                if note1.editorial.harmonicInterval.name == "P1":
-                    if note2.editorial.harmonicInterval.name == "P1":
-                        note2.editorial.misc["Parallel Unison"] = True
+        for note1, note2 in self._findNotePairs(stream1):
+            if note1.editorial.harmonicInterval.name == "P1":
+                if note2.editorial.harmonicInterval.name == "P1":
+                    numParallelUnisons += 1
+                    note2.editorial.misc["Parallel Unison"] = True
+        for note1, note2 in self._findNotePairs(stream2):
+            if note1.editorial.harmonicInterval.name == "P1":
+                if note2.editorial.harmonicInterval.name == "P1":
+                    note2.editorial.misc["Parallel Unison"] = True
         return numParallelUnisons
 
     def isParallelUnison(self, note11, note12, note21, note22):
@@ -51,6 +51,12 @@ log.setLevel(logging.INFO)
 # a user has set a preference.
 #
 
+# settings shared by all Environment instances; 'ref' is loaded on first
+# access and reset to None when the settings file is written; 'debug' caches
+# the integer debug level
+_environStorage = {'ref': None, 'debug': None}
+
+
 #-------------------------------------------------------------------------------
 class EnvironmentException(Exception):
     pass
@@ -122,25 +128,48 @@ class Environment(object):
     # documentation for all attributes (not properties or methods)
     _DOC_ATTR = {
     'modNameParent': 'A string representation of the module that contains this Environment instance.',
-    'ref': 'The Python dictionary used to store all internal settings.',
     }
 
     def __init__(self, modName=None):
         '''Create an instance of this object. A modName argument can be provided for use in printDebug() calls. 
 
+        All Environment instances share a single, process-wide settings dictionary. This dictionary is loaded (from defaults and the user's settings file) the first time any instance needs it, so creating an Environment is cheap.
+
         >>> a = Environment()
         >>> post = a['writeFormat']
+        >>> b = Environment('test')
+        >>> a.ref is b.ref
+        True
         '''
-        self.ref = {}
-        self.loadDefaults() # defines all valid keys in ref
-        # read will only right over values if set in field
-        self.read() # load a stored file if available
         # store the name of the module that is using this object
         # this is used for printing debug information
-        if self.ref['debug']:
-          log.setLevel(int(self.ref['debug'])*10)
         self.modNameParent = modName
 
+    def _getRef(self):
+        if _environStorage['ref'] is None:
+            _environStorage['ref'] = {}
+            self.loadDefaults() # defines all valid keys in ref
+            # read will only right over values if set in field
+            self.read() # load a stored file if available
+            if self.ref['debug']:
+                log.setLevel(self._getDebug()*10)
+        return _environStorage['ref']
+
+    def _setRef(self, value):
+        _environStorage['ref'] = value
+        _environStorage['debug'] = None
+
+    ref = property(_getRef, _setRef, doc='''
+        The Python dictionary used to store all settings. This dictionary is shared by all Environment instances, and is loaded on first access.
+        ''')
+
+    def _getDebug(self):
+        '''Return the debug level as an integer, caching the converted value.
+        '''
+        if _environStorage['debug'] is None:
+            _environStorage['debug'] = self.__getitem__('debug')
+        return _environStorage['debug']
+
 
     def loadDefaults(self):
         '''Load defaults. All keys are derived from these defaults.
@@ -198,6 +227,7 @@ class Environment(object):
         self.printDebug(['restoring Environment defaults'])
         self.ref = {}
         self.loadDefaults() # defines all valid keys in ref
+        _environStorage['debug'] = None
 
 
     def __getitem__(self, key):
@@ -207,7 +237,7 @@ class Environment(object):
         # could store last update tim and look of file is more recent
         # how, only doing read once is a bit more conservative
         #self.read()
-        if key not in self.ref.keys():
+        if key not in self.ref:
             raise EnvironmentException('no preference: %s' % key)
         value = self.ref[key]
         valueStr = str(value).lower()
@@ -248,13 +278,14 @@ class Environment(object):
         Traceback (most recent call last):
         EnvironmentException: adsf is not an acceptable value for preference: showFormat
         >>> a['showFormat'] = 'musicxml'
+        >>> a['debug'] = 0
         '''
         #saxutils.escape # used for escaping strings going to xml
         # with unicode encoding
         # http://www.xml.com/pub/a/2002/11/13/py-xml.html?page=2
         # saxutils.escape(msg).encode('UTF-8')
 
-        if key not in self.ref.keys():
+        if key not in self.ref:
             raise EnvironmentException('no preference: %s' % key)
         if value == '':
             value = None # always replace '' with None
@@ -269,7 +300,7 @@ class Environment(object):
             if value in common.VALID_WRITE_FORMATS:
                 valid = True
         elif key == 'debug':
-          log.setLevel(logging.INFO)
+            valid = True
         elif key == 'autoDownload':
             value = value.lower()
             if value in common.VALID_AUTO_DOWNLOAD:
@@ -283,6 +314,13 @@ class Environment(object):
         if common.isStr(value):
             value = xml.sax.saxutils.escape(value).encode('UTF-8')
         self.ref[key] = value
+        if key == 'debug':
+            _environStorage['debug'] = None
+            debug = self._getDebug()
+            if debug:
+                log.setLevel(debug*10)
+            else:
+                log.setLevel(logging.INFO)
 
     def __repr__(self):
         return '<Environment>'
@@ -353,12 +391,16 @@ class Environment(object):
                 #raise EnvironmentException('no such defined preference: %s' % name)
             else: # load up stored values, overwriting defaults
                 self.ref[name] = value
+        _environStorage['debug'] = None
 
     def write(self, fp=None):
         '''Write an XML preference file. This must be manually called to store any changes made to the object and access preferences later. If `fp` is None, the default storage location will be used.
+
+        Writing to the default storage location invalidates the settings shared by all Environment instances; they will be reloaded from the file on next access.
         '''
+        settingsPath = self.getSettingsPath()
         if fp == None:
-            fp = self.getSettingsPath()
+            fp = settingsPath
 
         # need to use __getitem__ here b/c need to covnert debug value
         # to an integer
@@ -378,6 +420,8 @@ class Environment(object):
         f = open(fp, 'w')
         f.write(storage.xmlStr())
         f.close()
+        if fp == settingsPath:
+            self.ref = None
 
     #---------------------------------------------------------------------------
     # utility methods for commonly needed OS services
@@ -497,7 +541,7 @@ class Environment(object):
         '''
         if not common.isNum(statusLevel):
             raise EnvironmentException('bad statusLevel argument given: %s' % statusLevel)
-        if self.__getitem__('debug') >= statusLevel:
+        if self._getDebug() >= statusLevel:
             if common.isStr(msg):
                 msg = [msg] # make into a list
             if msg[0] != self.modNameParent and self.modNameParent != None:
@@ -659,6 +703,26 @@ class Test(unittest.TestCase):
 </settings>
 """, storage.xmlStr())
 
+    def testSharedSettings(self):
+        a = Environment('a')
+        b = Environment('b')
+        self.assertEqual(a.ref is b.ref, True)
+        a['writeFormat'] = 'midi'
+        self.assertEqual(b['writeFormat'], 'midi')
+        a.restoreDefaults()
+        self.assertEqual(b['writeFormat'], 'musicxml')
+
+        # writing to the settings file invalidates shared settings
+        fp = a.getTempFile('.xml')
+        a.getSettingsPath = lambda: fp
+        a['lilypondFormat'] = 'png'
+        a.write()
+        self.assertEqual(_environStorage['ref'], None)
+        self.assertEqual(a['lilypondFormat'], 'png') # reloaded from fp
+        os.remove(fp)
+        a.ref = None # reload from the user's settings on next access
+        self.assertEqual(b['lilypondFormat'], 'pdf')
+
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
@@ -2494,17 +2494,35 @@ class PlotScatterWeightedPitchSpaceDynamicSymbol(PlotScatterWeighted):
     .. image:: images/PlotScatterWeightedPitchSpaceDynamicSymbol.*
         :width: 600
 
+    A list of Streams, such as the works of a corpus, can be provided in place of a Stream; the counts of matches found in each Stream are combined.
+
+    >>> parts = [s.parts[0].flat.sorted, s.parts[1].flat.sorted] #_DOCS_HIDE
+    >>> #_DOCS_SHOW parts = [s.parts[0].flat.sorted, s.parts[1].flat.sorted]
+    >>> p = graph.PlotScatterWeightedPitchSpaceDynamicSymbol(parts, doneAction=None) #_DOCS_HIDE
+    >>> #_DOCS_SHOW p = graph.PlotScatterWeightedPitchSpaceDynamicSymbol(parts)
+    >>> sum([z for x, y, z in p.graph.data])
+    818
     '''
 
     values = ['pitchClass', 'dynamicSymbol']
     def __init__(self, streamObj, *args, **keywords):
+        if common.isListLike(streamObj):
+            # matches are found within each Stream; a Stream containing
+            # all Streams provides the pitches used for ticks
+            from music21 import stream
+            streamList = list(streamObj)
+            streamObj = stream.Stream()
+            for s in streamList:
+                streamObj.insert(0, s)
+        else:
+            streamList = streamObj
         PlotScatterWeighted.__init__(self, streamObj, *args, **keywords)
 
         self.fxTicks = self.ticksPitchSpaceUsage
         self.fyTicks = self.ticksDynamics
 
         # get data from correlate object
-        am = correlate.ActivityMatch(self.streamObj)
+        am = correlate.ActivityMatch(streamList)
         data  = am.pitchToDynamic(dataPoints=False)
 
         xVals = [x for x,y,z in data]
@@ -3210,6 +3228,17 @@ class Test(unittest.TestCase):
                         title='Bach (soprano voice)')
         b.process()
 
+    def testPlotScatterWeightedPitchSpaceDynamicSymbolList(self):
+        from music21 import corpus
+        a = corpus.parseWork('schumann/opus41no1', 2)
+        parts = [a[0].flat.sorted, a[1].flat.sorted]
+        b = PlotScatterWeightedPitchSpaceDynamicSymbol(parts, doneAction=None)
+        # counts from each part are combined
+        counts = [sum([z for x, y, z in 
+            PlotScatterWeightedPitchSpaceDynamicSymbol(p, 
+            doneAction=None).graph.data]) for p in parts]
+        self.assertEqual(sum([z for x, y, z in b.graph.data]), sum(counts))
+
     def testPlotPitchSpace(self):
         from music21 import corpus      
         a = corpus.parseWork('bach')
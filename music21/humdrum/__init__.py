@@ -99,3 +99,18 @@ def parseFile(filename):
 def parseData(data):
     return spineParser.HumdrumDataCollection(data)
 
+def iterateFile(filename):
+    '''
+    Read a Humdrum file line by line, yielding lists of music21 objects, 
+    one for each measure-sized chunk; see spineParser.HumdrumMeasureReader
+    '''
+    humFH = open(filename)
+    try:
+        for chunk in spineParser.HumdrumMeasureReader(humFH):
+            yield chunk
+    finally:
+        humFH.close()
+
+def iterateData(data):
+    return spineParser.HumdrumMeasureReader(data)
+
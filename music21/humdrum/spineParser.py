@@ -280,6 +280,189 @@ class HumdrumFile(HumdrumDataCollection):
             spineDataCollection.append(line)
         return self.parseLines(spineDataCollection)
 
+class HumdrumMeasureReader(object):
+    '''
+    A HumdrumMeasureReader parses Humdrum data one line at a time, 
+    following spine splits, joins, and exchanges as they are found, and 
+    yields lists of music21 objects, one list for each measure-sized 
+    chunk of the data.
+
+    Unlike HumdrumDataCollection, the complete file is never stored: 
+    only the spines that are active at the current line are kept, so 
+    long files are converted in constant memory and output is available 
+    as soon as the first barline is read.
+
+    The mandatory `dataStream` may be a string, a list of lines, or an 
+    open file handle.  Each yielded list contains the Measures completed 
+    since the last chunk (as well as any objects found before a spine's 
+    first barline); each object has a `humdrumSpineId` attribute.  
+    Only **kern and **dynam spines produce objects.
+
+    >>> from music21 import *
+    >>> data = '**kern\\t**kern\\n*M2/4\\t*M2/4\\n=1\\t=1\\n4c\\t4e\\n4d\\t4f\\n=2\\t=2\\n2e\\t2g\\n==\\t==\\n*-\\t*-'
+    >>> hmr = humdrum.spineParser.HumdrumMeasureReader(data)
+    >>> for chunk in hmr:
+    ...     print [(x.humdrumSpineId, x.__class__.__name__, len(x.notes)) for x in chunk if hasattr(x, 'notes')]
+    []
+    [(0, 'Measure', 2), (1, 'Measure', 2)]
+    [(0, 'Measure', 1), (1, 'Measure', 1)]
+    [(0, 'Measure', 0), (1, 'Measure', 0)]
+    '''
+    def __init__(self, dataStream = None):
+        if dataStream is None:
+            raise HumdrumException("dataStream is not optional")
+        elif isinstance(dataStream, basestring):
+            dataStream = dataStream.splitlines()
+        self.dataStream = dataStream
+        self.globalEvents = [] # GlobalReference and GlobalComment objects
+        self.nextFreeId = 0
+
+    def _addSpine(self, position, upstreamSpines = None):
+        '''
+        Create a new spine, taking its spine type from the first 
+        upstream spine, if given.
+        '''
+        newSpine = HumdrumSpine(self.nextFreeId)
+        self.nextFreeId += 1
+        newSpine.beginningPosition = position
+        if upstreamSpines:
+            newSpine.upstream = [x.id for x in upstreamSpines]
+            self._setSpineType(newSpine, upstreamSpines[0]._spineType)
+        return newSpine
+
+    def _setSpineType(self, spine, spineType):
+        spine.spineType = spineType
+        if spineType == "kern":
+            spine.__class__ = KernSpine
+        elif spineType == "dynam":
+            spine.__class__ = DynamSpine
+
+    def _parseSpinePaths(self, events, currentSpineList, position):
+        '''
+        Given a list of SpineEvents (or None) for one line of spine path 
+        data, return the new list of current spines.  This follows 
+        HumdrumDataCollection.parseProtoSpines(). 
+        '''
+        newSpineList = common.defList()
+        mergerActive = False
+        exchangeActive = False
+        for j in range(0, max(len(events), len(currentSpineList))):
+            if j < len(events):
+                thisEvent = events[j]
+            else:
+                thisEvent = None
+            currentSpine = currentSpineList[j]
+            if thisEvent is None and currentSpine is not None:
+                newSpineList.append(currentSpine)
+            elif thisEvent is None:
+                continue
+            elif thisEvent.contents == "*-":  ## terminate spine
+                currentSpine.endingPosition = position
+            elif thisEvent.contents == "*^":  ## split spine
+                newSpine1 = self._addSpine(position + 1, [currentSpine])
+                newSpine2 = self._addSpine(position + 1, [currentSpine])
+                currentSpine.endingPosition = position
+                currentSpine.downstream = [newSpine1.id, newSpine2.id]
+                newSpineList.append(newSpine1)
+                newSpineList.append(newSpine2)
+            elif thisEvent.contents == "*v":  
+                if mergerActive is False:
+                    mergeSpine = self._addSpine(position + 1, [currentSpine])
+                    mergerActive = mergeSpine
+                    currentSpine.endingPosition = position
+                    currentSpine.downstream = [mergeSpine.id]
+                    newSpineList.append(mergeSpine)
+                else:
+                    mergeSpine = mergerActive
+                    currentSpine.endingPosition = position
+                    currentSpine.downstream = [mergeSpine.id]
+                    mergeSpine.upstream.append(currentSpine.id)
+            elif thisEvent.contents == "*x":  # exchange spine    
+                if exchangeActive is False:
+                    exchangeActive = currentSpine
+                else:
+                    newSpineList.append(currentSpine)
+                    newSpineList.append(exchangeActive)
+                    exchangeActive = False
+            else:  ## null processing code "*" 
+                newSpineList.append(currentSpine)
+        if exchangeActive is not False:
+            raise HumdrumException("Protospine found with unpaired exchange instruction")        
+        return newSpineList
+
+    def __iter__(self):
+        currentSpineList = common.defList(default = None)
+        chunk = []
+        i = 0
+        for line in self.dataStream:
+            line = line.rstrip()
+            if line == "":
+                continue
+            elif line.startswith('!!!'):
+                self.globalEvents.append(GlobalReference(i, line))
+                i += 1
+                continue
+            elif line.startswith('!!'):
+                self.globalEvents.append(GlobalComment(i, line))
+                i += 1
+                continue
+
+            events = []
+            spinePathData = False
+            foundBarline = False
+            for j, contents in enumerate(re.split("\t+", line)):
+                currentSpine = currentSpineList[j]
+                if currentSpine is None:
+                    ## first event after a None = new spine
+                    currentSpine = self._addSpine(i)
+                    currentSpineList[j] = currentSpine
+                thisEvent = SpineEvent(contents, position = i)
+                thisEvent.protoSpineNum = currentSpine.id
+                thisEvent.spineId = currentSpine.id
+                events.append(thisEvent)
+                if contents in spinePathIndicators:
+                    spinePathData = True
+                elif contents.startswith('**'):
+                    self._setSpineType(currentSpine, contents[2:])
+                elif contents.startswith('='):
+                    foundBarline = True
+
+                if currentSpine._spineType is None:
+                    raise HumdrumException("Could not determine spineType " +
+                                           "for spine with id " + str(currentSpine.id))
+                elif hasattr(currentSpine, 'parseEvent'):
+                    thisObject = currentSpine.parseEvent(thisEvent)
+                    if thisObject is not None:
+                        chunk.append(thisObject)
+
+            if spinePathData is True:
+                for j in range(len(events), len(currentSpineList)):
+                    events.append(None)
+                # spines that terminate, split, or join end here, and 
+                # must give up their active Measure
+                for j, thisEvent in enumerate(events):
+                    if thisEvent is None or thisEvent.contents not in [
+                        '*-', '*^', '*v']:
+                        continue
+                    spine = currentSpineList[j]
+                    if spine.activeContainer is not None:
+                        chunk.append(spine.activeContainer)
+                        spine.activeContainer = None
+                currentSpineList = self._parseSpinePaths(events, 
+                    currentSpineList, i)
+            i += 1
+            if foundBarline and chunk != []:
+                yield chunk
+                chunk = []
+
+        # complete any Measures that remain open
+        for spine in currentSpineList:
+            if spine is not None and spine.activeContainer is not None:
+                chunk.append(spine.activeContainer)
+                spine.activeContainer = None
+        if chunk != []:
+            yield chunk
+
 class HumdrumLine(object):    
     '''
     HumdrumLine is a dummy class for subclassing HumdrumSpineLine, GlobalComment, etc. classes
@@ -422,6 +605,11 @@ class HumdrumSpine(object):
         self._spineCollection = None
         self._spineType = None
 
+        # parsing state, used by parseEvent() in subclasses
+        self.activeContainer = None # the Measure being filled
+        self.inTuplet = False
+        self.lastNote = None
+
     def __repr__(self):
         return str(self.id) + repr(self.upstream) + repr(self.downstream)
 
@@ -542,99 +730,120 @@ class HumdrumSpine(object):
 
 class KernSpine(HumdrumSpine):
     def parse(self):
-        thisContainer = None # hdStringToMeasure('=0')
-        inTuplet = False
-        lastNote = None
-        
         for event in self.eventList:
-            eventC = str(event.contents)  # is str already; just for Eclipse
-            thisObject = None            
-            if eventC == ".":
-                pass
-            elif eventC.startswith('*'):
-                ## control processing
-                tempObject = kernTandamToControl(eventC)
-                if tempObject is not None:
-                    thisObject = tempObject
-            elif eventC.startswith('='):
-                ## barline/measure processing
-                if thisContainer is not None:
-                    self.music21Objects.append(thisContainer)
-                thisContainer = hdStringToMeasure(eventC)                
-            elif eventC.startswith('!'):
-                ## TODO: process comments
-                pass
-            elif eventC.count(' '):
-                ### multipleNotes
-                notesToProcess = eventC.split()
-                chordNotes = []
-                for noteToProcess in notesToProcess:
-                    chordNotes.append(hdStringToNote(noteToProcess))
-                thisObject = music21.chord.Chord(chordNotes)
-                thisObject.duration = chordNotes[0].duration
-
-                if inTuplet is False and len(thisObject.duration.tuplets) > 0:
-                    inTuplet = True
-                    thisObject.duration.tuplets[0].type = 'start'
-                elif inTuplet is True and len(thisObject.duration.tuplets) == 0:
-                    inTuplet = False
-                    lastNote.duration.tuplets[0].type = 'stop'
-                lastNote = thisObject
+            thisObject = self.parseEvent(event)
+            if thisObject is not None:
+                self.music21Objects.append(thisObject)
 
+    def parseEvent(self, event):
+        '''
+        Parse a single SpineEvent, adding the resulting object to the 
+        active Measure, if there is one.
+
+        Returns the previous Measure if the event starts a new Measure, 
+        an object found outside of any Measure, or None.
+        '''
+        eventC = str(event.contents)  # is str already; just for Eclipse
+        thisObject = None            
+        if eventC == ".":
+            pass
+        elif eventC.startswith('*'):
+            ## control processing
+            tempObject = kernTandamToControl(eventC)
+            if tempObject is not None:
+                thisObject = tempObject
+        elif eventC.startswith('='):
+            ## barline/measure processing
+            completed = self.activeContainer
+            self.activeContainer = hdStringToMeasure(eventC)                
+            self.activeContainer.humdrumPosition = event.position
+            self.activeContainer.humdrumSpineId = event.spineId
+            return completed
+        elif eventC.startswith('!'):
+            ## TODO: process comments
+            pass
+        elif eventC.count(' '):
+            ### multipleNotes
+            notesToProcess = eventC.split()
+            chordNotes = []
+            for noteToProcess in notesToProcess:
+                chordNotes.append(hdStringToNote(noteToProcess))
+            thisObject = music21.chord.Chord(chordNotes)
+            thisObject.duration = chordNotes[0].duration
+
+            if self.inTuplet is False and len(thisObject.duration.tuplets) > 0:
+                self.inTuplet = True
+                thisObject.duration.tuplets[0].type = 'start'
+            elif self.inTuplet is True and len(thisObject.duration.tuplets) == 0:
+                self.inTuplet = False
+                self.lastNote.duration.tuplets[0].type = 'stop'
+            self.lastNote = thisObject
+
+        else:
+            thisObject = hdStringToNote(eventC)
+            if self.inTuplet is False and len(thisObject.duration.tuplets) > 0:
+                self.inTuplet = True
+                thisObject.duration.tuplets[0].type = 'start'
+            elif self.inTuplet is True and len(thisObject.duration.tuplets) == 0:
+                self.inTuplet = False
+                self.lastNote.duration.tuplets[0].type = 'stop'
+            self.lastNote = thisObject
+        
+        if thisObject is not None:
+            thisObject.humdrumPosition = event.position
+            thisObject.humdrumSpineId  = event.spineId                
+            if self.activeContainer is None:
+                return thisObject
             else:
-                thisObject = hdStringToNote(eventC)
-                if inTuplet is False and len(thisObject.duration.tuplets) > 0:
-                    inTuplet = True
-                    thisObject.duration.tuplets[0].type = 'start'
-                elif inTuplet is True and len(thisObject.duration.tuplets) == 0:
-                    inTuplet = False
-                    lastNote.duration.tuplets[0].type = 'stop'
-                lastNote = thisObject
-            
-            if thisObject is not None:
-                thisObject.humdrumPosition = event.position
-                thisObject.humdrumSpineId  = event.spineId                
-                if thisContainer is None:
-                    self.music21Objects.append(thisObject)
-                else:
-                    thisContainer.append(thisObject)
+                self.activeContainer.append(thisObject)
+        return None
 
 class DynamSpine(HumdrumSpine):
     def parse(self):
-        thisContainer = None
         for event in self.eventList:
-            eventC = str(event.contents)  # is str already; just so Eclipse gives the right tools
-            thisObject = None
-            if eventC == ".":
-                pass
-            elif eventC.startswith('*'):
-                ## control processing
-                tempObject = miscTandamToControl(eventC)
-                if tempObject is not None:
-                    thisObject = tempObject
-            elif eventC.startswith('='):
-                if thisContainer is not None:
-                    self.music21Objects.append(thisContainer)
-                thisContainer = hdStringToMeasure(eventC)                
-            elif eventC.startswith('!'):
-                ## TODO: process comments
-                pass
-            elif eventC.startswith('<'):
-                thisObject = Wedge()
-                thisObject.type = 'diminuendo'
-            elif eventC.startswith('>'):
-                thisObject = Wedge()
-                thisObject.type = 'crescendo'
-            else:
-                thisObject = Dynamic(eventC)
-            
+            thisObject = self.parseEvent(event)
             if thisObject is not None:
-                thisObject.humdrumPosition = event.position
-                thisObject.humdrumSpineId  = event.spineId                
-                if thisContainer is None:
-                    self.music21Objects.append(thisObject)
-                else:
-                    thisContainer.append(thisObject)
+                self.music21Objects.append(thisObject)
+
+    def parseEvent(self, event):
+        '''
+        Parse a single SpineEvent; see KernSpine.parseEvent().
+        '''
+        eventC = str(event.contents)  # is str already; just so Eclipse gives the right tools
+        thisObject = None
+        if eventC == ".":
+            pass
+        elif eventC.startswith('*'):
+            ## control processing
+            tempObject = miscTandamToControl(eventC)
+            if tempObject is not None:
+                thisObject = tempObject
+        elif eventC.startswith('='):
+            completed = self.activeContainer
+            self.activeContainer = hdStringToMeasure(eventC)                
+            self.activeContainer.humdrumPosition = event.position
+            self.activeContainer.humdrumSpineId = event.spineId
+            return completed
+        elif eventC.startswith('!'):
+            ## TODO: process comments
+            pass
+        elif eventC.startswith('<'):
+            thisObject = Wedge()
+            thisObject.type = 'diminuendo'
+        elif eventC.startswith('>'):
+            thisObject = Wedge()
+            thisObject.type = 'crescendo'
+        else:
+            thisObject = Dynamic(eventC)
+        
+        if thisObject is not None:
+            thisObject.humdrumPosition = event.position
+            thisObject.humdrumSpineId  = event.spineId                
+            if self.activeContainer is None:
+                return thisObject
+            else:
+                self.activeContainer.append(thisObject)
+        return None
 
 
         
@@ -793,91 +1002,112 @@ class HumdrumException(Exception):
     '''
     pass
 
+# kern tokens repeat a small vocabulary thousands of times; these caches 
+# map token strings to immutable specifications from which objects are built
+_kernNoteSpecCache = common.LRUCache(2048)
+_kernMeasureSpecCache = common.LRUCache(256)
+_kernTandamSpecCache = common.LRUCache(256)
+
 def hdStringToNote(contents):
     '''
     returns a music21.note.Note (or Rest or Unpitched, etc.) 
     matching the current SpineEvent.
     Does not check to see that it is sane or part of a **kern spine, etc.
+
+    Decoded tokens are cached; see hdStringToNoteSpec().
+
+    >>> from music21 import *
+    >>> n = humdrum.spineParser.hdStringToNote('8.B-L')
+    >>> n.nameWithOctave, n.quarterLength, n.beams.getTypes()
+    ('B-3', 0.75, ['start'])
+    '''
+    spec = _kernNoteSpecCache.get(contents)
+    if spec is None:
+        spec = hdStringToNoteSpec(contents)
+        _kernNoteSpecCache[contents] = spec
+    return noteFromSpec(spec)
+
+def hdStringToNoteSpec(contents):
+    '''
+    Parse a kern note or rest token into an immutable tuple of 
+    (isRest, step, octave, accidental, tie, expressions, articulations, 
+    stemDirection, durationType, dots, tuplet, durationClass, beams), 
+    from which noteFromSpec() builds a Note or Rest.
+
+    >>> from music21 import *
+    >>> humdrum.spineParser.hdStringToNoteSpec('4c#')
+    (False, 'c', 4, '#', None, (), (), None, 'quarter', 0, None, None, ())
     '''
-    
     # http://www.lib.virginia.edu/artsandmedia/dmmc/Music/Humdrum/kern_hlp.html#kern
     
     # 3.2.1 -- pitch
     
     matchedNote = re.search("([a-gA-G]+)", contents)
 
-    thisObject = None
+    step = None
+    octave = None
     if matchedNote:
-        thisObject = music21.note.Note()
+        isRest = False
         kernNoteName = matchedNote.group(1)
         step = kernNoteName[0].lower()
-        thisObject.step = step
         if (step == kernNoteName[0]): ## middle C or higher
             octave = 3 + len(kernNoteName)
         else: # below middle C
             octave = 4 - len(kernNoteName)
-        thisObject.octave = octave
 
     # 3.3 -- Rests
     elif contents.count("r"):
-        thisObject = music21.note.Rest()
+        isRest = True
     else:
         raise HumdrumException("Could not parse %s for note information" % contents)
 
     matchedSharp = re.search("(\#+)", contents)
     matchedFlat  = re.search("(\-+)", contents)
     
+    accidental = None
     if matchedSharp:
-        thisObject.accidental = matchedSharp.group(0)
+        accidental = matchedSharp.group(0)
     elif matchedFlat:
-        thisObject.accidental = matchedFlat.group(0)
+        accidental = matchedFlat.group(0)
     elif contents.count("n"):
-        thisObject.accidental = "n"
+        accidental = "n"
     
     # 3.2.2 -- Slurs, Ties, Phrases
-    # TODO: add music21 phrase information
-    if contents.count('{'):
-        for i in range(0, contents.count('{')):
-            pass # phraseMark start
-    if contents.count('}'):
-        for i in range(0, contents.count('}')):
-            pass # phraseMark end
-    if contents.count('('):
-        for i in range(0, contents.count('(')):
-            pass # slur start
-    if contents.count(')'):
-        for i in range(0, contents.count(')')):
-            pass # slur end
+    # TODO: add music21 phrase information; 
+    # phrase marks ({ and }) and slurs (( and )) are not yet processed
+    tie = None
     if contents.count('['):
-        thisObject.tie = music21.tie.Tie("start")
+        tie = "start"
     elif contents.count(']'):
-        thisObject.tie = music21.tie.Tie("stop")
+        tie = "stop"
     elif contents.count('_'):
-        thisObject.tie = music21.tie.Tie("continue")
+        tie = "continue"
     
     ## 3.2.3 Ornaments    
+    # each expression is stored as a class and a tuple of attribute settings
+    expressions = []
     if contents.count('t'):
-        thisObject.notations.append(music21.expressions.HalfStepTrill())
+        expressions.append((music21.expressions.HalfStepTrill, ()))
     elif contents.count('T'):
-        thisObject.notations.append(music21.expressions.WholeStepTrill())
+        expressions.append((music21.expressions.WholeStepTrill, ()))
     
     if contents.count('w'):
-        thisObject.notations.append(music21.expressions.HalfStepInvertedMordent())
+        expressions.append((music21.expressions.HalfStepInvertedMordent, ()))
     elif contents.count('W'):
-        thisObject.notations.append(music21.expressions.WholeStepInvertedMordent())
+        expressions.append((music21.expressions.WholeStepInvertedMordent, ()))
     elif contents.count('m'):
-        thisObject.notations.append(music21.expressions.HalfStepMordent())
+        expressions.append((music21.expressions.HalfStepMordent, ()))
     elif contents.count('M'):
-        thisObject.notations.append(music21.expressions.WholeStepMordent())
+        expressions.append((music21.expressions.WholeStepMordent, ()))
 
     if contents.count('S'):
-        thisObject.notations.append(music21.expressions.Turn())
+        expressions.append((music21.expressions.Turn, ()))
     elif contents.count('$'):
-        thisObject.notations.append(music21.expressions.InvertedTurn())
+        expressions.append((music21.expressions.InvertedTurn, ()))
     elif contents.count('R'):
-        t1 = music21.expressions.Turn()
-        t1.connectedToPrevious = True  ## true by default, but explicitly
-        thisObject.notations.append(t1)
+        ## true by default, but explicitly
+        expressions.append((music21.expressions.Turn, 
+                           (('connectedToPrevious', True),)))
     
     if contents.count(':'):
         ## TODO: deal with arpeggiation -- should have been in a 
@@ -885,228 +1115,338 @@ def hdStringToNote(contents):
         pass
     
     if contents.count("O"):
-        thisObject.notations.append(music21.expressions.Ornament())  
         # generic ornament
+        expressions.append((music21.expressions.Ornament, ()))
     
     # 3.2.4 Articulation Marks
+    articulations = []
     if contents.count('\''):
-        thisObject.articulations.append(music21.articulations.Staccato())
+        articulations.append(music21.articulations.Staccato)
     if contents.count('"'):
-        thisObject.articulations.append(music21.articulations.Pizzicato())
+        articulations.append(music21.articulations.Pizzicato)
     if contents.count('`'):
         ### HMMMMM? WHAT DOES THIS MEAN?  Can't find it anywhere.
         raise HumdrumException("Attacca mark found -- what is that?  I cannot find any references to attacca marks anywhere on the web or reference books!")
     if contents.count('~'):
-        thisObject.articulations.append(music21.articulations.Tenuto())
+        articulations.append(music21.articulations.Tenuto)
     if contents.count('^'):
-        thisObject.articulations.append(music21.articulations.Accent())
+        articulations.append(music21.articulations.Accent)
     
     # 3.2.5 Up & Down Bows
     if contents.count('v'):
-        thisObject.articulations.append(music21.articulations.UpBow())
+        articulations.append(music21.articulations.UpBow)
     elif contents.count('u'):
-        thisObject.articulations.append(music21.articulations.DownBow())
+        articulations.append(music21.articulations.DownBow)
     
     # 3.2.6 Stem Directions
+    stemDirection = None
     if contents.count('/'):
-        thisObject.stemDirection = "up"
+        stemDirection = "up"
     elif contents.count('\\'):
-        thisObject.stemDirection = "down"        
+        stemDirection = "down"        
     
     # 3.2.7 Duration
     # 3.2.8 N-Tuplets
+    durationType = None
+    dots = 0
+    tuplet = None # numberNotesActual, numberNotesNormal, normal dots
     foundNumber = re.search("(\d+)", contents)
     if foundNumber:
-        durationType = int(foundNumber.group(1))
-        if durationType in duration.typeFromNumDict:
-            thisObject.duration.type = duration.typeFromNumDict[durationType]
-            if contents.count('.'):
-                thisObject.duration.dots = contents.count('.')
+        durationNumber = int(foundNumber.group(1))
+        if durationNumber in duration.typeFromNumDict:
+            durationType = duration.typeFromNumDict[durationNumber]
+            dots = contents.count('.')
         else:
-            dT = int(durationType) + 0.0
+            dT = int(durationNumber) + 0.0
             (remainder, exponents) = math.modf(math.log(dT, 2))
             basevalue = 2**exponents
-            thisObject.duration.type = duration.typeFromNumDict[int(basevalue)]
-            newTup = duration.Tuplet()
-            newTup.durationActual.type = thisObject.duration.type
-            newTup.durationNormal.type = thisObject.duration.type
-
+            durationType = duration.typeFromNumDict[int(basevalue)]
             gcd = common.euclidGCD(int(dT), basevalue)
-            newTup.numberNotesActual = dT/gcd
-            newTup.numberNotesNormal = float(basevalue)/gcd
-            
-            if contents.count('.'):
-                newTup.durationNormal.dots = contents.count('.')
-            
-            thisObject.duration.appendTuplet(newTup)
+            tuplet = (dT/gcd, float(basevalue)/gcd, contents.count('.'))
                     
     # 3.2.9 Grace Notes and Groupettos
     # TODO: Rewrite after music21 gracenotes are implemented
+    durationClass = None
     if contents.count('q'):
-        thisObject.duration.__class__ = music21.duration.GraceDuration
+        durationClass = music21.duration.GraceDuration
     elif contents.count('Q'):
-        thisObject.duration.__class__ = music21.duration.LongGraceDuration
+        durationClass = music21.duration.LongGraceDuration
     elif contents.count('P'):
-        thisObject.duration.__class__ = music21.duration.AppogiaturaStartDuration
+        durationClass = music21.duration.AppogiaturaStartDuration
     elif  contents.count('p'):
-        thisObject.duration.__class__ = music21.duration.AppogiaturaStopDuration
+        durationClass = music21.duration.AppogiaturaStopDuration
     
     # 3.2.10 Beaming
     # TODO: Support really complex beams
+    beams = []
     for i in range(0, contents.count('L')):
-        thisObject.beams.append('start')
+        beams.append(('start',))
     for i in range(0, contents.count('J')):
-        thisObject.beams.append('stop')
+        beams.append(('stop',))
     for i in range(0, contents.count('k')):
-        thisObject.beams.append('partial', 'right')
+        beams.append(('partial', 'right'))
     for i in range(0, contents.count('K')):
-        thisObject.beams.append('partial', 'right')
+        beams.append(('partial', 'right'))
     
+    return (isRest, step, octave, accidental, tie, tuple(expressions), 
+            tuple(articulations), stemDirection, durationType, dots, tuplet, 
+            durationClass, tuple(beams))
+
+def noteFromSpec(spec):
+    '''
+    Create a new Note or Rest from a specification tuple as returned 
+    by hdStringToNoteSpec().
+    '''
+    (isRest, step, octave, accidental, tie, expressions, articulations, 
+        stemDirection, durationType, dots, tuplet, durationClass, 
+        beams) = spec
+
+    # giving the type on creation avoids creating a default DurationUnit
+    if durationType is not None:
+        keywords = {'type': durationType}
+    else:
+        keywords = {}
+    if isRest:
+        thisObject = music21.note.Rest(**keywords)
+    else:
+        thisObject = music21.note.Note(**keywords)
+        thisObject.step = step
+        thisObject.octave = octave
+
+    if accidental is not None:
+        thisObject.accidental = accidental
+    if tie is not None:
+        thisObject.tie = music21.tie.Tie(tie)
+    for expressionClass, attributes in expressions:
+        expression = expressionClass()
+        for name, value in attributes:
+            setattr(expression, name, value)
+        thisObject.notations.append(expression)
+    for articulationClass in articulations:
+        thisObject.articulations.append(articulationClass())
+    if stemDirection is not None:
+        thisObject.stemDirection = stemDirection
+
+    if durationType is not None:
+        if tuplet is None:
+            if dots:
+                thisObject.duration.dots = dots
+        else:
+            newTup = duration.Tuplet()
+            newTup.durationActual.type = durationType
+            newTup.durationNormal.type = durationType
+            newTup.numberNotesActual = tuplet[0]
+            newTup.numberNotesNormal = tuplet[1]
+            if tuplet[2]:
+                newTup.durationNormal.dots = tuplet[2]
+            thisObject.duration.appendTuplet(newTup)
+    if durationClass is not None:
+        thisObject.duration.__class__ = durationClass
+
+    for beam in beams:
+        thisObject.beams.append(*beam)
     return thisObject
 
 def hdStringToMeasure(contents):
     '''
     kern uses an equals sign followed by processing instructions to
     create new measures.  Here is how...
+
+    Decoded tokens are cached; see hdStringToMeasureSpec().
     '''
-    m1 = music21.stream.Measure()
-    rematchMN = re.search("(\d+)([a-z]?)", contents)
+    spec = _kernMeasureSpecCache.get(contents)
+    if spec is None:
+        spec = hdStringToMeasureSpec(contents)
+        _kernMeasureSpecCache[contents] = spec
+    number, numberSuffix, style, repeatDots, pause = spec
 
+    m1 = music21.stream.Measure()
     #m1.setrightBarline()
     barline = bar.Barline()
     m1.rightBarline = barline
-        
-    
+    if number is not None:
+        m1.number = number
+        if numberSuffix:
+            m1.numberSuffix = numberSuffix
+    if style is not None:
+        barline.style = style
+    if repeatDots is not None:
+        barline.repeat_dots = repeatDots
+    if pause:
+        barline.pause = music21.expressions.Fermata()
+    return m1
+
+def hdStringToMeasureSpec(contents):
+    '''
+    Parse a kern barline token into an immutable tuple of (number, 
+    numberSuffix, style, repeatDots, pause).
+
+    >>> from music21 import *
+    >>> humdrum.spineParser.hdStringToMeasureSpec("=29a;:|:")
+    (29, 'a', 'regular', 'both', True)
+    '''
+    rematchMN = re.search("(\d+)([a-z]?)", contents)
+    number = None
+    numberSuffix = None
     if rematchMN:
-        m1.number = int(rematchMN.group(1))
+        number = int(rematchMN.group(1))
         if rematchMN.group(2):
-            m1.numberSuffix = rematchMN.group(2)
+            numberSuffix = rematchMN.group(2)
 
+    style = None
+    repeatDots = None
     if contents.count('-'):
-        m1.rightBarline.style = "none"
+        style = "none"
     elif contents.count('\''):
-        m1.rightBarline.style = "short"
+        style = "short"
     elif contents.count('`'):
-        m1.rightBarline.style = "tick"
+        style = "tick"
     elif contents.count('||'):
-        m1.rightBarline.style = "light-light"
+        style = "light-light"
         if contents.count(':') > 1:
-            m1.rightBarline.repeat_dots = "both"
+            repeatDots = "both"
         elif contents.count(':|'):
-            m1.rightBarline.repeat_dots = "left"
+            repeatDots = "left"
         elif contents.count('|:'):
-            m1.rightBarline.repeat_dots = "right"
+            repeatDots = "right"
     elif contents.count('!!'):
-        m1.rightBarline.style = "heavy-heavy"
+        style = "heavy-heavy"
         if contents.count(':') > 1:
-            m1.rightBarline.repeat_dots = "both"
+            repeatDots = "both"
         elif contents.count(':!'):
-            m1.rightBarline.repeat_dots = "left"
+            repeatDots = "left"
         elif contents.count('!:'):
-            m1.rightBarline.repeat_dots = "right"
+            repeatDots = "right"
     elif contents.count('|!'):
-        m1.rightBarline.style = "light-heavy"
+        style = "light-heavy"
         if contents.count(':') > 1:
-            m1.rightBarline.repeat_dots = "both"
+            repeatDots = "both"
         elif contents.count(':|'):
-            m1.rightBarline.repeat_dots = "left"
+            repeatDots = "left"
         elif contents.count('!:'):
-            m1.rightBarline.repeat_dots = "right"
+            repeatDots = "right"
     elif contents.count('!|'):
-        m1.rightBarline.style = "heavy-light"
+        style = "heavy-light"
         if contents.count(':') > 1:
-            m1.rightBarline.repeat_dots = "both"
+            repeatDots = "both"
         elif contents.count(':!'):
-            m1.rightBarline.repeat_dots = "left"
+            repeatDots = "left"
         elif contents.count('|:'):
-            m1.rightBarline.repeat_dots = "right"
+            repeatDots = "right"
     elif contents.count('|'):
-        m1.rightBarline.style = "regular"
+        style = "regular"
         if contents.count(':') > 1:
-            m1.rightBarline.repeat_dots = "both"
+            repeatDots = "both"
         elif contents.count(':|'):
-            m1.rightBarline.repeat_dots = "left"
+            repeatDots = "left"
         elif contents.count('|:'):
-            m1.rightBarline.repeat_dots = "right"
+            repeatDots = "right"
     elif contents.count('=='):
-        m1.rightBarline.style = "light-light"
+        style = "light-light"
         if contents.count(':') > 1:
-            m1.rightBarline.repeat_dots = "both"
+            repeatDots = "both"
             ## cannot specify single repeat does without styles
         if contents == "==|":
             raise HumdrumException \
                 ("Cannot import a double bar visually rendered as a single bar")
     
-    if contents.count(';'):
-        m1.rightBarline.pause = music21.expressions.Fermata()
-
-    return m1
+    pause = contents.count(';') > 0
+    return (number, numberSuffix, style, repeatDots, pause)
 
 
 def kernTandamToControl(tandam):
     '''
     kern uses *M5/4  *clefG2 etc, to control processing
+
+    Decoded tokens are cached; see kernTandamToControlSpec().
+
+    >>> from music21 import *
+    >>> humdrum.spineParser.kernTandamToControl('*M3/4')
+    <music21.meter.TimeSignature 3/4>
+    >>> humdrum.spineParser.kernTandamToControl('*^') == None
+    True
     '''
-    # TODO: Cover more tandam controls as they're found
     tandam = str(tandam)
-    
-    if tandam in spinePathIndicators:
+    spec = _kernTandamSpecCache.get(tandam)
+    if spec is None:
+        spec = kernTandamToControlSpec(tandam)
+        _kernTandamSpecCache[tandam] = spec
+    factory, arguments = spec
+    if factory is None:
         return None
+    return factory(*arguments)
+
+def kernTandamToControlSpec(tandam):
+    '''
+    Parse a kern tandem interpretation into an immutable tuple of a 
+    factory (a class or function) and a tuple of its arguments. If 
+    the tandem interpretation creates no object, the factory is None.
+
+    >>> from music21 import *
+    >>> humdrum.spineParser.kernTandamToControlSpec('*k[f#]')
+    (<class 'music21.key.KeySignature'>, (1,))
+    '''
+    # TODO: Cover more tandam controls as they're found
+    if tandam in spinePathIndicators:
+        return (None, ())
     elif tandam.startswith("*clef"):
         clefType = tandam[5:]
         if clefType == "-":
-            return music21.clef.NoClef()
+            return (music21.clef.NoClef, ())
         elif clefType == "X":
-            return music21.clef.PercussionClef()
+            return (music21.clef.PercussionClef, ())
         elif clefType == "Gv2": # undocumented in Humdrum, but appears in Huron's Chorales
-            return music21.clef.Treble8vbClef()
+            return (music21.clef.Treble8vbClef, ())
         elif clefType == "G^2": # unknown if ever used but better safe...
-            return music21.clef.Treble8vaClef()
+            return (music21.clef.Treble8vaClef, ())
         elif clefType == "Fv4": # unknown if ever used but better safe...
-            return music21.clef.Bass8vbClef()
+            return (music21.clef.Bass8vbClef, ())
         else:
             try:
-                clefifier = music21.clef.standardClefFromXN(clefType)
-                return clefifier
+                # test that the clef can be created
+                music21.clef.standardClefFromXN(clefType)
+                return (music21.clef.standardClefFromXN, (clefType,))
             except music21.clef.ClefException:
                 raise HumdrumException("Unknown clef type %s found", tandam)
     elif tandam.startswith("*MM"):
         metronomeMark = tandam[3:]
         try:
             metronomeMark = float(metronomeMark)
-            MM = music21.tempo.MetronomeMark(metronomeMark)    
-            return MM
+            return (music21.tempo.MetronomeMark, (metronomeMark,))
         except ValueError:
             metronomeMark = re.sub('^\[','',metronomeMark)
             metronomeMark = re.sub(']\s*$','',metronomeMark)
-            MS = music21.tempo.TempoMark(metronomeMark)
-            return MS
+            return (music21.tempo.TempoMark, (metronomeMark,))
     elif tandam.startswith("*M"):
         meterType = tandam[2:]
-        return music21.meter.TimeSignature(meterType)
+        return (music21.meter.TimeSignature, (meterType,))
     elif tandam.startswith("*IC"):
         instrumentClass = tandam[3:]
         # TODO: DO SOMETHING WITH INSTRUMENT CLASS; not in hum2xml
+        return (None, ())
     elif tandam.startswith("*IG"):
         instrumentGroup = tandam[3:]
         # TODO: DO SOMETHING WITH INSTRUMENT GROUP; not in hum2xml
+        return (None, ())
     elif tandam.startswith("*ITr"):
         instrumentTransposing = True
         # TODO: DO SOMETHING WITH TRANSPOSING INSTRUMENTS; not in hum2xml
+        return (None, ())
     elif tandam.startswith("*I"):
         instrument = tandam[2:]
         # TODO: SOMETHING WITH INSTRUMENTS; not in hum2xml
+        return (None, ())
     elif tandam.startswith("*k"):
         numSharps = tandam.count('#')
         if numSharps == 0:
             numSharps = -1 * (tandam.count('-'))
-        return music21.key.KeySignature(numSharps)
+        return (music21.key.KeySignature, (numSharps,))
     elif tandam.endswith(":"):
         thisKey = tandam[1:-1]
         # does not work yet
-        return music21.key.keyFromString(thisKey)
+        return (music21.key.keyFromString, (thisKey,))
     else:
-        return MiscTandam(tandam)
+        return (MiscTandam, (tandam,))
 
 #    elif tandam.startswith("*>"):
 #        # TODO: Something with 4.2 Repetitions; not in hum2xml
@@ -1218,6 +1558,44 @@ class Test(unittest.TestCase):
                 
                                    ## SOMETHING WRONG -- supposed to get 34, getting 20!
         self.assertEqual(GsharpCount, 34)
+
+    def testMeasureReader(self):
+        for data in [testFiles.mazurka6, testFiles.schubert, 
+                     testFiles.ivesSpring]:
+            hdc = HumdrumDataCollection(data)
+            batchNotes = []
+            for thisSpine in hdc.spineCollection:
+                for n in thisSpine.music21Objects.flat.notes:
+                    batchNotes.append((n.humdrumPosition, thisSpine.id, 
+                                       repr(n), n.quarterLength))
+
+            readerNotes = []
+            for chunk in HumdrumMeasureReader(data):
+                for obj in chunk:
+                    if isinstance(obj, music21.stream.Stream):
+                        notes = obj.flat.notes
+                    elif isinstance(obj, music21.note.GeneralNote):
+                        notes = [obj]
+                    else:
+                        notes = []
+                    for n in notes:
+                        readerNotes.append((n.humdrumPosition, 
+                            n.humdrumSpineId, repr(n), n.quarterLength))
+            # the reader also keeps Measures open when a spine splits or 
+            # joins; these are lost in HumdrumDataCollection
+            for n in batchNotes:
+                self.assertTrue(n in readerNotes)
+            self.assertTrue(len(readerNotes) >= len(batchNotes))
+
+        # measures are yielded as barlines are found
+        chunks = iter(HumdrumMeasureReader(testFiles.mazurka6))
+        # first chunk has objects found before the first barline
+        post = [x for x in chunks.next() 
+                if isinstance(x, music21.stream.Measure)]
+        self.assertEqual(post, [])
+        post = [(x.number, x.humdrumSpineId) for x in chunks.next() 
+                if isinstance(x, music21.stream.Measure)]
+        self.assertEqual(post, [(1, 0), (1, 1), (1, 2)])
         
 if __name__ == "__main__":
     music21.mainTest(Test)
\ No newline at end of file
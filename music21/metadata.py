@@ -34,6 +34,7 @@ import json
 import os
 import inspect
 import re
+import bisect
 
 import music21
 from music21 import common
@@ -56,6 +57,57 @@ class MetadataException(Exception):
 # utility dictionaries and conversion functions; used by objects defined in this
 # module
 
+# characters that, when found in a query string, cause that string to be 
+# used as a regular expression
+REGEX_CHARS = ['*', '.', '|', '+', '?', '{', '}']
+
+# fields of RichMetadata that can be searched by range of values; 'date' 
+# is searched by the year of the first date
+RANGE_FIELDS = ['ambitus', 'noteCount', 'quarterLength', 
+                'keySignatureFirstSharps', 'timeSignatureFirst', 'date']
+
+# tables used for storing a MetadataBundle in sqlite; each Metadata object is
+# stored as JSON, with values of search and range fields in indexed tables
+SQLITE_SCHEMA = '''
+CREATE TABLE metadata (key TEXT PRIMARY KEY, number TEXT, json TEXT);
+CREATE TABLE searchField (position INTEGER PRIMARY KEY, name TEXT);
+CREATE TABLE searchValue (key TEXT, name TEXT, value TEXT, lower TEXT);
+CREATE INDEX searchValueName ON searchValue (name);
+CREATE TABLE rangeValue (key TEXT, name TEXT, value);
+CREATE INDEX rangeValueNameValue ON rangeValue (name, value);
+'''
+
+def _toSqliteStr(value):
+    '''Return a string as a byte string for storage in sqlite. 
+
+    >>> _toSqliteStr(u'Ciconia')
+    'Ciconia'
+    >>> _toSqliteStr(None) == None
+    True
+    '''
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    return value
+
+def _isRegexQuery(query):
+    '''Return True if this query should be used as a regular expression.
+
+    >>> _isRegexQuery('beethoven')
+    False
+    >>> _isRegexQuery('haydn|beethoven')
+    True
+    >>> _isRegexQuery(re.compile('bach'))
+    True
+    '''
+    if hasattr(query, 'search'):
+        return True # already compiled
+    if common.isStr(query):
+        for char in REGEX_CHARS:
+            if char in query:
+                return True
+    return False
+
+
 # error can be designated with either symbol in string date representations
 APPROXIMATE = ['~', 'x']
 UNCERTAIN = ['?', 'z']
@@ -1096,6 +1148,8 @@ class Metadata(music21.Music21Object):
 
     In many cases, each Stream will have a single Metadata object at the zero offset position. 
     '''
+    # permit lazy JSON decoding; see __getattr__
+    _jsonLazy = True
 
     def __init__(self, *args, **keywords):
         '''
@@ -1154,6 +1208,11 @@ class Metadata(music21.Music21Object):
     def __getattr__(self, name):
         '''Utility attribute access for attributes that do not yet have property definitions. 
         '''
+        # attributes left undecoded by lazy JSON decoding
+        pending = self.__dict__.get('_jsonPending')
+        if pending and name in pending:
+            return self._jsonDecodePending(name)
+
         match = None
         for abbr, id in workIdAbbreviationDict.items():
         #for id in WORK_IDS:
@@ -1510,7 +1569,7 @@ class Metadata(music21.Music21Object):
             useRegex = True
             reQuery = query # already compiled
         # look for regex characters
-        elif common.isStr(query) and ('*' in query or '.' in query or '|' in query or '+' in query or '?' in query or '{' in query or '}' in query):
+        elif _isRegexQuery(query):
             useRegex = True
             reQuery = re.compile(query, flags=re.I) 
 
@@ -1681,6 +1740,11 @@ class RichMetadata(Metadata):
         self.pitchHighest = None
         self.pitchLowest = None
 
+        # numeric values for range searches
+        self.keySignatureFirstSharps = None
+        self.noteCount = None
+        self.quarterLength = None
+
         # append to existing search attributes from Metdata
         self._searchAttributes += ['keySignatureFirst', 'timeSignatureFirst', 'pitchHighest', 'pitchLowest'] 
 
@@ -1693,7 +1757,7 @@ class RichMetadata(Metadata):
         '''Define all attributes of this object that should be JSON serialized for storage and re-instantiation. Attributes that name basic Python objects or :class:`~music21.base.JSONSerializer` subclasses, or dictionaries or lists that contain Python objects or :class:`~music21.base.JSONSerializer` subclasses, can be provided.
         '''
         # add new names to base-class names
-        return ['keySignatureFirst', 'timeSignatureFirst', 'pitchHighest', 'pitchLowest'] + Metadata.jsonAttributes(self)
+        return ['keySignatureFirst', 'timeSignatureFirst', 'pitchHighest', 'pitchLowest', 'ambitus', 'keySignatureFirstSharps', 'noteCount', 'quarterLength'] + Metadata.jsonAttributes(self)
 
     def jsonComponentFactory(self, idStr):
         from music21 import meter
@@ -1746,6 +1810,23 @@ class RichMetadata(Metadata):
 
     def update(self, streamObj):
         '''Given a Stream object, update attributes with stored objects. 
+
+        In addition to string representations used for searching, numeric values are stored for range searches: the `ambitus` in half steps, the sharps of the first KeySignature, the number of notes, and the duration in quarter lengths.
+
+        >>> from music21 import *
+        >>> s = corpus.parseWork('bach/bwv66.6')
+        >>> rmd = metadata.RichMetadata()
+        >>> rmd.update(s)
+        >>> rmd.timeSignatureFirst
+        '4/4'
+        >>> rmd.keySignatureFirstSharps
+        3
+        >>> rmd.ambitus
+        34
+        >>> rmd.noteCount
+        165
+        >>> rmd.quarterLength
+        36.0
         '''
         environLocal.printDebug(['RichMetadata: calling update()'])
 
@@ -1764,10 +1845,24 @@ class RichMetadata(Metadata):
         self.pitchHighest = None
         self.pitchLowest = None
 
+        self.keySignatureFirstSharps = None
+        self.noteCount = None
+        self.quarterLength = None
 
         # get flat sorted stream
         flat = streamObj.flat.sorted
 
+        self.noteCount = len(flat.notes)
+        # the highestTime of a sorted Stream is taken from its last element,
+        # which for a Score is often a zero-duration Metadata object
+        quarterLength = 0.0
+        for e in streamObj.elements:
+            end = e.getOffsetBySite(streamObj)
+            if e.duration is not None:
+                end += e.duration.quarterLength
+            quarterLength = max(quarterLength, end)
+        self.quarterLength = float(quarterLength)
+
         tsStream = flat.getElementsByClass('TimeSignature')
         if len(tsStream) > 0:
             # just store the string representation  
@@ -1783,6 +1878,7 @@ class RichMetadata(Metadata):
         ksStream = flat.getElementsByClass('KeySignature')
         if len(ksStream) > 0:
             self.keySignatureFirst = str(ksStream[0])
+            self.keySignatureFirstSharps = ksStream[0].sharps
 #         for ks in ksStream:
 #             if ks not in self.keySignatures:
 #                 self.keySignatures.append(ts)
@@ -1794,10 +1890,56 @@ class RichMetadata(Metadata):
             # presently, these are numbers; convert to pitches later
             self.pitchLowest = str(psRange[0]) 
             self.pitchHighest = str(psRange[1])
+            self.ambitus = int(round(psRange[1] - psRange[0]))
 # 
 #         self.ambitus = analysisObj.getSolution(streamObj)
 
 
+    def updateFromScan(self, scanData):
+        '''Given a dictionary of values extracted directly from a file, such as that returned by :func:`~music21.musicxml.base.scanMetadata`, update the attributes that :meth:`~music21.metadata.RichMetadata.update` would otherwise derive from a parsed Stream. Work and movement titles and numbers, as well as contributors, are set if found.
+
+        >>> from music21 import *
+        >>> fp = corpus.getWork('bach/bwv66.6')
+        >>> rmd = metadata.RichMetadata()
+        >>> rmd.updateFromScan(musicxml.scanMetadata(fp))
+        >>> rmd.keySignatureFirst
+        'sharps 3, mode minor'
+        >>> rmd.pitchLowest, rmd.pitchHighest, rmd.ambitus
+        ('42', '76', 34)
+        '''
+        if scanData['movementNumber'] is not None:
+            self.movementNumber = scanData['movementNumber']
+        if scanData['movementName'] is not None:
+            self.movementName = scanData['movementName']
+        if scanData['title'] is not None:
+            self.title = scanData['title']
+        if scanData['number'] is not None:
+            self.number = scanData['number']
+        for role, name in scanData['contributors']:
+            c = Contributor()
+            if role is not None and role in ROLES:
+                c.role = role
+            c.name = name
+            self._contributors.append(c)
+
+        self.timeSignatureFirst = scanData['timeSignatureFirst']
+        self.keySignatureFirst = scanData['keySignatureFirst']
+        self.keySignatureFirstSharps = scanData['keySignatureFirstSharps']
+        self.noteCount = scanData['noteCount']
+        self.quarterLength = float(scanData['quarterLength'])
+
+        self.ambitus = None
+        self.pitchHighest = None
+        self.pitchLowest = None
+        if scanData['pitchLowest'] is not None:
+            # truncated as in discrete.Ambitus.getPitchSpan()
+            psLowest = int(scanData['pitchLowest'])
+            psHighest = int(scanData['pitchHighest'])
+            self.pitchLowest = str(psLowest) 
+            self.pitchHighest = str(psHighest)
+            self.ambitus = psHighest - psLowest
+
+
 
 
 
@@ -1821,6 +1963,26 @@ class MetadataBundle(music21.JSONSerializer):
         # keys are the same for self._storage
         self._accessPaths = {}
 
+        # search index, built from self._storage when loaded or when first 
+        # searched; set to None whenever self._storage changes
+        # keys are field names, values are dictionaries of storage key to 
+        # lower-case string value
+        self._indexValues = None
+        # keys are field names, values are dictionaries of three-character
+        # substrings to sets of storage keys
+        self._indexTrigrams = None
+        # field names in the order in which they are searched
+        self._indexFields = []
+        # keys are names in RANGE_FIELDS, values are a pair of a sorted list
+        # of values and a list of storage keys in the same order
+        self._indexRanges = None
+
+        # when read from sqlite, the connection to the database; 
+        # self._storage then only stores Metadata objects already requested
+        self._connection = None
+        # when read from sqlite, a dictionary of all keys to work numbers
+        self._sqliteNumbers = {}
+
     #---------------------------------------------------------------------------
     # overridden methods for json processing 
 
@@ -1869,20 +2031,52 @@ class MetadataBundle(music21.JSONSerializer):
     
     
 
-    def addFromPaths(self, pathList):
+    def _scanPath(self, fp):
+        '''Return a RichMetadata object for the file at `fp` extracted without creating a Stream, or None if the format of this file does not support scanning. 
+        '''
+        from music21 import musicxml
+        fmt, ext = common.findFormatExtFile(fp)
+        # compressed musicxml files must be parsed
+        if fmt != 'musicxml' or ext == '.mxl':
+            return None
+        try:
+            scanData = musicxml.scanMetadata(fp)
+        except Exception, e:
+            environLocal.printDebug(['_scanPath: cannot scan:', fp, e])
+            return None
+        rmd = RichMetadata()
+        rmd.updateFromScan(scanData)
+        return rmd
+
+
+    def addFromPaths(self, pathList, fast=False):
         '''Parse and store metadata from numerous files
 
+        If `fast` is True, MusicXML files are scanned for the values stored in :class:`~music21.metadata.RichMetadata` without creating a Stream; files in other formats, or files that cannot be scanned, are parsed as usual. 
+
         >>> from music21 import *
         >>> mb = MetadataBundle()
         >>> mb.addFromPaths(corpus.getWorkList('bwv66.6'))
         >>> len(mb._storage)
         1
+        >>> mbFast = MetadataBundle()
+        >>> mbFast.addFromPaths(corpus.getWorkList('bwv66.6'), fast=True)
+        >>> mbFast._storage.keys() == mb._storage.keys()
+        True
         '''
+        if self._connection is not None:
+            raise MetadataException('cannot add to a MetadataBundle read from sqlite')
         # converter imports modules that import metadata
         from music21 import converter
         for fp in pathList:
             environLocal.printDebug(['updateMetadataCache: examining:', fp])
             cp = self.corpusPathToKey(fp)
+            if fast:
+                rmd = self._scanPath(fp)
+                if rmd is not None:
+                    environLocal.printDebug(['updateMetadataCache: storing:', cp])
+                    self._storage[cp] = rmd
+                    continue
             post = converter.parse(fp, forceSource=True)
             if 'Opus' in post.classes:
                 # need to get scores from each opus?
@@ -1910,6 +2104,7 @@ class MetadataBundle(music21.JSONSerializer):
                 rmd.update(post) # update based on Stream
                 environLocal.printDebug(['updateMetadataCache: storing:', cp])
                 self._storage[cp] = rmd
+        self._indexValues = None
 
 
     def addFromVirtualWorks(self, pathList):
@@ -1918,25 +2113,152 @@ class MetadataBundle(music21.JSONSerializer):
 
     def write(self):
         '''Write the JSON storage of all Metadata or RichMetadata contained in this object. 
+
+        If read from sqlite, all stored objects are first created with :meth:`~music21.metadata.MetadataBundle.loadSqlite`.
         '''
+        self.loadSqlite()
         fp = os.path.join(common.getMetadataCacheFilePath(), self._name + '.json')
         environLocal.printDebug(['MetadataBundle: writing:', fp])
         self.jsonWrite(fp)
 
 
-    def read(self, fp=None):
+    def read(self, fp=None, lazy=False):
         '''Load self from the file path suggested by the _name of this MetadataBundle
+
+        If `lazy` is True, the components of each Metadata object (such as Contributor, Date, and Text objects) are created only when first accessed, and each field of the search index is built when first searched. A search of one field then creates only the components that field needs. 
         '''
 
         t = common.Timer()
         t.start()
         if fp == None:
             fp = os.path.join(common.getMetadataCacheFilePath(), self._name + '.json')
-        self.jsonRead(fp)
+        self.jsonRead(fp, lazy=lazy)
+        self._buildIndex(lazy=lazy)
 
         environLocal.printDebug(['MetadataBundle: loading time:', self._name, t, 'md items:', len(self._storage)])
 
 
+    def writeSqlite(self, fp=None):
+        '''Write all Metadata or RichMetadata contained in this object to an sqlite database, replacing any existing file. By default, the file path is suggested by the _name of this MetadataBundle, with a .db extension.
+
+        Each object is stored as JSON, along with indexed tables of values used by search() and searchRange(). If read from sqlite, all stored objects are first created with :meth:`~music21.metadata.MetadataBundle.loadSqlite`.
+        '''
+        import sqlite3
+        if fp == None:
+            fp = os.path.join(common.getMetadataCacheFilePath(), 
+                              self._name + '.db')
+        self.loadSqlite()
+        environLocal.printDebug(['MetadataBundle: writing:', fp])
+        if self._indexValues is None:
+            self._buildIndex(lazy=True)
+        if os.path.exists(fp):
+            os.remove(fp)
+
+        conn = sqlite3.connect(fp)
+        conn.text_factory = str
+        try:
+            conn.executescript(SQLITE_SCHEMA)
+            conn.executemany('INSERT INTO searchField VALUES (?, ?)', 
+                             enumerate(self._indexFields))
+            for key, md in self._storage.items():
+                conn.execute('INSERT INTO metadata VALUES (?, ?, ?)', 
+                    (key, _toSqliteStr(md.number), md.json))
+                for f in md._searchAttributes:
+                    v = getattr(md, f)
+                    if common.isStr(v):
+                        lower = _toSqliteStr(v.lower())
+                    else:
+                        lower = None
+                        v = str(v)
+                    conn.execute('INSERT INTO searchValue VALUES (?, ?, ?, ?)', 
+                        (key, f, _toSqliteStr(v), lower))
+                for f in RANGE_FIELDS:
+                    v = self._getRangeValue(md, f)
+                    if v is not None:
+                        conn.execute('INSERT INTO rangeValue VALUES (?, ?, ?)', 
+                            (key, f, _toSqliteStr(v)))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+    def readSqlite(self, fp=None):
+        '''Open an sqlite database written by writeSqlite() for searching. By default, the file path is suggested by the _name of this MetadataBundle, with a .db extension.
+
+        Stored Metadata objects are not created when reading; search() and searchRange() query the database, and :meth:`~music21.metadata.MetadataBundle.getMetadata` creates objects only as requested.
+        '''
+        import sqlite3
+        if fp == None:
+            fp = os.path.join(common.getMetadataCacheFilePath(), 
+                              self._name + '.db')
+        t = common.Timer()
+        t.start()
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = sqlite3.connect(fp)
+        self._connection.text_factory = str
+
+        self._storage = {}
+        self._indexValues = None
+        self._indexTrigrams = None
+        self._indexRanges = None
+        self._indexFields = [row[0] for row in self._connection.execute(
+            'SELECT name FROM searchField ORDER BY position')]
+        self._sqliteNumbers = dict(self._connection.execute(
+            'SELECT key, number FROM metadata'))
+
+        environLocal.printDebug(['MetadataBundle: sqlite loading time:', self._name, t, 'md items:', len(self._sqliteNumbers)])
+
+
+    def loadSqlite(self):
+        '''If read from sqlite, create all stored Metadata objects not yet requested and close the database, so that this MetadataBundle holds all of its data as if read from JSON. Otherwise, do nothing.
+        '''
+        if self._connection is None:
+            return
+        for key in self._sqliteNumbers.keys():
+            self.getMetadata(key)
+        self._connection.close()
+        self._connection = None
+        self._sqliteNumbers = {}
+        self._buildIndex()
+
+
+    def getKeys(self):
+        '''Return a list of the keys of all stored Metadata objects.
+
+        >>> from music21 import *
+        >>> mb = MetadataBundle()
+        >>> mb._storage['a'] = Metadata(title='Gloria')
+        >>> mb.getKeys()
+        ['a']
+        '''
+        if self._connection is not None:
+            return self._sqliteNumbers.keys()
+        return self._storage.keys()
+
+
+    def getMetadata(self, key):
+        '''Return the Metadata object stored with `key`. If read from sqlite, the object is created from its stored JSON the first time it is requested.
+
+        >>> from music21 import *
+        >>> mb = MetadataBundle()
+        >>> mb._storage['a'] = Metadata(title='Gloria')
+        >>> mb.getMetadata('a').title
+        'Gloria'
+        '''
+        if key in self._storage or self._connection is None:
+            return self._storage[key]
+        row = self._connection.execute(
+            'SELECT json FROM metadata WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        d = json.loads(row[0])
+        md = self.jsonComponentFactory(d['__class__'])
+        md.json = d
+        self._storage[key] = md
+        return md
+
+
     def updateAccessPaths(self, pathList):
         '''For each stored Metatadata object, create an entry for a complete, local file path that returns this.
 
@@ -1954,7 +2276,8 @@ class MetadataBundle(music21.JSONSerializer):
         # always clear first
         self._accessPaths = {}
         # create a copy to manipulate
-        keyOptions = self._storage.keys()
+        keyOptions = self.getKeys()
+        keySet = set(keyOptions)
 
         for fp in pathList:
     
@@ -1966,12 +2289,9 @@ class MetadataBundle(music21.JSONSerializer):
             cpStub = '_'.join(cp.split('_')[:-1]) # get all but last underscore
     
             match = False
-            try:
-                md = self._storage[cp]
+            if cp in keySet:
                 self._accessPaths[cp] = fp
                 match = True
-            except KeyError:
-                pass
 
             if not match:
                 # see if there is work id alternative
@@ -1982,11 +2302,232 @@ class MetadataBundle(music21.JSONSerializer):
         #environLocal.printDebug(['metadata grouping time:', t, 'md bundles found:', len(post)])
         #return post
 
+    def _buildIndex(self, lazy=False):
+        '''Build the search index from all stored metadata. For each search attribute, the lower-case string value of each stored Metadata object is stored, as well as a table of all three-character substrings found in those values. 
+
+        If `lazy` is True, only the names of the search attributes are found; each field is indexed when first searched, so that Metadata objects read with lazy JSON decoding only decode the components needed for that field.
+
+        >>> from music21 import *
+        >>> mb = MetadataBundle()
+        >>> mb._storage['a'] = Metadata(title='Gloria')
+        >>> mb._storage['b'] = Metadata(title='Gloria in excelsis')
+        >>> mb._buildIndex()
+        >>> mb._indexValues['title']['b']
+        'gloria in excelsis'
+        >>> sorted(mb._indexTrigrams['title']['lor'])
+        ['a', 'b']
+        >>> sorted(mb._indexTrigrams['title']['exc'])
+        ['b']
+
+        Values of fields named in RANGE_FIELDS are stored in sorted order.
+
+        >>> mb._storage['a'].date = '1723'
+        >>> mb._storage['b'].date = '1701'
+        >>> mb._buildIndex()
+        >>> mb._indexRanges['date']
+        ([1701, 1723], ['b', 'a'])
+        '''
+        fields = []
+        for md in self._storage.values():
+            for f in md._searchAttributes:
+                if f not in fields:
+                    fields.append(f)
+        self._indexFields = fields
+        self._indexValues = {}
+        self._indexTrigrams = {}
+        self._indexRanges = {}
+        if not lazy:
+            for f in fields:
+                self._indexSearchField(f)
+            for f in RANGE_FIELDS:
+                self._indexRangeField(f)
+
+    def _indexSearchField(self, field):
+        '''Store the lower-case string values of one search attribute, and the table of their three-character substrings, if not already stored.
+        '''
+        if field in self._indexValues:
+            return
+        values = {}
+        trigrams = {}
+        for key, md in self._storage.items():
+            if field not in md._searchAttributes:
+                continue
+            v = getattr(md, field)
+            # only strings can match non-regular expression queries
+            if not common.isStr(v):
+                continue
+            v = v.lower()
+            values[key] = v
+            for i in range(len(v) - 2):
+                gram = v[i:i+3]
+                if gram not in trigrams:
+                    trigrams[gram] = set()
+                trigrams[gram].add(key)
+        self._indexValues[field] = values
+        self._indexTrigrams[field] = trigrams
+
+    def _indexRangeField(self, field):
+        '''Store the sorted values of one field named in RANGE_FIELDS, if not already stored.
+        '''
+        if field in self._indexRanges:
+            return
+        pairs = []
+        for key, md in self._storage.items():
+            v = self._getRangeValue(md, field)
+            if v is not None:
+                pairs.append((v, key))
+        pairs.sort()
+        self._indexRanges[field] = ([v for v, key in pairs], 
+                                    [key for v, key in pairs])
+
+    def _getRangeValue(self, md, field):
+        '''Return the value of a Metadata object for a field in RANGE_FIELDS, or None.
+        '''
+        if field == 'date':
+            if md._date is None:
+                return None
+            # use the year of the first Date
+            return md._date._data[0].year
+        return getattr(md, field, None)
+
+    def _getIndexFields(self, field):
+        '''Return a list of indexed field names to search for the `field` argument to search(), or None if the `field` names an attribute that is not indexed.
+
+        As in :meth:`~music21.metadata.Metadata.search`, a `field` that is not an attribute name is matched to the first search attribute that contains it. 
+
+        >>> from music21 import *
+        >>> mb = MetadataBundle()
+        >>> mb._storage['a'] = RichMetadata(title='Gloria')
+        >>> mb._buildIndex()
+        >>> mb._getIndexFields('title')
+        ['title']
+        >>> mb._getIndexFields('locale')
+        ['localeOfComposition']
+        >>> mb._getIndexFields('timeSignature')
+        ['timeSignatureFirst']
+        >>> mb._getIndexFields('groups') == None
+        True
+        >>> mb._getIndexFields('zzz')
+        []
+        '''
+        if field == None:
+            return self._indexFields
+        if field in self._indexFields:
+            return [field]
+        for key in self.getKeys():
+            if hasattr(self.getMetadata(key), field):
+                return None
+            break # all stored objects share attributes
+        for f in self._indexFields:
+            if field.lower() in f.lower():
+                return [f]
+        return []
+
+    def _searchIndex(self, query, fields):
+        '''Return a set of storage keys whose values, in any of the named fields, contain the lower-case string `query`.
+        '''
+        matched = set()
+        for f in fields:
+            self._indexSearchField(f)
+            fieldValues = self._indexValues[f]
+            if len(query) < 3:
+                candidates = fieldValues.keys()
+            else:
+                fieldTrigrams = self._indexTrigrams[f]
+                gramSets = []
+                for i in range(len(query) - 2):
+                    keys = fieldTrigrams.get(query[i:i+3])
+                    if keys is None: # no value contains this substring
+                        gramSets = None
+                        break
+                    gramSets.append(keys)
+                if gramSets is None:
+                    continue
+                gramSets.sort(key=len)
+                candidates = gramSets[0].intersection(*gramSets[1:])
+            for key in candidates:
+                if key not in matched and query in fieldValues[key]:
+                    matched.add(key)
+        return matched
+
+    def _getResults(self, matched, extList=None):
+        '''Given a collection of storage keys, return a list of pairs of file paths and work numbers, sorted by key, and limited to file paths ending with an extension in `extList`.
+        '''
+        post = []
+        found = set()
+        for key in sorted(matched):
+            if self._connection is not None:
+                number = self._sqliteNumbers[key]
+            else:
+                number = self._storage[key].number
+            # returns a pair of file path, work number
+            result = (self._accessPaths[key], number)
+            include = False
+
+            if extList != None:
+                for ext in extList:
+                    if result[0].endswith(ext):
+                        include = True
+                        break
+            else:
+                include = True
+
+            if include and result not in found:
+                found.add(result)
+                post.append(result)  
+        return post
+
+    def searchRange(self, field, minimum=None, maximum=None, extList=None):
+        '''Search stored RichMetadata for values of `field` between `minimum` and `maximum`, inclusive. If either is None, the range is not limited in that direction. Provide the same value for `minimum` and `maximum` to find equal values.
+
+        The `field` must be one of the names in RANGE_FIELDS: 'ambitus' (in half steps), 'noteCount', 'quarterLength', 'keySignatureFirstSharps', 'timeSignatureFirst' (a string such as '3/4'), or 'date' (the year of the first date). Values are found from sorted indices, without examining each stored object.
+
+        Return pairs of file paths and work numbers; results of multiple searches can be combined as sets.
+
+        >>> from music21 import *
+        >>> mb = MetadataBundle()
+        >>> mb.addFromPaths(corpus.getWorkList('bach/bwv66.6'))
+        >>> mb.updateAccessPaths(corpus.getWorkList('bach/bwv66.6'))
+        >>> len(mb.searchRange('noteCount', maximum=200))
+        1
+        >>> len(mb.searchRange('timeSignatureFirst', '3/4', '3/4'))
+        0
+        '''
+        if field not in RANGE_FIELDS:
+            raise MetadataException('cannot search a range of field: %s' % field)
+        if self._connection is not None:
+            sql = 'SELECT key FROM rangeValue WHERE name = ?'
+            args = [field]
+            if minimum is not None:
+                sql += ' AND value >= ?'
+                args.append(_toSqliteStr(minimum))
+            if maximum is not None:
+                sql += ' AND value <= ?'
+                args.append(_toSqliteStr(maximum))
+            matched = [row[0] for row in self._connection.execute(sql, args)]
+            return self._getResults(matched, extList)
+
+        if self._indexValues is None:
+            self._buildIndex(lazy=True)
+        self._indexRangeField(field)
+        values, keys = self._indexRanges[field]
+        if minimum is None:
+            start = 0
+        else:
+            start = bisect.bisect_left(values, minimum)
+        if maximum is None:
+            end = len(values)
+        else:
+            end = bisect.bisect_right(values, maximum)
+        return self._getResults(keys[start:end], extList)
+
     def search(self, query, field=None, extList=None):
         '''Perform search, on all stored metadata, permit regular expression matching. 
 
         Return pairs of file paths and work numbers, or None
 
+        String queries are answered from an index of stored values built when this bundle is read or first searched; only regular expression queries, or queries of attributes that are not search attributes, examine each stored Metadata object. 
+
         >>> from music21 import *
         >>> mb = MetadataBundle()
         >>> mb.addFromPaths(corpus.getWorkList('ciconia'))
@@ -2001,26 +2542,64 @@ class MetadataBundle(music21.JSONSerializer):
         >>> len(post) # no files in this format
         1
         '''
-        post = []
-        for key in self._storage.keys():
-            md = self._storage[key]
-            match, fieldPost = md.search(query, field)
-            if match:
-                # returns a pair of file path, work number
-                result = (self._accessPaths[key], md.number)
-                include = False
-
-                if extList != None:
-                    for ext in extList:
-                        if result[0].endswith(ext):
-                            include = True
-                            break
-                else:
-                    include = True
+        if self._connection is not None:
+            return self._getResults(self._searchSqlite(query, field), extList)
 
-                if include and result not in post:
-                    post.append(result)  
-        return post
+        if self._indexValues is None:
+            self._buildIndex(lazy=True)
+
+        fields = None
+        if _isRegexQuery(query):
+            if not hasattr(query, 'search'):
+                # compile once, rather than once per stored object
+                query = re.compile(query, flags=re.I) 
+        else:
+            fields = self._getIndexFields(field)
+
+        if fields is None:
+            matched = []
+            for key, md in self._storage.items():
+                match, fieldPost = md.search(query, field)
+                if match:
+                    matched.append(key)
+        else:
+            matched = self._searchIndex(str(query).lower(), fields)
+        return self._getResults(matched, extList)
+
+    def _searchSqlite(self, query, field):
+        '''Return a list of storage keys matching a search() query, selected from the sqlite database.
+        '''
+        useRegex = _isRegexQuery(query)
+        if useRegex and not hasattr(query, 'search'):
+            query = re.compile(query, flags=re.I) 
+
+        fields = self._getIndexFields(field)
+        if fields is None: # must create and search all objects
+            matched = []
+            for key in self.getKeys():
+                match, fieldPost = self.getMetadata(key).search(query, field)
+                if match:
+                    matched.append(key)
+            return matched
+        if len(fields) == 0:
+            return []
+
+        sql = 'SELECT key, value FROM searchValue WHERE name IN (%s)' % (
+               ', '.join(['?'] * len(fields)))
+        args = list(fields)
+        if not useRegex:
+            # match substrings with LIKE, escaping its wildcards
+            sql += " AND lower LIKE ? ESCAPE '\\'"
+            q = _toSqliteStr(str(query).lower())
+            for char in ['\\', '%', '_']:
+                q = q.replace(char, '\\' + char)
+            args.append('%' + q + '%')
+        matched = set()
+        for key, value in self._connection.execute(sql, args):
+            if useRegex and query.search(value) is None:
+                continue
+            matched.add(key)
+        return matched
 
 
 
@@ -2291,6 +2870,235 @@ class Test(unittest.TestCase):
         self.assertEqual(s.metadata.search('qu.d', 'title'), (True, 'title'))
         self.assertEqual(s.metadata.search(re.compile('(.*)canon(.*)')), (True, 'title'))
 
+    def testMetadataBundleSearchIndex(self):
+        # index searches must return the same results as searching each
+        # stored Metadata object
+        mb = MetadataBundle()
+        titles = ['Gloria', 'Gloria in excelsis', 'Quod jactatur', 'Canon', 
+                  'Le ray au soleyl', 'Una panthera', None]
+        composers = ['Ciconia, Johannes', 'Bach, Johann Sebastian', 
+                     'Beethoven, Ludwig van']
+        for i, title in enumerate(titles):
+            md = RichMetadata(title=title, composer=composers[i % 3])
+            md.timeSignatureFirst = ['3/4', '6/8', None][i % 3]
+            md.number = str(i)
+            mb._storage['work%s' % i] = md
+            mb._accessPaths['work%s' % i] = 'work%s.xml' % (i % 5)
+
+        def linearSearch(query, field):
+            post = []
+            for key in sorted(mb._storage.keys()):
+                md = mb._storage[key]
+                if md.search(query, field)[0]:
+                    result = (mb._accessPaths[key], md.number)
+                    if result not in post:
+                        post.append(result)
+            return post
+
+        for query, field in [('glo', 'title'), ('GLORIA IN', 'title'),
+            ('ria in ex', None), ('o', 'title'), ('jo', 'composer'), 
+            ('johann', None), ('beethoven', 'compose'), ('zzz', None), 
+            ('3/4', 'timeSignature'), ('8', None), ('', 'title'), 
+            ('1', 'number'), ('gloria', 'locale'), ('gloria', 'zzz'),
+            ('glo.*', 'title'), ('bach|ciconia', None), 
+            (re.compile('sol'), 'title'), ('none', 'title'), 
+            ('gloria', 'priority')]:
+            self.assertEqual(mb.search(query, field), 
+                             linearSearch(query, field))
+        self.assertEqual(len(mb.search('gloria')), 2)
+
+        # index is rebuilt after storage changes
+        mb.addFromPaths([])
+        self.assertEqual(mb._indexValues, None)
+        self.assertEqual(len(mb.search('gloria')), 2)
+
+    def testMetadataBundleSearchRange(self):
+        mb = MetadataBundle()
+        for i in range(12):
+            md = RichMetadata(title='work %s' % i)
+            md.number = str(i)
+            md.timeSignatureFirst = ['3/4', '4/4', '6/8'][i % 3]
+            md.ambitus = i * 2 # 0 to 22
+            md.noteCount = i * 50 # 0 to 550
+            md.quarterLength = i * 12.0
+            if i % 2 == 0:
+                md.date = str(1700 + i)
+            mb._storage['work%s' % i] = md
+            mb._accessPaths['work%s' % i] = 'work%s.xml' % i
+
+        # all 3/4 works with ambitus under an octave, fewer than 200 notes
+        post = (set(mb.searchRange('timeSignatureFirst', '3/4', '3/4')) &
+                set(mb.searchRange('ambitus', maximum=11)) &
+                set(mb.searchRange('noteCount', maximum=199)))
+        self.assertEqual(sorted(post), [('work0.xml', '0'), ('work3.xml', '3')])
+
+        self.assertEqual(len(mb.searchRange('quarterLength', 24, 48)), 3)
+        self.assertEqual(len(mb.searchRange('quarterLength', minimum=100)), 3)
+        self.assertEqual(len(mb.searchRange('date', 1702, 1706)), 3)
+        self.assertEqual(len(mb.searchRange('date')), 6)
+        self.assertEqual(len(mb.searchRange('keySignatureFirstSharps')), 0)
+        self.assertEqual(len(mb.searchRange('ambitus', 5, 4)), 0)
+        self.assertEqual(len(mb.searchRange('ambitus', extList=['.krn'])), 0)
+        self.assertRaises(MetadataException, mb.searchRange, 'title')
+
+        # new values are stored in json
+        md = mb._storage['work4']
+        mdNew = RichMetadata()
+        mdNew.json = md.json
+        self.assertEqual(mdNew.ambitus, 8)
+        self.assertEqual(mdNew.noteCount, 200)
+        self.assertEqual(mdNew.quarterLength, 48.0)
+
+    def testMetadataBundleLazy(self):
+        mb = MetadataBundle()
+        for i in range(6):
+            md = RichMetadata(title='work %s' % i, composer='Ciconia')
+            md.date = str(1390 + i)
+            md.number = str(i)
+            mb._storage['work%s' % i] = md
+            mb._accessPaths['work%s' % i] = 'work%s.xml' % i
+        fp = environLocal.getTempFile('.json')
+        mb.jsonWrite(fp)
+
+        mbNew = MetadataBundle()
+        mbNew.read(fp, lazy=True)
+        mbNew._accessPaths = mb._accessPaths
+        md = mbNew._storage['work3']
+        self.assertEqual(sorted(md._jsonPending.keys()), 
+                         ['_contributors', '_date', '_workIds'])
+        # undecoded components are written without being decoded
+        self.assertEqual(json.loads(mbNew.json)['__attr__'], 
+                         json.loads(mb.json)['__attr__'])
+        self.assertEqual(len(md._jsonPending), 3)
+
+        self.assertEqual(md.date, '1393/--/--')
+        self.assertEqual(md.title, 'work 3')
+        self.assertEqual(mbNew.search('cicon', 'composer'), 
+                         mb.search('cicon', 'composer'))
+        self.assertEqual(len(md._jsonPending), 0)
+
+        # searches of one field decode only the components that field needs
+        mbNew = MetadataBundle()
+        mbNew.read(fp, lazy=True)
+        mbNew._accessPaths = mb._accessPaths
+        self.assertEqual(mbNew.search('work 3', 'title'),
+                         mb.search('work 3', 'title'))
+        self.assertEqual(mbNew.searchRange('noteCount'),
+                         mb.searchRange('noteCount'))
+        for md in mbNew._storage.values():
+            self.assertEqual(sorted(md._jsonPending.keys()),
+                             ['_contributors', '_date'])
+        self.assertEqual(mbNew.searchRange('date', 1392, 1394),
+                         mb.searchRange('date', 1392, 1394))
+        self.assertEqual(mbNew.search('work'), mb.search('work'))
+        for md in mbNew._storage.values():
+            self.assertEqual(len(md._jsonPending), 0)
+        os.remove(fp)
+
+    def testMetadataBundleSqlite(self):
+        mb = MetadataBundle()
+        titles = ['Gloria', 'Gloria in excelsis', 'Quod jactatur', 'Canon', 
+                  u'Le ray au soleyl \xe9', 'Una panthera', None]
+        for i, title in enumerate(titles):
+            md = RichMetadata(title=title, composer='Ciconia, Johannes')
+            md.number = str(i)
+            md.timeSignatureFirst = ['3/4', '6/8'][i % 2]
+            md.noteCount = i * 10
+            md.quarterLength = i * 2.5
+            md.date = str(1390 + i)
+            mb._storage['work%s' % i] = md
+            mb._accessPaths['work%s' % i] = 'work%s.xml' % i
+
+        fp = environLocal.getTempFile('.db')
+        mb.writeSqlite(fp)
+        mbNew = MetadataBundle()
+        mbNew.readSqlite(fp)
+        mbNew.updateAccessPaths(['work%s.xml' % i for i in range(7)])
+        self.assertEqual(sorted(mbNew.getKeys()), sorted(mb.getKeys()))
+        self.assertEqual(mbNew._accessPaths, mb._accessPaths)
+
+        for query, field in [('glo', 'title'), ('GLORIA IN', 'title'),
+            ('ria in ex', None), ('o', 'title'), ('cicon', 'composer'), 
+            ('zzz', None), ('3/4', 'timeSignature'), ('', 'title'), 
+            ('1', 'number'), ('gloria', 'zzz'), ('glo.*', 'title'), 
+            ('jac|ray', None), (re.compile('sol'), 'title'), 
+            ('none', 'title')]:
+            self.assertEqual(mbNew.search(query, field), 
+                             mb.search(query, field))
+        for field, minimum, maximum in [('noteCount', 10, 40), 
+            ('quarterLength', None, 5.0), ('date', 1392, None), 
+            ('timeSignatureFirst', '6/8', '6/8'), ('ambitus', None, None)]:
+            self.assertEqual(mbNew.searchRange(field, minimum, maximum), 
+                             mb.searchRange(field, minimum, maximum))
+        # only one object has been created, to look for the 'zzz' attribute
+        self.assertEqual(len(mbNew._storage), 1)
+
+        md = mbNew.getMetadata('work4')
+        self.assertEqual(md.title, mb.getMetadata('work4').title)
+        self.assertEqual(md.noteCount, 40)
+        self.assertEqual(mbNew.getMetadata('work4') is md, True)
+        # attributes that are not search attributes require all objects
+        self.assertEqual(mbNew.search('0', 'priority'), 
+                         mb.search('0', 'priority'))
+        self.assertEqual(len(mbNew._storage), 7)
+        self.assertRaises(MetadataException, mbNew.addFromPaths, [])
+        mbNew._connection.close()
+
+        # wildcards of LIKE are matched literally
+        mb = MetadataBundle()
+        for i, title in enumerate(['Canon 100%', 'Canon_a', 'Canon\\b', 
+                                   'Canon ab']):
+            mb._storage['work%s' % i] = Metadata(title=title)
+        mb.writeSqlite(fp)
+        mbNew = MetadataBundle()
+        mbNew.readSqlite(fp)
+        for query in ['%', '_', '\\', 'n_', 'n%', '0%', 'canon']:
+            self.assertEqual(mbNew._searchSqlite(query, 'title'),
+                             set(mb._searchIndex(query, ['title'])))
+        self.assertEqual(len(mbNew._searchSqlite('_', 'title')), 1)
+
+        # writing first creates all stored objects
+        fpNew = environLocal.getTempFile('.db')
+        mbNew.writeSqlite(fpNew)
+        self.assertEqual(mbNew._connection, None)
+        self.assertEqual(len(mbNew._storage), 4)
+        self.assertEqual(mbNew._searchIndex('canon', ['title']), 
+                         mb._searchIndex('canon', ['title']))
+        mbCopy = MetadataBundle()
+        mbCopy.readSqlite(fpNew)
+        self.assertEqual(sorted(mbCopy.getKeys()), sorted(mb.getKeys()))
+        self.assertEqual(mbCopy.getMetadata('work1').title, 'Canon_a')
+        mbCopy._connection.close()
+        os.remove(fp)
+        os.remove(fpNew)
+
+    def testMetadataBundleFast(self):
+        from music21 import corpus
+        # the compressed file is parsed in both cases
+        paths = (corpus.getWorkList('bwv66.6') + 
+            corpus.getWorkList('bach/bwv7.7') + 
+            corpus.getWorkList('luca/gloria') + 
+            corpus.getWorkList('opus18no1', 3, extList=['.xml']))
+        mb = MetadataBundle()
+        mb.addFromPaths(paths)
+        mbFast = MetadataBundle()
+        mbFast.addFromPaths(paths, fast=True)
+        self.assertEqual(sorted(mbFast.getKeys()), sorted(mb.getKeys()))
+        mb.updateAccessPaths(paths)
+        mbFast.updateAccessPaths(paths)
+        for key in mb.getKeys():
+            md = mb.getMetadata(key)
+            mdFast = mbFast.getMetadata(key)
+            for attr in ['title', 'movementName', 'movementNumber', 
+                'composer', 'timeSignatureFirst', 'keySignatureFirst', 
+                'keySignatureFirstSharps', 'noteCount', 'quarterLength', 
+                'pitchLowest', 'pitchHighest', 'ambitus']:
+                self.assertEqual(getattr(mdFast, attr), getattr(md, attr))
+        self.assertEqual(mbFast.searchRange('quarterLength', 435, 435), 
+                         mb.searchRange('quarterLength', 435, 435))
+        self.assertEqual(len(mbFast.searchRange('quarterLength', 435, 435)),
+                         1)
+
 
 #-------------------------------------------------------------------------------
 _DOC_ORDER = [Text, Date, 
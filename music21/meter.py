@@ -46,6 +46,23 @@ _meterSequenceAccentArchetypes = {}
 # level dictionary
 _meterSequenceDivisionOptions = {}
 
+# store position lookups (beat index and span, beat depth, accent weight)
+# in tables shared by all TimeSignatures with equal beat and accent
+# MeterSequences; the key is the structure of both MeterSequences
+_meterSequencePositionTables = {}
+# count changes to any MeterTerminal or MeterSequence used to key a 
+# position table; a TimeSignature re-validates its table when this changes
+_meterSequenceChangeState = {'count': 0}
+
+# store the display, beam, beat, and accent MeterSequences created for 
+# a TimeSignature, keyed by meter string and partition request; these
+# prototypes are shared by new TimeSignatures and are never altered
+_meterSequencePrototypes = {}
+# names of the TimeSignature attributes that store the prototypes above, 
+# in the order of each stored tuple
+_meterSequencePrototypeNames = ['_displaySequence', '_beamSequence', 
+                                '_beatSequence', '_accentSequence']
+
 def slashToFraction(value):
     '''
     >>> from music21 import *
@@ -290,6 +307,8 @@ class MeterTerminal(object):
 
     '''
     def __init__(self, slashNotation=None, weight=1):
+        # set to True when used to key a position table
+        self._watched = False
         self._numerator = 0 
         self._denominator = 1
         self._overriddenDuration = None
@@ -475,6 +494,8 @@ class MeterTerminal(object):
 #         if not common.isNum(value):
 #             raise MeterException('weight values must be numbers')
         self._weight = value
+        if self._watched:
+            self._structureChanged()
     
     weight = property(_getWeight, _setWeight)
 
@@ -519,11 +540,33 @@ class MeterTerminal(object):
     denominator = property(_getDenominator, _setDenominator)
 
 
+    def _structureChanged(self):
+        '''Called when a MeterTerminal or MeterSequence used to key a position table is altered; this invalidates the position tables held by TimeSignatures.
+        '''
+        _meterSequenceChangeState['count'] += 1
+
+    def _getStructureKey(self):
+        '''Return a hashable representation of the ratio and weight of this MeterTerminal, used to key position tables. This MeterTerminal is then watched for changes.
+
+        >>> from music21 import *
+        >>> a = meter.MeterTerminal('3/8', .5)
+        >>> a._getStructureKey()
+        (3, 8, 0.5, None)
+        '''
+        self._watched = True
+        if self._overriddenDuration:
+            qLen = self._overriddenDuration.quarterLength
+        else:
+            qLen = None
+        return (self._numerator, self._denominator, self._weight, qLen)
+
     def _ratioChanged(self):
         '''If ratio has been changed, call this to update duration 
         '''
         # NOTE: this is a performance critical method and should only be
         # called when necessary
+        if self._watched:
+            self._structureChanged()
         if self.numerator == None or self.denominator == None:
             self._duration = None
         else:
@@ -561,6 +604,8 @@ class MeterTerminal(object):
 
     def _setDuration(self, value):
         self._overriddenDuration = value
+        if self._watched:
+            self._structureChanged()
 
     duration = property(_getDuration, _setDuration)
 
@@ -727,6 +772,8 @@ class MeterSequence(MeterTerminal):
 
         # clear cache
         self._levelListCache = {}
+        if self._watched:
+            self._structureChanged()
 
     #---------------------------------------------------------------------------
     # load common meter templates into this sequence
@@ -900,6 +947,8 @@ class MeterSequence(MeterTerminal):
         self._partition = [] 
         # clear cache
         self._levelListCache = {}
+        if self._watched:
+            self._structureChanged()
 
     def _addTerminal(self, value):
         '''Add a an object to the partition list. This does not update numerator and denominator.
@@ -923,6 +972,27 @@ class MeterSequence(MeterTerminal):
         self._partition.append(mt)
         # clear cache
         self._levelListCache = {}
+        if self._watched:
+            self._structureChanged()
+
+    def _getStructureKey(self):
+        '''Return a hashable representation of the partitions, ratios, and weights of this MeterSequence and all its components, used to key position tables. This MeterSequence and its components are then watched for changes.
+
+        >>> from music21 import *
+        >>> a = meter.MeterSequence('3/4', 3)
+        >>> a._getStructureKey() == meter.MeterSequence('3/4', 3)._getStructureKey()
+        True
+        >>> a[0] = a[0].subdivide(2)
+        >>> a._getStructureKey() == meter.MeterSequence('3/4', 3)._getStructureKey()
+        False
+        '''
+        self._watched = True
+        if self._overriddenDuration:
+            qLen = self._overriddenDuration.quarterLength
+        else:
+            qLen = None
+        return (tuple([mt._getStructureKey() for mt in self._partition]),
+                self._numerator, self._denominator, qLen)
 
 
     def _getOptions(self):
@@ -1982,6 +2052,11 @@ class TimeSignature(music21.Music21Object):
         self.summedNumerator = False
 
         self._overriddenBarDuration = None
+        # a shared table of position lookups; see _getPositionTable()
+        self._positionTableCache = None
+        # the key of the shared MeterSequence prototypes this object was 
+        # loaded from, if any; see _isSharedSequence()
+        self._prototypeKey = None
 
         # creates MeterSequence data representations
         # creates .displaySequence, .beamSequence, .beatSequence, .accentSequence
@@ -1997,6 +2072,31 @@ class TimeSignature(music21.Music21Object):
     def __repr__(self):
         return "<music21.meter.TimeSignature %s>" % self.__str__()
 
+    def __deepcopy__(self, memo=None):
+        '''Helper method to copy.py's deepcopy function. Call it from there.
+
+        Shared MeterSequence prototypes and the position table are referenced, not copied; the copy will get its own position table when first needed.
+        '''
+        if memo is None:
+            memo = {}
+        for name in _meterSequencePrototypeNames:
+            if self._isSharedSequence(name):
+                proto = getattr(self, name)
+                memo[id(proto)] = proto
+        if self._positionTableCache is not None:
+            table = self._positionTableCache[3]
+            memo[id(table)] = table
+        new = music21.Music21Object.__deepcopy__(self, memo)
+        new._positionTableCache = None
+        return new
+
+    def __getstate__(self):
+        '''The position table is not pickled; it may not be valid when unpickled.
+        '''
+        state = self.__dict__.copy()
+        state['_positionTableCache'] = None
+        return state
+
 
     def ratioEqual(self, other):
         '''A basic form of comparison; does not determine if any internatl structures are equal; only outermost ratio. 
@@ -2176,7 +2276,35 @@ class TimeSignature(music21.Music21Object):
 
     def load(self, value, partitionRequest=None):
         '''Loading a meter destroys all internal representations
+
+        The MeterSequences created for a meter string and partition request are stored as prototypes and shared by all TimeSignatures later loaded with the same values. A TimeSignature gets its own copy of a MeterSequence when that MeterSequence is first accessed, and thus can alter it without altering other TimeSignatures.
+
+        >>> from music21 import *
+        >>> a = meter.TimeSignature('5/8')
+        >>> b = meter.TimeSignature('5/8')
+        >>> a._beatSequence is b._beatSequence
+        True
+        >>> b.beatSequence.partition([2, 3])
+        >>> b.beatSequence
+        <MeterSequence {2/8+3/8}>
+        >>> a._beatSequence is b._beatSequence
+        False
+        >>> a.getBeat(1.5), b.getBeat(1.5)
+        (4, 2)
         '''
+        protoKey = None
+        if common.isStr(value):
+            if partitionRequest is None or common.isNum(partitionRequest):
+                protoKey = (value, partitionRequest)
+            elif common.isListLike(partitionRequest):
+                protoKey = (value, tuple(partitionRequest))
+        if protoKey in _meterSequencePrototypes:
+            (self._displaySequence, self._beamSequence, self._beatSequence,
+             self._accentSequence) = _meterSequencePrototypes[protoKey]
+            self.summedNumerator = self._displaySequence.summedNumerator
+            self._prototypeKey = protoKey
+            return
+
         # create parallel MeterSequence objects to provide all data
         # these all refer to the same .numerator/.denominator 
         # relationship
@@ -2204,6 +2332,11 @@ class TimeSignature(music21.Music21Object):
                 environLocal.printDebug(['cannot set default accents for:', self])
                 pass
 
+        if protoKey is not None:
+            _meterSequencePrototypes[protoKey] = (self._displaySequence, 
+                self._beamSequence, self._beatSequence, self._accentSequence)
+            self._prototypeKey = protoKey
+
     def loadRatio(self, numerator, denominator, partitionRequest=None):
         '''Convenience method
         '''
@@ -2214,6 +2347,87 @@ class TimeSignature(music21.Music21Object):
     #---------------------------------------------------------------------------
     # properties
 
+    def _isSharedSequence(self, name):
+        '''Return True if the MeterSequence stored at the attribute `name` is a shared prototype. Ownership is found by identity, so copies of this object, which may share MeterSequences, each find it independently.
+        '''
+        if self._prototypeKey is None:
+            return False
+        proto = _meterSequencePrototypes.get(self._prototypeKey)
+        if proto is None:
+            return False
+        return (getattr(self, name) is 
+                proto[_meterSequencePrototypeNames.index(name)])
+
+    def _getOwnSequence(self, name):
+        '''Return the MeterSequence stored at the attribute `name`, first replacing a shared prototype with a copy.
+        '''
+        if self._isSharedSequence(name):
+            setattr(self, name, copy.deepcopy(getattr(self, name)))
+        return getattr(self, name)
+
+    def _setOwnSequence(self, name, value):
+        setattr(self, name, value)
+
+    def _getDisplaySequence(self):
+        return self._getOwnSequence('_displaySequence')
+
+    def _setDisplaySequence(self, value):
+        self._setOwnSequence('_displaySequence', value)
+
+    displaySequence = property(_getDisplaySequence, _setDisplaySequence, 
+        doc = '''The MeterSequence used for drawing the TimeSignature symbol.
+
+        >>> from music21 import *
+        >>> ts = meter.TimeSignature('3/8+2/8')
+        >>> ts.displaySequence
+        <MeterSequence {3/8+2/8}>
+        ''')
+
+    def _getBeamSequence(self):
+        return self._getOwnSequence('_beamSequence')
+
+    def _setBeamSequence(self, value):
+        self._setOwnSequence('_beamSequence', value)
+
+    beamSequence = property(_getBeamSequence, _setBeamSequence, 
+        doc = '''The MeterSequence used for beaming.
+
+        >>> from music21 import *
+        >>> ts = meter.TimeSignature('6/8')
+        >>> ts.beamSequence
+        <MeterSequence {3/8+3/8}>
+        ''')
+
+    def _getBeatSequence(self):
+        return self._getOwnSequence('_beatSequence')
+
+    def _setBeatSequence(self, value):
+        self._setOwnSequence('_beatSequence', value)
+
+    beatSequence = property(_getBeatSequence, _setBeatSequence, 
+        doc = '''The MeterSequence used for getting beats and beat divisions.
+
+        >>> from music21 import *
+        >>> ts = meter.TimeSignature('6/8')
+        >>> ts.beatSequence
+        <MeterSequence {{1/8+1/8+1/8}+{1/8+1/8+1/8}}>
+        ''')
+
+    def _getAccentSequence(self):
+        return self._getOwnSequence('_accentSequence')
+
+    def _setAccentSequence(self, value):
+        self._setOwnSequence('_accentSequence', value)
+
+    accentSequence = property(_getAccentSequence, _setAccentSequence, 
+        doc = '''The MeterSequence used for accent weights.
+
+        >>> from music21 import *
+        >>> ts = meter.TimeSignature('2/4')
+        >>> [mt.weight for mt in ts.accentSequence]
+        [1.0, 0.125, 0.25, 0.125, 0.5, 0.125, 0.25, 0.125]
+        ''')
+
 
 #     def _setStringNotation(self, value):
 #         self.load(value)
@@ -2237,7 +2451,7 @@ class TimeSignature(music21.Music21Object):
 
     # temp for backward compat
     def _getTotalLength(self):
-        return self.beamSequence.duration.quarterLength
+        return self._beamSequence.duration.quarterLength
  
     totalLength = property(_getTotalLength, 
         doc = '''Total length of the TimeSignature, in Quarter Lengths.
@@ -2249,7 +2463,7 @@ class TimeSignature(music21.Music21Object):
         ''')
 
     def _getNumerator(self):
-        return self.beamSequence.numerator
+        return self._beamSequence.numerator
 
     numerator = property(_getNumerator, 
         doc = '''Return the numerator of the TimeSignature as a number.
@@ -2261,7 +2475,7 @@ class TimeSignature(music21.Music21Object):
         ''')
 
     def _getDenominator(self):
-        return self.beamSequence.denominator
+        return self._beamSequence.denominator
 
     denominator = property(_getDenominator,
         doc = '''Return the denominator of the TimeSignature as a number
@@ -2338,7 +2552,7 @@ class TimeSignature(music21.Music21Object):
     def _getBeatCount(self):
         # the default is for the beat to be defined by the first, not zero, 
         # level partition. 
-        return len(self.beatSequence)
+        return len(self._beatSequence)
 
     beatCount = property(_getBeatCount,
         doc = '''Return the count of beat units, or the number of beats in this TimeSignature
@@ -2351,7 +2565,7 @@ class TimeSignature(music21.Music21Object):
 
     def _getBeatCountName(self):
         # this will use the top-level partitions as the cuunt
-        return self.beatSequence.partitionStr 
+        return self._beatSequence.partitionStr 
 
     beatCountName = property(_getBeatCountName,
         doc = '''Return the beat count name, or the name given for the number of beat units. For example, 2/4 is duple; 9/4 is triple.
@@ -2401,20 +2615,20 @@ class TimeSignature(music21.Music21Object):
     def _getBeatDivisionCount(self):
         # first, find if there is more than one beat and if all beats are uniformly partitioned
         post = []
-        if len(self.beatSequence) == 1:
+        if len(self._beatSequence) == 1:
             raise TimeSignatureException('cannot determine beat background for an unpartitioned beat')
 
         # need to see if first-level subdivisions are partitioned
-        if not isinstance(self.beatSequence[0], MeterSequence):
+        if not isinstance(self._beatSequence[0], MeterSequence):
             raise TimeSignatureException('cannot determine beat backgrond when each beat is not partitioned')
 
         # getting length here gives number of subdivisions
-        for ms in self.beatSequence._partition:
+        for ms in self._beatSequence._partition:
             post.append(len(ms))
 
         # convert this to a set; if length is 1, then all beats are uniform
         if len(set(post)) == 1:
-            return len(self.beatSequence[0]) # all are the same
+            return len(self._beatSequence[0]) # all are the same
         else:
             raise TimeSignatureException('non uniform beat background: %s' % post)
 
@@ -2652,7 +2866,7 @@ class TimeSignature(music21.Music21Object):
 
                 # get an archetype of the MeterSequence for this level
                 # level is depth, starting at zero
-                archetype = self.beamSequence.getLevel(depth)
+                archetype = self._beamSequence.getLevel(depth)
                 # span is the quarter note duration points for each partition 
                 # at this level
                 archetypeSpan = archetype.positionToSpan(start)
@@ -2787,6 +3001,54 @@ class TimeSignature(music21.Music21Object):
         self.summedNumerator = self.displaySequence.summedNumerator
 
 
+    def _getPositionTable(self):
+        '''Return a dictionary of position lookups for this TimeSignature. The table is shared by all TimeSignatures with equal beat and accent MeterSequences, and is replaced if either is altered or reassigned.
+
+        >>> from music21 import *
+        >>> a = meter.TimeSignature('3/4')
+        >>> b = meter.TimeSignature('3/4')
+        >>> a._getPositionTable() is b._getPositionTable()
+        True
+        >>> a.beatSequence.partition(['3/8', '3/8'])
+        >>> a._getPositionTable() is b._getPositionTable()
+        False
+        '''
+        count = _meterSequenceChangeState['count']
+        cache = self._positionTableCache
+        if (cache is not None and cache[0] == count and 
+            cache[1] is self._beatSequence and 
+            cache[2] is self._accentSequence):
+            return cache[3]
+
+        key = (self._beatSequence._getStructureKey(), 
+               self._accentSequence._getStructureKey())
+        try:
+            table = _meterSequencePositionTables[key]
+        except KeyError:
+            table = {}
+            _meterSequencePositionTables[key] = table
+        self._positionTableCache = (count, self._beatSequence, 
+                                    self._accentSequence, table)
+        return table
+
+    def _getBeatPosition(self, qLenPos):
+        '''Given a quarter length position, return the index of the active beat and the start and end of its span.
+
+        >>> from music21 import *
+        >>> a = meter.TimeSignature('6/8')
+        >>> a._getBeatPosition(2)
+        (1, 1.5, 3.0)
+        '''
+        table = self._getPositionTable()
+        key = ('beat', qLenPos)
+        try:
+            return table[key]
+        except KeyError:
+            post = ((self._beatSequence.positionToIndex(qLenPos),) + 
+                    self._beatSequence.positionToSpan(qLenPos))
+            table[key] = post
+            return post
+
     def getAccent(self, qLenPos):
         '''Return True or False if the qLenPos is at the start of an accent
         division.
@@ -2804,10 +3066,10 @@ class TimeSignature(music21.Music21Object):
         True
         '''
         pos = 0
-        for i in range(len(self.accentSequence)):
+        for i in range(len(self._accentSequence)):
             if common.almostEquals(pos, qLenPos):
                 return True
-            pos += self.accentSequence[i].duration.quarterLength
+            pos += self._accentSequence[i].duration.quarterLength
         return False
 
 
@@ -2850,19 +3112,28 @@ class TimeSignature(music21.Music21Object):
         [1.0, 0.5, 0.5]
         '''
 
+        table = self._getPositionTable()
+        key = ('accent', qLenPos, level, forcePositionMatch)
+        try:
+            return table[key]
+        except KeyError:
+            pass
         # might store this weight every time it is set, rather than
         # getting it here
-        minWeight = min([mt.weight for mt in self.accentSequence._partition]) * .5
+        minWeight = min([mt.weight for mt in self._accentSequence._partition]) * .5
 
-        msLevel = self.accentSequence.getLevel(level)
+        msLevel = self._accentSequence.getLevel(level)
 
         if forcePositionMatch:
             # only return values for qLen positions that are at the start
             # of a span; for those that are not, we need to return a minWeight
             localSpan = msLevel.positionToSpan(qLenPos)
             if not common.almostEquals(qLenPos, localSpan[0]):
+                table[key] = minWeight
                 return minWeight
-        return msLevel[msLevel.positionToIndex(qLenPos)].weight
+        post = msLevel[msLevel.positionToIndex(qLenPos)].weight
+        table[key] = post
+        return post
 
     def getBeat(self, qLenPos):
         '''Given a quarterLength position, get the beat, where beats count from 1
@@ -2877,7 +3148,7 @@ class TimeSignature(music21.Music21Object):
         >>> a.getBeat(2.5)
         2
         '''
-        return self.beatSequence.positionToIndex(qLenPos) + 1
+        return self._getBeatPosition(qLenPos)[0] + 1
 
     def getBeatOffsets(self):
         '''Return offset positions in a list for the start of each beat, assuming this object is found at offset zero.
@@ -2892,12 +3163,12 @@ class TimeSignature(music21.Music21Object):
         '''
         post = []
         post.append(0.0)
-        if len(self.beatSequence) == 1:
+        if len(self._beatSequence) == 1:
             return post    
         else:       
             endOffset = self.barDuration.quarterLength
             o = 0.0
-            for ms in self.beatSequence._partition:
+            for ms in self._beatSequence._partition:
                 o += ms.duration.quarterLength
                 if common.almostEquals(o, endOffset) or o >= endOffset:
                     return post # do not add offset for end of bar
@@ -2924,7 +3195,7 @@ class TimeSignature(music21.Music21Object):
         >>> ts3.getBeatDuration(1.5)
         <music21.duration.Duration 1.0>
         '''
-        return self.beatSequence[self.beatSequence.positionToIndex(qLenPos)].duration
+        return self.beatSequence[self._getBeatPosition(qLenPos)[0]].duration
 
 
     def getBeatProgress(self, qLenPos):
@@ -2943,8 +3214,7 @@ class TimeSignature(music21.Music21Object):
         >>> a.getBeatProgress(2.5)
         (2, 1.0)
         '''
-        beatIndex = self.beatSequence.positionToIndex(qLenPos)
-        start, end = self.beatSequence.positionToSpan(qLenPos)
+        beatIndex, start, end = self._getBeatPosition(qLenPos)
         return beatIndex + 1, qLenPos - start
 
 
@@ -2966,8 +3236,7 @@ class TimeSignature(music21.Music21Object):
         >>> ts3.getBeatProportion(2)
         2.5
         '''
-        beatIndex = self.beatSequence.positionToIndex(qLenPos)
-        start, end = self.beatSequence.positionToSpan(qLenPos)
+        beatIndex, start, end = self._getBeatPosition(qLenPos)
         range = end - start
         progress = qLenPos - start # how far in QL
         return beatIndex + 1 + (progress / range)
@@ -2993,8 +3262,8 @@ class TimeSignature(music21.Music21Object):
         >>> ts4 = meter.TimeSignature(['6/8']) # will partition as 2 beat
         '''
 
-        beatIndex = int(self.beatSequence.positionToIndex(qLenPos))
-        start, end = self.beatSequence.positionToSpan(qLenPos)
+        beatIndex, start, end = self._getBeatPosition(qLenPos)
+        beatIndex = int(beatIndex)
         range = end - start
         progress = qLenPos - start # how far in QL
 
@@ -3032,7 +3301,14 @@ class TimeSignature(music21.Music21Object):
         >>> b.getBeatDepth(1)
         2
         '''
-        return self.beatSequence.positionToDepth(qLenPos, align)
+        table = self._getPositionTable()
+        key = ('depth', qLenPos, align)
+        try:
+            return table[key]
+        except KeyError:
+            post = self._beatSequence.positionToDepth(qLenPos, align)
+            table[key] = post
+            return post
 
 
 
@@ -3085,7 +3361,7 @@ class TimeSignature(music21.Music21Object):
         mxTime = musicxml.Time()
         
         # always get a flat version to display any subivisions created
-        fList = [(mt.numerator, mt.denominator) for mt in self.displaySequence.flat._partition]
+        fList = [(mt.numerator, mt.denominator) for mt in self._displaySequence.flat._partition]
         if self.summedNumerator:
             # this will try to reduce any common denominators into 
             # a common group
@@ -3603,6 +3879,81 @@ class Test(unittest.TestCase):
             self.assertEqual([mt.weight for mt in ts1.accentSequence], match)
            
 
+    def testPositionTables(self):
+        import copy
+        ts1 = TimeSignature('4/4')
+        ts2 = TimeSignature('4/4')
+        self.assertEqual(ts1.getBeatProportion(2.5), 3.5)
+        self.assertEqual(ts1._getPositionTable(), ts2._getPositionTable())
+        self.assertEqual(ts2.getAccentWeight(2), 0.5)
+
+        # weights set on a level of the accent sequence are found
+        ts2.setAccentWeight([.8, .2])
+        self.assertAlmostEqual(ts2.getAccentWeight(2), .8)
+        self.assertEqual(ts1.getAccentWeight(2), 0.5)
+
+        # nested subdivision of the beat sequence alters depth
+        ts3 = TimeSignature('3/4', 1)
+        self.assertEqual(ts3.getBeatDepth(1), 1)
+        ts3.beatSequence[0] = ts3.beatSequence[0].subdivide(3)
+        ts3.beatSequence[0][1] = ts3.beatSequence[0][1].subdivide(2)
+        self.assertEqual(ts3.getBeatDepth(1), 2)
+        self.assertEqual(ts3.getBeatDepth(1.5), 1)
+
+        # reassigning a MeterSequence replaces the table
+        ts1.beatSequence = MeterSequence('4/4', [3, 1])
+        self.assertEqual(ts1.getBeat(2.5), 1)
+        self.assertEqual(ts2.getBeat(2.5), 3)
+
+        # copies do not share changes
+        ts4 = copy.deepcopy(ts2)
+        ts4.beatSequence.partition(2)
+        self.assertEqual(ts4.getBeat(2.5), 2)
+        self.assertEqual(ts2.getBeat(2.5), 3)
+
+
+    def testSharedPrototypes(self):
+        import copy
+        ts1 = TimeSignature('3/4')
+        ts1.setAccentWeight([.8, .2, .2])
+        ts1.beamSequence.partition(1)
+        ts1.displaySequence.partition(3)
+
+        # a new TimeSignature does not get altered MeterSequences
+        ts2 = TimeSignature('3/4')
+        self.assertEqual(ts2.getAccentWeight(1), 0.5)
+        for name in _meterSequencePrototypeNames:
+            self.assertEqual(ts2._isSharedSequence(name), True)
+        self.assertEqual(str(ts2.beamSequence), 
+            '{{1/8+1/8}+{1/8+1/8}+{1/8+1/8}}')
+        self.assertEqual(str(ts2.displaySequence), '{3/4}')
+
+        # copies share prototypes until altered
+        ts3 = copy.deepcopy(ts2)
+        self.assertEqual(ts3._beatSequence is ts2._beatSequence, True)
+        self.assertEqual(ts3._beamSequence is ts2._beamSequence, False)
+        ts3.beatSequence.partition(1)
+        self.assertEqual(ts3.beatCount, 1)
+        self.assertEqual(ts2.beatCount, 3)
+        self.assertEqual(TimeSignature('3/4').beatCount, 3)
+
+        # partition requests are part of the key
+        ts4 = TimeSignature('3/4', 1)
+        self.assertEqual(ts4.beatCount, 1)
+        self.assertEqual(TimeSignature('3/4', [2, 1]).beatCount, 2)
+
+        # shallow copies find shared prototypes independently
+        ts5 = TimeSignature('5/4')
+        ts6 = copy.copy(ts5)
+        ts6.beatSequence
+        self.assertEqual(ts5._isSharedSequence('_beatSequence'), True)
+        self.assertEqual(ts6._isSharedSequence('_beatSequence'), False)
+        ts5.beatSequence.partition(1)
+        self.assertEqual(ts5.beatCount, 1)
+        self.assertEqual(ts6.beatCount, 5)
+        self.assertEqual(TimeSignature('5/4').beatCount, 5)
+
+
 
 #     def testJSONStorage(self):
 #         ts = TimeSignature('3/4')
@@ -531,9 +531,9 @@ class MuseDataPart(object):
         #environLocal.printDebug(['creating MuseDataPart'])
         self.src = src # a list of character lines for this part
 
-        # a list of start, end indicies for each defined measure
-        self._measureBoundaries = []
-        self._divisionsPerQuarter = None # store
+        # a list of start, end indicies for each defined measure; set to 
+        # None until called the first time, then return stored value
+        self._measureBoundaries = None
 
         # set to None until called the first time, then return stored value
         self._divisionsPerQuarterNote = None
@@ -1158,9 +1158,14 @@ class MuseDataPart(object):
         [(1, 3), (4, 6), (7, 9)]
         >>> mdp._getMeasureBoundaryIndices(['$', 'B', 'C', 'm', 'D', 'E'])
         [(1, 2), (3, 5)]
+
+        If `src` is not given, the boundaries of this part's source are returned, and are stored for later calls.
         '''
         if src == None:
-            src = self.src
+            if self._measureBoundaries != None:
+                return self._measureBoundaries
+            self._measureBoundaries = self._getMeasureBoundaryIndices(self.src)
+            return self._measureBoundaries
         boundaries = []
         mIndices = []
         firstPostAttributesIndex = None
@@ -1215,17 +1220,18 @@ class MuseDataPart(object):
 
 
     def update(self):
-        '''After setting the source string, this method must be called to configure the _measureNumberToLine method and set additional attributes. 
+        '''After setting the source string, this method must be called to clear stored values. Divisions and measure boundaries are found again when next needed. 
         '''
-        self._divisionsPerQuarter = self.getDivisionsPerQuarterNote()
-        self._measureBoundaries = self._getMeasureBoundaryIndices()
+        self._divisionsPerQuarterNote = None
+        self._measureBoundaries = None
 
 
     def __iter__(self):
         '''
         Iterating over this part returns MuseDataMeasure objects
         '''
-        return MuseDataMeasureIterator(self.src, self._measureBoundaries, self)
+        return MuseDataMeasureIterator(self.src, 
+            self._getMeasureBoundaryIndices(), self)
 
 
     def getMeasures(self):
@@ -1233,6 +1239,24 @@ class MuseDataPart(object):
         '''
         return [mdm for mdm in self]
 
+    def getStreamPart(self):
+        '''Return this part translated to a :class:`~music21.stream.Part`. Each call returns a new Part; the measure boundaries found in the source are stored and reused. 
+
+        >>> from music21 import *
+        >>> from music21.musedata import testFiles
+        >>> mdw = musedata.MuseDataWork()
+        >>> mdw.addString(testFiles.bach_cantata5_mvmt3)
+        >>> mdp = mdw.getPart(0)
+        >>> p = mdp.getStreamPart()
+        >>> p.id
+        'Viola Solo'
+        >>> mdp.getStreamPart() is p
+        False
+        '''
+        from music21.musedata import translate
+        s = translate.musedataPartToStreamPart(self)
+        return s.getElementsByClass('Part')[0]
+
 
 
 
@@ -1246,10 +1270,12 @@ class MuseDataFile(object):
     When read, one or more MuseDataPart objects are created and stored on self.parts. 
     '''
     def __init__(self):
-        self.parts = [] # a lost of MuseDataPart objects
+        self._parts = [] # a lost of MuseDataPart objects
 
         self.filename = None
         self.file = None   
+        # if True, the file is opened and read when parts are first accessed
+        self._deferred = False
 
     def __repr__(self):
         return '<music21.musedata.MuseDataFile>'
@@ -1260,6 +1286,24 @@ class MuseDataFile(object):
         self.file = open(fp, 'r') 
         self.filename = fp
 
+    def openDeferred(self, fp):
+        '''Store a file path to be opened, read, and closed when the parts of this file are first accessed.
+        '''
+        self.filename = fp
+        self._deferred = True
+
+    def _getParts(self):
+        if self._deferred:
+            self._deferred = False
+            self.open(self.filename)
+            self.read()
+            self.close()
+        return self._parts
+
+    parts = property(_getParts, 
+        doc = '''Get a list of MuseDataPart objects defined in this file. 
+        ''')
+
     def read(self): 
         # call readstr with source string from file
         return self.readstr(self.file.read()) 
@@ -1300,7 +1344,7 @@ class MuseDataFile(object):
                 mdp = MuseDataPart(lines)
                 # update sets measure boundaries, divisions
                 mdp.update()
-                self.parts.append(mdp)
+                self._parts.append(mdp)
                 lines = [] # clear storage
             # mostly redundant; seems to follow /END; do not include
             elif line.startswith('/eof'):
@@ -1319,8 +1363,10 @@ class MuseDataWork(object):
         self.files = [] # a list of one or more MuseDataFile objects
 
 
-    def addFile(self, fp):
+    def addFile(self, fp, lazy=False):
         '''Open and read this file path as 
+
+        If `lazy` is True, files are not opened and read until their parts are needed.
         '''
         if not common.isListLike(fp):
             fpList = [fp]
@@ -1329,9 +1375,12 @@ class MuseDataWork(object):
 
         for fp in fpList:
             mdf = MuseDataFile()
-            mdf.open(fp)
-            mdf.read()  # process string and break into parts
-            mdf.close()
+            if lazy:
+                mdf.openDeferred(fp)
+            else:
+                mdf.open(fp)
+                mdf.read()  # process string and break into parts
+                mdf.close()
             self.files.append(mdf)
 
     def addString(self, str):
@@ -1364,6 +1413,17 @@ class MuseDataWork(object):
             for mdp in mdf.parts:
                 post.append(mdp)
         return post
+
+    def getPart(self, index):
+        '''Get a single MuseDataPart by index. Files added with `lazy` set to True are only read as far as necessary to find the part.
+        '''
+        count = 0
+        for mdf in self.files:
+            parts = mdf.parts
+            if index < count + len(parts):
+                return parts[index - count]
+            count += len(parts)
+        raise MuseDataException('no part with index %s' % index)
                 
             
 
@@ -1440,6 +1500,15 @@ class MuseDataDirectory(object):
 
         return self.paths
 
+    def getWork(self, lazy=True):
+        '''Return a :class:`~music21.musedata.base.MuseDataWork` with all paths in this directory added. If `lazy` is True, each file is read only when its parts are first needed.
+
+        This requires paths that can be opened directly, not names from within a zip file. 
+        '''
+        mdw = MuseDataWork()
+        mdw.addFile(self.getPaths(), lazy=lazy)
+        return mdw
+
 
 
 #-------------------------------------------------------------------------------
@@ -1591,6 +1660,27 @@ class Test(unittest.TestCase):
         mdd = MuseDataDirectory(af.getNames())
 
 
+    def testMuseDataDirectoryLazy(self):
+        fpDir = os.path.join(common.getSourceFilePath(), 'musedata', 
+            'testPrimitive', 'test01')
+        mdw = MuseDataDirectory(fpDir).getWork()
+        self.assertEqual(len(mdw.files), 5)
+        # no files have been read
+        self.assertEqual([mdf._deferred for mdf in mdw.files], [True] * 5)
+
+        mdp = mdw.getPart(1)
+        self.assertEqual([mdf._deferred for mdf in mdw.files], 
+            [False, False, True, True, True])
+        self.assertEqual(mdp._measureBoundaries, None)
+        mdmList = mdp.getMeasures()
+        self.assertEqual(mdp._measureBoundaries != None, True)
+        self.assertEqual(len(mdmList), len(mdp._measureBoundaries))
+
+        # all parts are found when requested
+        self.assertEqual(len(mdw.getParts()), 5)
+        self.assertEqual([mdf._deferred for mdf in mdw.files], [False] * 5)
+
+
     def testStage1Basic(self):
 
         from music21.musedata import testFiles
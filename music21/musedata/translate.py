@@ -308,13 +308,23 @@ def musedataPartToStreamPart(museDataPart, inputM21=None):
     return s
 
 
-def museDataWorkToStreamScore(museDataWork, inputM21=None):
+def _musedataPartToStreamPartPickled(museDataPart):
+    '''Translate a MuseDataPart to a Part prepared for pickling; used as the worker function when translating parts in a process pool.
+    '''
+    p = museDataPart.getStreamPart()
+    p.setupPickleScaffold()
+    return p
+
+
+def museDataWorkToStreamScore(museDataWork, inputM21=None, parallel=False):
     '''Given an museDataWork object, build into a multi-part :class:`~music21.stream.Score` with metadata.
 
     This assumes that this MuseDataHandler defines a single work (with 1 or fewer reference numbers). 
     
     if the optional parameter inputM21 is given a music21 Stream subclass, it will use that object
     as the outermost object.  However, inner parts will always be made :class:`~music21.stream.Part` objects.
+
+    Parts are translated with :meth:`~music21.musedata.base.MuseDataPart.getStreamPart`, so each Score has its own Parts. If `parallel` is True, parts are translated in a pool of processes, one per CPU.
     '''
     from music21 import stream
     from music21 import metadata
@@ -339,8 +349,21 @@ def museDataWorkToStreamScore(museDataWork, inputM21=None):
     #md.localeOfComposition = mdpObjs[0].getWorkNumber()
     md.number = mdpObjs[0].getWorkNumber()
 
-    for mdPart in mdpObjs:
-        musedataPartToStreamPart(mdPart, s)
+    if parallel and len(mdpObjs) > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool()
+        try:
+            parts = pool.map(_musedataPartToStreamPartPickled, mdpObjs)
+        finally:
+            pool.close()
+            pool.join()
+        for p in parts:
+            p.teardownPickleScaffold()
+    else:
+        parts = [mdPart.getStreamPart() for mdPart in mdpObjs]
+
+    for p in parts:
+        s.insert(0, p)
     return s
 
 
@@ -389,6 +412,28 @@ class Test(unittest.TestCase):
 
 
 
+    def testParallel(self):
+        from music21 import musedata
+        from music21.musedata import testFiles
+
+        mdw = musedata.MuseDataWork()
+        mdw.addString(testFiles.bach_cantata5_mvmt3)
+        s = museDataWorkToStreamScore(mdw, parallel=True)
+        self.assertEqual(len(s.parts), 3)
+        self.assertEqual(s.parts[1].id, 'TENORE')
+        self.assertEqual(len(s.parts[0].flat.notes), 1062)
+        self.assertEqual(len(s.parts[2].flat.notes), 626)
+        # each Score has its own Parts
+        s2 = museDataWorkToStreamScore(mdw)
+        self.assertEqual(s2.parts[1] is s.parts[1], False)
+        n1 = s.parts[1].flat.getElementsByClass('Note')[0]
+        n2 = s2.parts[1].flat.getElementsByClass('Note')[0]
+        self.assertEqual(n2 is n1, False)
+        n2.pitch.name = 'C#'
+        self.assertNotEqual(n1.pitch.name, 'C#')
+        self.assertEqual(len(s2.parts[0].flat.notes), 1062)
+
+
     def testGetMetaData(self):
 
         from music21 import musedata
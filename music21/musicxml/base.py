@@ -3059,6 +3059,304 @@ class Document(object):
 
 
 
+#-------------------------------------------------------------------------------
+# fast metadata extraction
+
+def _scanText(elem, path):
+    '''Return the stripped text of the sub-element found at `path`, or None.
+    '''
+    value = elem.findtext(path)
+    if value is None:
+        return None
+    return value.strip()
+
+
+def _scanMeasure(mxMeasure, state):
+    '''Scan the components of a single ElementTree measure element. Offsets are resolved as in :func:`~music21.musicxml.translate.mxToMeasure`. 
+
+    Returns a tuple of the measure's highest time, a TimeSignature string (or None) and a KeySignature fifths and mode pair (or None). 
+    '''
+    components = []
+    attributesFound = False
+    divisions = None
+    timeStr = None
+    keyPair = None
+    divisionsMeasure = state['divisions']
+    for mxObj in mxMeasure:
+        tag = mxObj.tag
+        if tag == 'note':
+            components.append(('note', mxObj, state['divisions']))
+        elif tag == 'backup' or tag == 'forward':
+            components.append((tag, float(_scanText(mxObj, 'duration')), 
+                               None))
+        elif tag == 'direction':
+            mark = (mxObj.find('direction-type/dynamics') is not None or 
+                    mxObj.find('direction-type/wedge') is not None)
+            components.append(('direction', mark, None))
+        elif tag == 'attributes':
+            attributesFound = True
+            value = _scanText(mxObj, 'divisions')
+            if value is not None:
+                state['divisions'] = value
+                if divisions is None:
+                    divisions = value
+            mxTime = mxObj.find('time')
+            if mxTime is not None and timeStr is None:
+                n = [x.text.strip() for x in mxTime.findall('beats')]
+                d = [x.text.strip() for x in mxTime.findall('beat-type')]
+                timeStr = '+'.join(['%s/%s' % (n[i], d[i]) for i in 
+                                    range(len(n))])
+            mxKey = mxObj.find('key')
+            if mxKey is not None and keyPair is None:
+                keyPair = (int(_scanText(mxKey, 'fifths')), 
+                           _scanText(mxKey, 'mode'))
+        else: # print, barline, and other components
+            components.append((tag, None, None))
+    if attributesFound and divisions is not None:
+        divisionsMeasure = divisions
+
+    offset = 0.0
+    highest = 0.0
+    chordPending = False
+    for i in range(len(components)):
+        tag, mxObj, noteDivisions = components[i]
+        if tag == 'backup':
+            offset -= mxObj / float(divisionsMeasure)
+            continue
+        elif tag == 'forward':
+            offset += mxObj / float(divisionsMeasure)
+            continue
+        elif tag == 'direction':
+            if mxObj:
+                highest = max(highest, offset)
+            continue
+        elif tag != 'note':
+            continue
+        if i < len(components) - 1 and components[i+1][0] == 'note':
+            nextIsChord = components[i+1][1].find('chord') is not None
+        else:
+            nextIsChord = False
+        if mxObj.get('print-object') == 'no':
+            continue
+        if mxObj.find('grace') is not None:
+            continue
+        isRest = mxObj.find('rest') is not None
+        if not isRest:
+            mxPitch = mxObj.find('pitch')
+            if mxPitch is not None:
+                ps = _scanPitchSpace(mxPitch, 
+                                     _scanText(mxObj, 'accidental'), state)
+                if state['psLowest'] is None or ps < state['psLowest']:
+                    state['psLowest'] = ps
+                if state['psHighest'] is None or ps > state['psHighest']:
+                    state['psHighest'] = ps
+        # the first note of a chord is only known by looking ahead
+        if not isRest and (nextIsChord or mxObj.find('chord') is not None):
+            if not chordPending: # first note of the chord sets the duration
+                chordPending = True
+                chordQuarterLength = _scanQuarterLength(mxObj, 
+                                     noteDivisions, state)
+            if not nextIsChord: # chord is complete
+                chordPending = False
+                state['noteCount'] += 1
+                highest = max(highest, offset + chordQuarterLength)
+                offset += chordQuarterLength
+            continue
+        quarterLength = _scanQuarterLength(mxObj, noteDivisions, state)
+        state['noteCount'] += 1
+        highest = max(highest, offset + quarterLength)
+        offset += quarterLength
+    return highest, timeStr, keyPair
+
+
+def _scanQuarterLength(mxNote, divisions, state):
+    '''Return the quarter length of an ElementTree note element, using the notated type when available.
+    '''
+    from music21 import duration
+    mxDuration = _scanText(mxNote, 'duration')
+    if mxDuration is None:
+        return 1.0 # the default of a new Duration
+    mxType = _scanText(mxNote, 'type')
+    if mxType is None: # only the raw duration is available
+        return float(mxDuration) / float(divisions)
+    mxTimeModification = mxNote.find('time-modification')
+    if mxTimeModification is not None:
+        tupletKey = (_scanText(mxTimeModification, 'actual-notes'), 
+                     _scanText(mxTimeModification, 'normal-notes'))
+    else:
+        tupletKey = None
+    cacheKey = (mxType, len(mxNote.findall('dot')), tupletKey)
+    try:
+        return state['quarterLengths'][cacheKey]
+    except KeyError:
+        pass
+    durUnit = duration.DurationUnit()
+    durUnit.type = duration.musicXMLTypeToType(mxType)
+    durUnit.dots = cacheKey[1]
+    if tupletKey is not None:
+        tup = duration.Tuplet()
+        tup.numberNotesActual = int(tupletKey[0])
+        tup.numberNotesNormal = int(tupletKey[1])
+        durUnit.appendTuplet(tup)
+    quarterLength = duration.Duration(components=[durUnit]).quarterLength
+    state['quarterLengths'][cacheKey] = quarterLength
+    return quarterLength
+
+
+def _scanPitchSpace(mxPitch, mxAccidental, state):
+    '''Return the pitch space value of an ElementTree pitch element. As in :class:`~music21.pitch.Pitch`, a notated accidental takes precedence over the alter value.
+    '''
+    from music21 import pitch
+    alter = 0.0
+    if mxAccidental is not None:
+        try:
+            alter = state['alters'][mxAccidental]
+        except KeyError:
+            mxAccidentalObj = Accidental()
+            mxAccidentalObj.set('charData', mxAccidental)
+            accidentalObj = pitch.Accidental()
+            accidentalObj.mx = mxAccidentalObj
+            alter = accidentalObj.alter
+            state['alters'][mxAccidental] = alter
+    else:
+        mxAlter = _scanText(mxPitch, 'alter')
+        if mxAlter is not None:
+            alter = float(mxAlter)
+    step = _scanText(mxPitch, 'step')
+    octave = int(_scanText(mxPitch, 'octave'))
+    return (octave + 1) * 12 + pitch.STEPREF[step.upper()] + alter
+
+
+def scanMetadata(fp):
+    '''Extract the information needed by :class:`~music21.metadata.RichMetadata` from a MusicXML file without building MusicXML objects or a Stream. 
+
+    The file is read in a single streaming pass; each measure is discarded after it is examined. The returned dictionary provides work and movement titles and numbers, contributors as (role, name) pairs, the first TimeSignature and KeySignature, the number of notes, chords, and rests, the lowest and highest pitch space values, and the total duration in quarter lengths. 
+
+    >>> from music21 import *
+    >>> fp = corpus.getWork('bach/bwv66.6')
+    >>> post = musicxml.scanMetadata(fp)
+    >>> post['timeSignatureFirst']
+    '4/4'
+    >>> post['keySignatureFirstSharps']
+    3
+    >>> post['noteCount']
+    165
+    >>> post['quarterLength']
+    36.0
+    >>> post['pitchLowest'], post['pitchHighest']
+    (42.0, 76.0)
+    '''
+    from music21 import key
+    from music21 import meter
+    try:
+        from xml.etree import cElementTree as ElementTree
+    except ImportError:
+        from xml.etree import ElementTree
+
+    post = {'movementNumber': None, 'movementName': None, 'title': None, 
+            'number': None, 'contributors': [], 'timeSignatureFirst': None, 
+            'keySignatureFirst': None, 'keySignatureFirstSharps': None}
+    state = {'divisions': None, 'noteCount': 0, 'psLowest': None, 
+             'psHighest': None, 'quarterLengths': {}, 'alters': {}}
+    partIds = [] # as defined in the part-list
+    partData = {} # part id: highest time, TimeSignatures, KeySignatures
+    barDurations = {} # TimeSignature string: bar duration
+    defaultTimeStr = '%s/%s' % (defaults.meterNumerator, 
+                                defaults.meterDenominatorBeatType)
+
+    f = open(fp)
+    try:
+        for event, elem in ElementTree.iterparse(f, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == 'part':
+                    partId = elem.get('id')
+                    highestTime = 0.0
+                    oMeasure = 0.0
+                    lastTimeStr = None
+                    tsFound = []
+                    ksFound = []
+                continue
+            if tag == 'measure':
+                highest, timeStr, keyPair = _scanMeasure(elem, state)
+                if timeStr is not None:
+                    tsFound.append((oMeasure, timeStr))
+                    lastTimeStr = timeStr
+                elif lastTimeStr is None:
+                    lastTimeStr = defaultTimeStr
+                if keyPair is not None:
+                    ksFound.append((oMeasure, keyPair))
+                if lastTimeStr not in barDurations:
+                    ts = meter.TimeSignature(lastTimeStr)
+                    barDurations[lastTimeStr] = (str(ts), 
+                        ts.barDuration.quarterLength)
+                barDuration = barDurations[lastTimeStr][1]
+                highestTime = max(highestTime, oMeasure + highest)
+                if highest >= barDuration or oMeasure == 0.0:
+                    oMeasure += highest
+                else:
+                    oMeasure += barDuration
+                elem.clear()
+            elif tag == 'part':
+                partData[partId] = (highestTime, tsFound, ksFound)
+                elem.clear()
+            elif tag == 'score-part':
+                partIds.append(elem.get('id'))
+            elif tag == 'movement-number':
+                post['movementNumber'] = elem.text
+            elif tag == 'movement-title':
+                post['movementName'] = elem.text
+            elif tag == 'work-title':
+                post['title'] = elem.text
+            elif tag == 'work-number':
+                post['number'] = elem.text
+            elif tag == 'creator':
+                post['contributors'].append((elem.get('type'), elem.text))
+    except SyntaxError, e: # raised by ElementTree for malformed documents
+        raise DocumentException('cannot scan %s: %s' % (fp, e))
+    finally:
+        f.close()
+
+    # as in the converter, the file name is used if no titles are defined
+    if post['movementName'] is None and post['title'] is None:
+        post['movementName'] = os.path.split(fp)[1]
+
+    # parts are translated in sorted id order; the first TimeSignature and
+    # KeySignature are those at the lowest offset in that order
+    partIds.sort()
+    quarterLength = 0.0
+    tsFirst = None
+    ksFirst = None
+    for partId in partIds:
+        if partId not in partData:
+            continue
+        highestTime, tsFound, ksFound = partData[partId]
+        quarterLength = max(quarterLength, highestTime)
+        if len(tsFound) > 0 and (tsFirst is None or 
+            tsFound[0][0] < tsFirst[0]):
+            tsFirst = tsFound[0]
+        if len(ksFound) > 0 and (ksFirst is None or 
+            ksFound[0][0] < ksFirst[0]):
+            ksFirst = ksFound[0]
+    if tsFirst is not None:
+        post['timeSignatureFirst'] = barDurations.get(tsFirst[1], 
+            (str(meter.TimeSignature(tsFirst[1])), None))[0]
+    if ksFirst is not None:
+        ks = key.KeySignature(ksFirst[1][0])
+        if ksFirst[1][1] is not None:
+            ks.mode = ksFirst[1][1]
+        post['keySignatureFirst'] = str(ks)
+        post['keySignatureFirstSharps'] = ks.sharps
+
+    post['noteCount'] = state['noteCount']
+    post['quarterLength'] = quarterLength
+    post['pitchLowest'] = state['psLowest']
+    post['pitchHighest'] = state['psHighest']
+    return post
+
+
+
+
 
 
 #-------------------------------------------------------------------------------
@@ -109,10 +109,11 @@ class TwelveToneRow(ToneRow):
         '''        
         # note: do not want to return a TwelveToneRow() type, as this will
         # add again the same pitches to the elements list twice. 
-        p = self.getElementsByClass(pitch.Pitch, returnStreamSubClass=False)
-
-        i = [(12-x.pitchClass) % 12 for x in p]
-        matrix = [[(x.pitchClass+t) % 12 for x in p] for t in i]
+        pcRow = [p.pitchClass for p in 
+            self.getElementsByClass(pitch.Pitch, returnStreamSubClass=False)]
+        # each row of the matrix is a transposition of the prime row, 
+        # beginning with each pitch class of the inverted row
+        matrix = [[(pc - first) % 12 for pc in pcRow] for first in pcRow]
 
         matrixObj = TwelveToneMatrix()
         i = 0
@@ -121,12 +122,14 @@ class TwelveToneRow(ToneRow):
             rowObject = copy.copy(self)
             rowObject.elements = []
             rowObject.id = 'row-' + str(i)
-            for p in row: # iterate over pitch class values
+            rowPitches = []
+            for pc in row: # iterate over pitch class values
                 pObj = pitch.Pitch()
-                pObj.pitchClass = p
-                rowObject.append(pObj)
+                pObj.pitchClass = pc
+                rowPitches.append(pObj)
+            # appending all pitches at once is much faster than one by one
+            rowObject.append(rowPitches)
             matrixObj.insert(0, rowObject)
-        
 
         environLocal.printDebug(['calling matrix start: len row:', self.row, 'len self', len(self)])
 
@@ -47,6 +47,10 @@ from music21 import environment
 _MOD = "stream.py"
 environLocal = environment.Environment(_MOD)
 
+# keys of the parallel lists returned by Stream._getOwnPitchArrays()
+_PITCH_ARRAY_KEYS = ['offset', 'quarterLength', 'pitch', 'ps', 'pitchClass', 
+                     'tie', 'isChord']
+
 #-------------------------------------------------------------------------------
 
 class StreamException(Exception):
@@ -84,6 +88,53 @@ class StreamIterator():
         return post
 
 
+#-------------------------------------------------------------------------------
+def _verticalitySweep(streamList, offsetList=None):
+    '''Walk the sorted onsets and releases of the notes, chords, and rests of each Stream in `streamList` once, merging their timelines. Offsets are those of each Stream, shifted by the matching value of `offsetList`, if given.
+
+    For each unique onset, in order, yield a tuple of the onset, the next onset (or None for the last), and a list of (Stream index, element, onset of the element) triples for all elements sounding at that onset. An element sounds from its onset until its release; it begins at this onset if its onset is the yielded onset, otherwise it is a continuation. Within each Stream, elements that begin are given before continuations.
+    '''
+    if offsetList is None:
+        offsetList = [0.0] * len(streamList)
+    # one sorted list of (onset, release, element) per Stream
+    timelines = []
+    onsets = set()
+    for streamObj, offset in zip(streamList, offsetList):
+        events = []
+        for e in streamObj.notes:
+            o = e.getOffsetBySite(streamObj) + offset
+            events.append((o, o + e.quarterLength, e))
+            onsets.add(o)
+        # notes are sorted unless autoSort is off; a stable sort 
+        # is cheap if so
+        events.sort(key=lambda x: x[0])
+        timelines.append(events)
+    onsets = sorted(onsets)
+
+    # index of the next event, and the list of active events, per Stream
+    positions = [0] * len(timelines)
+    active = [[] for events in timelines]
+    for i, o in enumerate(onsets):
+        if i < len(onsets) - 1:
+            oNext = onsets[i+1]
+        else:
+            oNext = None
+        sounding = []
+        for streamIndex, events in enumerate(timelines):
+            # releases: zero-length elements sound only at their onset
+            continuing = [x for x in active[streamIndex] if x[1] > o]
+            starting = []
+            j = positions[streamIndex]
+            while j < len(events) and events[j][0] == o:
+                starting.append(events[j])
+                j += 1
+            positions[streamIndex] = j
+            active[streamIndex] = continuing + starting
+            for oStart, oEnd, e in starting + continuing:
+                sounding.append((streamIndex, e, oStart))
+        yield o, oNext, sounding
+
+
 #-------------------------------------------------------------------------------
 
 class Stream(music21.Music21Object):
@@ -5287,12 +5338,124 @@ class Stream(music21.Music21Object):
         for e in self.getElementsByClass(classFilterList):
             if hasattr(e, attrName):
                 key = getattr(e, attrName)
-                if key not in post.keys():
+                if key not in post:
                     post[key] = 0
                 post[key] += 1
         return post
 
 
+    def _getOwnPitchArrays(self):
+        '''Return parallel lists describing the notes, chords, and rests stored directly in this Stream (not in contained Streams).
+        '''
+        post = {}
+        for key in _PITCH_ARRAY_KEYS:
+            post[key] = []
+        for e in self.elements:
+            if not isinstance(e, (note.GeneralNote, chord.Chord)):
+                continue
+            if 'Chord' in e.classes:
+                pitches = e.pitches
+                isChord = True
+            else:
+                if 'Note' in e.classes:
+                    pitches = [e.pitch]
+                else: # rests and other unpitched objects
+                    pitches = [None]
+                isChord = False
+            offset = e.getOffsetBySite(self)
+            quarterLength = e.quarterLength
+            eTie = getattr(e, 'tie', None)
+            if eTie is not None:
+                tieType = eTie.type
+            else:
+                tieType = None
+            for p in pitches:
+                post['offset'].append(offset)
+                post['quarterLength'].append(quarterLength)
+                post['pitch'].append(p)
+                if p is None:
+                    post['ps'].append(None)
+                    post['pitchClass'].append(None)
+                else:
+                    post['ps'].append(p.ps)
+                    post['pitchClass'].append(p.pitchClass)
+                post['tie'].append(tieType)
+                post['isChord'].append(isChord)
+        return post
+
+    def _appendPitchArrays(self, post, offset, part, partLike=False):
+        '''Append the pitch arrays of this Stream, and all contained Streams, to the lists in `post`, shifting offsets by `offset`. If `partLike` is True, contained Streams are numbered as parts.
+        '''
+        own = self._getOwnPitchArrays()
+        if offset == 0:
+            post['offset'] += own['offset']
+        else:
+            post['offset'] += [o + offset for o in own['offset']]
+        for key in _PITCH_ARRAY_KEYS:
+            if key != 'offset':
+                post[key] += own[key]
+        post['part'] += [part] * len(own['offset'])
+
+        for i, e in enumerate(self.getElementsByClass('Stream')):
+            if partLike:
+                part = i
+            e._appendPitchArrays(post, offset + e.getOffsetBySite(self), part)
+
+    def getPitchArrays(self):
+        '''Return a dictionary of parallel lists describing all notes, chords, and rests found in this Stream and in all contained Streams, with one entry for each pitch of each chord. Entries are sorted by offset. For each entry, the lists store:
+
+        'offset': the offset in a flat representation of this Stream.
+
+        'quarterLength': the duration in quarter lengths.
+
+        'pitch': the :class:`~music21.pitch.Pitch` object, or None for rests.
+
+        'ps': the pitch space value, or None for rests.
+
+        'pitchClass': the pitch class, or None for rests.
+
+        'tie': the type of the :class:`~music21.tie.Tie` of the note or chord, or None.
+
+        'isChord': True if the pitch is from a chord.
+
+        'part': the index of the part-like Stream (see :meth:`~music21.stream.Stream.hasPartLikeStreams`) containing the entry, or 0.
+
+        The lists are built each time this method is called, so they always reflect the current elements; analyses that need this information call it once and work from the lists rather than walking all elements and getting attributes of Pitch objects.
+
+        >>> from music21 import *
+        >>> s = converter.parse('c4 d8 r8', '3/4')
+        >>> s.append(chord.Chord(['e4', 'g4']))
+        >>> a = s.getPitchArrays()
+        >>> a['offset']
+        [0.0, 1.0, 1.5, 2.0, 2.0]
+        >>> a['ps']
+        [60, 62, None, 64, 67]
+        >>> a['isChord']
+        [False, False, False, True, True]
+
+        >>> s = corpus.parseWork('bach/bwv66.6')
+        >>> a = s.getPitchArrays()
+        >>> len(a['pitch']) == len(s.flat.notes)
+        True
+        >>> a['part'][-1]
+        3
+        '''
+        post = {'part': []}
+        for key in _PITCH_ARRAY_KEYS:
+            post[key] = []
+        self._appendPitchArrays(post, 0.0, 0, self.hasPartLikeStreams())
+
+        # sort by offset, retaining the order of entries at the same offset
+        offsets = post['offset']
+        order = range(len(offsets))
+        order.sort(key=offsets.__getitem__)
+        if order != range(len(offsets)):
+            for key in post.keys():
+                values = post[key]
+                post[key] = [values[i] for i in order]
+        return post
+
+
     #---------------------------------------------------------------------------
     # interval routines
     
@@ -5874,17 +6037,24 @@ class Stream(music21.Music21Object):
         
         '''
     
-        srcNotes = self.notes
-        for thisNote in srcNotes:
-            if thisNote.isRest is True:
+        # both Streams are walked once, rather than searching cmpStream 
+        # for each note
+        for o, oNext, sounding in _verticalitySweep([self, cmpStream]):
+            simultNote = None
+            simultOffset = None
+            for streamIndex, e, oStart in sounding:
+                # use the earliest attacked note sounding in cmpStream
+                if streamIndex == 1 and e.isRest is False:
+                    if simultNote is None or oStart < simultOffset:
+                        simultNote = e
+                        simultOffset = oStart
+            if simultNote is None:
                 continue
-            simultEls = cmpStream.getElementsByOffset(thisNote.offset, mustBeginInSpan = False, mustFinishInSpan = False)
-            if len(simultEls) > 0:
-                for simultNote in simultEls.notes:
-                    if simultNote.isRest is False:
-                        interval1 = interval.notesToInterval(thisNote, simultNote)
-                        thisNote.editorial.harmonicInterval = interval1
-                        break
+            for streamIndex, thisNote, oStart in sounding:
+                if (streamIndex == 0 and oStart == o and 
+                    thisNote.isRest is False):
+                    interval1 = interval.notesToInterval(thisNote, simultNote)
+                    thisNote.editorial.harmonicInterval = interval1
 
     def playingWhenAttacked(self, el, elStream = None):
         '''Given an element (from another Stream) returns the single element in this Stream that is sounding while the given element starts. 
@@ -6879,47 +7049,161 @@ class Score(Stream):
         return returnObj
 
 
-    def chordify(self, addTies=True, displayTiedAccidentals=False):
-        '''Split all Durations in all parts, if multi-part, by all unique offsets. All simultaneous durations are then gathered into single chords. 
+    def _getPartsAndOffsets(self):
+        '''Return a list of the Parts of this Score and a list of their offsets. If this Score has no Parts, it is treated as a single Part.
         '''
-        returnObj = deepcopy(self)
+        parts = self.getElementsByClass('Part')
+        if len(parts) == 0:
+            return [self], [0.0]
+        return list(parts), [p.getOffsetBySite(self) for p in parts]
 
-        mStream = returnObj.parts[0].getElementsByClass('Measure')
-        mCount = len(mStream)
-        if mCount == 0:
-            mCount = 1 # treat as a single measure
-        for i in range(mCount): # may be 1
-            # first, collect all unique offsets for each measure
-            uniqueOffsets = []
-            for p in returnObj.getElementsByClass('Part'):
-                if p.hasMeasures():
-                    m = p.getElementsByClass('Measure')[i]
-                else:
-                    m = p # treat the entire part as one measure
-                for e in m.notes:
-                    # offset values here will be relative to the Measure
-                    o = e.getOffsetBySite(m)
-                    if o not in uniqueOffsets:
-                        uniqueOffsets.append(o)
-            #environLocal.printDebug(['chordify: uniqueOffsets for all parts, m', uniqueOffsets, i])
+    def verticalities(self):
+        '''Return a generator of the verticalities of this Score. For each unique offset at which a note, chord, or rest begins in any Part, in order, a tuple is yielded of the offset, a tuple of the element sounding in each Part (or None if nothing sounds), and a tuple of booleans that are True where that element begins at the offset and False where it continues from an earlier offset.
 
-            uniqueOffsets = sorted(uniqueOffsets)
+        The onsets and releases of all Parts are merged and walked once, so this is much faster than searching each Part for what is sounding at each offset. If more than one element sounds in a Part, as with Voices, an element that begins at the offset is given before one that continues.
 
-            for p in returnObj.getElementsByClass('Part'):
-                # get one measure at a time
-                if p.hasMeasures():
-                    m = p.getElementsByClass('Measure')[i]
-                else:
-                    m = p # treat the entire part as one measure
-                # working with a copy, in place can be true
-                m.sliceAtOffsets(offsetList=uniqueOffsets, addTies=addTies, 
-                    inPlace=True,
-                    displayTiedAccidentals=displayTiedAccidentals )
+        >>> from music21 import *
+        >>> n = note.Note('c4')
+        >>> n.quarterLength = 2
+        >>> p1 = stream.Part()
+        >>> p1.append([n, note.Note('d4')])
+        >>> p2 = stream.Part()
+        >>> p2.append([note.Note('e3'), note.Note('g3'), note.Rest()])
+        >>> s = stream.Score()
+        >>> s.insert(0, p1)
+        >>> s.insert(0, p2)
+        >>> for o, elements, starts in s.verticalities():
+        ...     print o, elements, starts
+        0.0 (<music21.note.Note C>, <music21.note.Note E>) (True, True)
+        1.0 (<music21.note.Note C>, <music21.note.Note G>) (False, True)
+        2.0 (<music21.note.Note D>, <music21.note.Rest rest>) (True, True)
+
+        Consecutive verticalities provide the notes of a :class:`~music21.voiceLeading.VoiceLeadingQuartet`.
+
+        >>> v = list(s.verticalities())
+        >>> vlq = voiceLeading.VoiceLeadingQuartet(v[0][1][0], v[1][1][0], 
+        ...     v[0][1][1], v[1][1][1])
+        >>> vlq.obliqueMotion()
+        True
+        '''
+        parts, offsets = self._getPartsAndOffsets()
+        partCount = len(parts)
+        for o, oNext, sounding in _verticalitySweep(
+            [p.flat for p in parts], offsets):
+            elements = [None] * partCount
+            starts = [False] * partCount
+            for partIndex, e, oStart in sounding:
+                # the first element found in each part is used
+                if elements[partIndex] is None:
+                    elements[partIndex] = e
+                    starts[partIndex] = (oStart == o)
+            yield o, tuple(elements), tuple(starts)
 
-        # do in place as already a copy has been made
-        post = returnObj.flat.makeChords(includePostWindow=True, 
-            removeRedundantPitches=True,
-            gatherArticulations=True, gatherNotations=True, inPlace=True)
+
+    def chordify(self, addTies=True, displayTiedAccidentals=False, 
+        returnPitchSets=False):
+        '''Gather all notes sounding at each unique offset, in all parts, into single chords. 
+
+        Each Chord begins at an offset where at least one part has a note or rest, and lasts until the next such offset (or until all of its constituents have ended). Where only rests are found, a Rest is created. Chords are given the pitches of all notes that start or continue at that offset; pitches are copied, and the source Score is not altered. Non-note elements of the parts, such as Clefs and TimeSignatures, are copied to the returned Stream.
+
+        Parts are walked once in a single sweep of their sorted onsets and releases; notes are not sliced and the Score is not copied. The `addTies` option is retained for compatibility: as Chords are created directly, there are no sliced notes to tie.
+
+        >>> from music21 import *
+        >>> n = note.Note('c4')
+        >>> n.quarterLength = 2
+        >>> p1 = stream.Part()
+        >>> p1.append([n, note.Note('d4')])
+        >>> p2 = stream.Part()
+        >>> p2.append([note.Note('e3'), note.Note('g3'), note.Rest()])
+        >>> s = stream.Score()
+        >>> s.insert(0, p1)
+        >>> s.insert(0, p2)
+        >>> post = s.chordify()
+        >>> [(c.offset, c.quarterLength, c.pitches) for c in post.notes]
+        [(0.0, 1.0, [C4, E3]), (1.0, 1.0, [C4, G3]), (2.0, 1.0, [D4])]
+
+        If `returnPitchSets` is True, no Chords are created; instead, a list of (offset, quarterLength, pitch set) triples is returned, where the pitch set is a sorted tuple of the unique pitch space values sounding. 
+
+        >>> s.chordify(returnPitchSets=True)
+        [(0.0, 1.0, (52, 60)), (1.0, 1.0, (55, 60)), (2.0, 1.0, (62,))]
+        '''
+        parts, offsets = self._getPartsAndOffsets()
+        partsFlat = [p.flat for p in parts]
+        if returnPitchSets:
+            post = []
+        else:
+            post = Score()
+            post.mergeAttributes(self)
+            # copy all elements other than notes, such as Clefs, of this 
+            # Score and of all Parts
+            if parts[0] is not self:
+                for e in self:
+                    if not isinstance(e, Stream):
+                        post.insert(e.getOffsetBySite(self), copy.deepcopy(e))
+            for p, pFlat, partOffset in zip(parts, partsFlat, offsets):
+                for e in pFlat:
+                    if not isinstance(e, (note.GeneralNote, chord.Chord)):
+                        post.insert(e.getOffsetBySite(pFlat) + partOffset, 
+                                    copy.deepcopy(e))
+
+        for o, oNext, sounding in _verticalitySweep(partsFlat, 
+            offsets):
+            # the duration is that of the longest element, up to next onset
+            qlMax = 0.0
+            for partIndex, e, oStart in sounding:
+                oEnd = oStart + e.quarterLength
+                if oNext is not None and oEnd > oNext:
+                    oEnd = oNext
+                qlMax = max(qlMax, oEnd - o)
+
+            if returnPitchSets:
+                psSet = []
+                for partIndex, e, oStart in sounding:
+                    if isinstance(e, chord.Chord):
+                        psSet += [p.ps for p in e.pitches]
+                    elif hasattr(e, 'pitch'):
+                        psSet.append(e.pitch.ps)
+                post.append((o, qlMax, tuple(sorted(set(psSet)))))
+                continue
+
+            pitches = []
+            articulations = []
+            notations = []
+            for partIndex, e, oStart in sounding:
+                if isinstance(e, chord.Chord):
+                    srcPitches = e.pitches
+                elif hasattr(e, 'pitch'):
+                    srcPitches = [e.pitch]
+                else: # a rest
+                    continue
+                for p in srcPitches:
+                    pNew = copy.deepcopy(p)
+                    # hide accidentals of continued pitches, as for tied notes
+                    if oStart != o and pNew.accidental != None:
+                        if not displayTiedAccidentals:
+                            if pNew.accidental.displayType != 'even-tied':
+                                pNew.accidental.displayStatus = False
+                        else:
+                            pNew.accidental.displayType = 'even-tied'
+                            pNew.accidental.displayStatus = True
+                    pitches.append(pNew)
+                # only gather from elements that begin here
+                if oStart == o:
+                    articulations += copy.deepcopy(e.articulations)
+                    notations += copy.deepcopy(e.notations)
+
+            if len(pitches) > 0:
+                c = chord.Chord()
+                c.duration.quarterLength = qlMax
+                c.pitches = pitches
+                c.articulations += articulations
+                c.notations += notations
+                c.removeRedundantPitches(inPlace=True)
+                post.insert(o, c)
+            else: # only rests
+                r = note.Rest()
+                r.quarterLength = qlMax
+                post.insert(o, r)
         return post
 
     def implode(self, voiceAllocation=2, permitOneVoicePerPart=False):
@@ -11594,6 +11878,62 @@ class Test(unittest.TestCase):
             'Chord')[1].pitches), '[D2, D#3]')
 
 
+    def testChordifySweep(self):
+        from music21 import stream, note, corpus
+
+        p1 = stream.Part()
+        n = note.Note('f#4')
+        n.quarterLength = 3
+        p1.append(n)
+        p2 = stream.Part()
+        p2.append([note.Note('d3'), note.Note('e3'), note.Note('f3')])
+        s = stream.Score()
+        s.insert(0, p1)
+        s.insert(0, p2)
+
+        post = s.chordify()
+        chords = post.getElementsByClass('Chord')
+        self.assertEqual([str(c.pitches) for c in chords], 
+            ['[F#4, D3]', '[F#4, E3]', '[F#4, F3]'])
+        # the source is not sliced, and pitches are copies
+        self.assertEqual(len(p1.notes), 1)
+        self.assertEqual(n.quarterLength, 3)
+        self.assertEqual(chords[0].pitches[0] is n.pitch, False)
+        # accidentals of continued pitches are not displayed
+        self.assertEqual(chords[0].pitches[0].accidental.displayStatus, None)
+        self.assertEqual(chords[1].pitches[0].accidental.displayStatus, False)
+        post = s.chordify(displayTiedAccidentals=True)
+        self.assertEqual(post.getElementsByClass('Chord')[1].pitches[
+            0].accidental.displayStatus, True)
+
+        # pitch sets match the pitches of the Chords
+        s = corpus.parseWork('bach/bwv66.6')
+        post = s.chordify()
+        pitchSets = s.chordify(returnPitchSets=True)
+        self.assertEqual(len(pitchSets), len(post.notes))
+        for (o, ql, psSet), c in zip(pitchSets, post.notes):
+            self.assertEqual(o, c.getOffsetBySite(post))
+            self.assertEqual(ql, c.quarterLength)
+            self.assertEqual(psSet, tuple(sorted(set(
+                [p.ps for p in c.pitches]))))
+
+    def testVerticalities(self):
+        from music21 import corpus
+
+        s = corpus.parseWork('bach/bwv66.6')
+        partsFlat = [p.flat for p in s.parts]
+        verticalities = list(s.verticalities())
+        self.assertEqual(len(verticalities), len(s.chordify().notes))
+        for o, elements, starts in verticalities:
+            self.assertEqual(len(elements), 4)
+            for pFlat, e, isStart in zip(partsFlat, elements, starts):
+                # the same element is found by searching each part
+                found = pFlat.getElementsByOffset(o, 
+                    mustBeginInSpan=False).notes
+                self.assertEqual(e is found[0], True)
+                self.assertEqual(isStart, e.getOffsetBySite(pFlat) == o)
+
+
 
     def testOpusSearch(self):
         from music21 import corpus
@@ -12021,6 +12361,57 @@ class Test(unittest.TestCase):
         self.assertEqual(str([n for n in s.voices[0].notes]), '[<music21.note.Note C>, <music21.note.Note C>, <music21.note.Note C>, <music21.note.Note C>]')        
 
 
+    def testPitchArrays(self):
+        from music21 import stream, pitch
+        def getNote(obj, quarterLength):
+            obj.quarterLength = quarterLength
+            return obj
+
+        p = stream.Part()
+        m1 = stream.Measure()
+        m1.append(getNote(note.Note('c4'), 2))
+        m1.append(getNote(note.Rest(), 2))
+        m2 = stream.Measure()
+        v1 = stream.Voice()
+        v1.append(getNote(note.Note('e4'), 4))
+        v2 = stream.Voice()
+        v2.append(getNote(note.Note('g4'), 2))
+        v2.append(getNote(chord.Chord(['a4', 'b4']), 2))
+        m2.insert(0, v1)
+        m2.insert(0, v2)
+        p.append(m1)
+        p.append(m2)
+
+        post = p.getPitchArrays()
+        # entries are sorted by offset across voices
+        self.assertEqual(post['offset'], [0.0, 2.0, 4.0, 4.0, 6.0, 6.0])
+        self.assertEqual(post['pitchClass'], [0, None, 4, 7, 9, 11])
+        self.assertEqual(post['quarterLength'], [2.0, 2.0, 4.0, 2.0, 2.0, 2.0])
+        self.assertEqual(post['part'], [0] * 6)
+        self.assertEqual(len(post['ps']), len(p.flat.notes) + 1)
+
+        # arrays reflect added elements and changes to elements in place
+        m1.append(getNote(note.Note('d5'), 1))
+        post = p.getPitchArrays()
+        self.assertEqual(post['pitchClass'], [0, None, 2, 4, 7, 9, 11])
+        m1.notes[0].pitch = pitch.Pitch('c#2')
+        m1.notes[0].quarterLength = 1.5
+        m1.notes[0].tie = tie.Tie('start')
+        post = p.getPitchArrays()
+        self.assertEqual(post['ps'][0], 37)
+        self.assertEqual(post['quarterLength'][0], 1.5)
+        self.assertEqual(post['tie'][0], 'start')
+
+        # parts are numbered
+        s = stream.Score()
+        s.insert(0, p)
+        s.insert(0, copy.deepcopy(p))
+        post = s.getPitchArrays()
+        self.assertEqual(post['part'][:4], [0, 1, 0, 1])
+        self.assertEqual(post['part'].count(1), 7)
+
+
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = [Stream, Measure]
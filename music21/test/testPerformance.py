@@ -181,6 +181,84 @@ class Test(unittest.TestCase):
 
 
 
+    def runTokenizeABC(self):
+        '''Compare ABC tokenizers in tokens per second on all essenFolksong files
+        '''
+        import codecs, os
+        from music21 import abc
+
+        srcList = []
+        for fp in corpus.getPaths('abc'):
+            if os.path.basename(os.path.dirname(fp)) == 'essenFolksong':
+                f = codecs.open(fp, encoding='utf-8')
+                srcList.append(f.read())
+                f.close()
+
+        for name in ['_tokenizeLinear', 'tokenize']:
+            count = 0
+            t = common.Timer()
+            t.start()
+            for src in srcList:
+                ah = abc.ABCHandler()
+                getattr(ah, name)(src)
+                count += len(ah._tokens)
+            t.stop()
+            environLocal.printDebug(['ABCHandler.%s:' % name, count, 
+                'tokens in', t(), 'seconds;', count / t(), 
+                'tokens per second'])
+
+
+    def runDecodeKernTokens(self):
+        '''Compare uncached and cached decoding of kern tokens from the mazurka6 test file and beethoven/opus18no1 kern files
+        '''
+        from music21.humdrum import spineParser, testFiles
+
+        srcList = [testFiles.mazurka6]
+        for fp in corpus.getPaths('krn'):
+            if 'opus18no1' in fp:
+                f = open(fp)
+                srcList.append(f.read())
+                f.close()
+        tokens = []
+        for src in srcList:
+            for line in src.splitlines():
+                if line.startswith('!'):
+                    continue
+                for event in line.split('\t'):
+                    if event in ['', '.'] or event[0] in '*=!':
+                        continue
+                    for token in event.split():
+                        try: # skip events from non-kern spines
+                            spineParser.hdStringToNoteSpec(token)
+                        except spineParser.HumdrumException:
+                            continue
+                        tokens.append(token)
+
+        for name, decode in [
+            ('uncached', lambda x: spineParser.noteFromSpec(
+                         spineParser.hdStringToNoteSpec(x))),
+            ('cached', spineParser.hdStringToNote)]:
+            t = common.Timer()
+            t.start()
+            for token in tokens:
+                post = decode(token)
+            t.stop()
+            environLocal.printDebug(['kern tokens decoded %s:' % name, 
+                len(tokens), 'in', t(), 'seconds'])
+
+
+    def runPlotWindowedKrumhanslSchmuckler(self):
+        '''Windowed key analysis of bwv66.6 for PlotWindowedKrumhanslSchmuckler, with a window step of 1 and with the default power of two steps
+        '''
+        from music21 import graph
+
+        s = corpus.parseWork('bach/bwv66.6')
+        for windowStep in [1, 'pow2']:
+            # creating the plot extracts the data; graphs are not drawn
+            p = graph.PlotWindowedKrumhanslSchmuckler(s, doneAction=None, 
+                windowStep=windowStep)
+
+
     def runGetElementsByContext(self):
         '''Test getting elements by context from a Stream
         '''
@@ -221,6 +299,21 @@ class Test(unittest.TestCase):
                  '2010.11.11': 3.96121883392, 
                 }),
 
+            (self.runDecodeKernTokens, 
+                {
+                 '2026.10.19': 0.609353065491, 
+                }),
+
+            (self.runTokenizeABC, 
+                {
+                 '2026.10.19': 5.6136059761, 
+                }),
+
+            (self.runPlotWindowedKrumhanslSchmuckler, 
+                {
+                 '2026.10.19': 0.70988202095, 
+                }),
+
 # 
 # 
 #             (self.runParseABC, 